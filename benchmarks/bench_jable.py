@@ -0,0 +1,101 @@
+"""
+    Timings for bulk operations, to compare before and after a change. Not a test; run from the repository root with
+    
+        PYTHONPATH=src python benchmarks/bench_jable.py [name ...]
+    
+    Each benchmark prints the best of a few runs, since the first is often slowed by allocation. Numbers depend on the machine, so compare against a run of the previous version on the same one
+"""
+import sys
+import time
+from typing import Callable
+
+from jable.jyFrame import DataFrame
+
+REPEATS: int = 3
+
+def best_of( run: Callable[ [], Callable[ [], None ] ] ) -> float:
+    """
+        :param run: Sets up fresh data and returns the operation to time
+        :returns: Shortest time of the operation over `REPEATS` runs, in seconds
+    """
+    times: list[ float ] = []
+    for _ in range( REPEATS ):
+        operation: Callable[ [], None ] = run()
+        start: float = time.perf_counter()
+        operation()
+        times.append( time.perf_counter() - start )
+    #
+    return min( times )
+#/def best_of
+
+def bench_remove() -> float:
+    """
+        Removing 600k of 2M rows by index
+    """
+    def run() -> Callable[ [], None ]:
+        n: int = 2_000_000
+        df: DataFrame = DataFrame(
+            fixed = {},
+            shift = {
+                "i": list( range( n ) ),
+                "c": [ i % 5 for i in range( n ) ]
+            },
+            shiftIndex = { "c": list( "abcde" ) }
+        )
+        rows: list[ int ] = list( range( 0, n, 10 ) ) + list( range( 1, n, 10 ) ) + list( range( 2, n, 10 ) )
+        return lambda: df.remove( rows )
+    #/def run
+    return best_of( run )
+#/def bench_remove
+
+def bench_extend() -> float:
+    """
+        Appending 500k rows from a list of dicts
+    """
+    def run() -> Callable[ [], None ]:
+        rows: list[ dict ] = [
+            { "i": i, "x": i/2, "c": "abcde"[ i % 5 ] } for i in range( 500_000 )
+        ]
+        df: DataFrame = DataFrame(
+            fixed = {},
+            shift = { "i": [], "x": [], "c": [] },
+            shiftIndex = { "c": [] }
+        )
+        return lambda: df.extend( rows )
+    #/def run
+    return best_of( run )
+#/def bench_extend
+
+def bench_concat() -> float:
+    """
+        Stacking 1000 frames of 500 rows, each with its own fixed "day"
+    """
+    from jable.jyFrame import concat
+    
+    def run() -> Callable[ [], None ]:
+        frames: list[ DataFrame ] = [
+            DataFrame(
+                fixed = { "day": day },
+                shift = {
+                    "i": list( range( 500 ) ),
+                    "c": [ i % 5 for i in range( 500 ) ]
+                },
+                shiftIndex = { "c": [ "a", "b", "c", "d", "e" ] }
+            ) for day in range( 1000 )
+        ]
+        return lambda: concat( frames )
+    #/def run
+    return best_of( run )
+#/def bench_concat
+
+BENCHMARKS: dict[ str, Callable[ [], float ] ] = {
+    "remove": bench_remove,
+    "extend": bench_extend,
+    "concat": bench_concat
+}
+
+if __name__ == "__main__":
+    for name in sys.argv[ 1: ] or list( BENCHMARKS ):
+        print( "{}: {:.3f}s".format( name, BENCHMARKS[ name ]() ) )
+    #
+#
@@ -22,9 +22,15 @@ Iterating over a DataFrame gives each row as a dictionary. see ``PyJable.jable._
 import polars as pl
 
 import json
+import operator as _operator
+import re
 
-from collections.abc import Sequence
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from itertools import repeat
 from typing import Callable, Generator, Literal, Self
+from weakref import WeakSet
 from sys import path
 
 # Dictionary representation of the data in a DataFrame
@@ -36,6 +42,7 @@ DataFrameDict: type = dict[{
     "_schema": dict[ str, str ],
     "_meta": dict[ str, any ]
 }]
+# Optionally also "_shiftRun": list[ str ], the `_shift` columns written as `[ value, length ]` runs; see ``RunLengthColumn``
 
 # -- Data Types and Schema
 # Does no enforcement or conversion; simply keeps track
@@ -44,12 +51,14 @@ DataFrameDict: type = dict[{
 def _infer_dataType(
     dataType: str | pl.DataType
     ) -> pl.DataType:
-    if issubclass( dataType, pl.DataType ):
-        return dataType
-    #
     if isinstance( dataType, str ):
         return pl.datatypes.convert.dtype_short_repr_to_dtype( dataType )
     #
+    if isinstance( dataType, pl.DataType ) or (
+        isinstance( dataType, type ) and issubclass( dataType, pl.DataType )
+    ):
+        return dataType
+    #
     raise TypeError("dataType={}, expected str|pl.DataType".format( type( dataType ) ))
 #/def _infer_dataType
 
@@ -64,189 +73,1955 @@ def plSchema_from_dict(
 def parse_composite_dtype(
     dtype: pl.DataType
     ) -> str:
-    if dtype.is_nested:
+    if dtype.is_nested():
         return f"{pl.datatypes.convert.DataTypeMappings.DTYPE_TO_FFINAME[dtype.base_type()]}[{parse_composite_dtype(dtype.inner)}]"
     else:
         return pl.datatypes.convert.DataTypeMappings.DTYPE_TO_FFINAME[dtype]
     #/if dtype.is_nested/else
 #/def parse_composite_dtype
 
+def _is_serializable_dtype(
+    dtype: pl.DataType
+    ) -> bool:
+    """
+        If `dtype` can be written by ``parse_composite_dtype()``
+    """
+    try:
+        parse_composite_dtype( dtype )
+    #
+    except ( KeyError, AttributeError ):
+        return False
+    #
+    return True
+#/def _is_serializable_dtype
+
 def schema_to_dict(
     schema: pl.Schema
     ) -> dict[ str, str ]:
     return {
-        key: parse_composite_dtype( val ) for key, va; in schema.items()
+        key: parse_composite_dtype( val ) for key, val in schema.items()
     }
 #/def schema_to_dict
 
-# JyFilter: A way to check if rows match some criterion, either by equality with every value in a dictionary, or evaluating as true with a lambda taking the row dictionary as an input
-JyFilter: type = dict[ str, any ] | Callable[ dict[ str, any ], bool ]
+# Removing more rows than this at once rebuilds each column, rather than deleting one by one
+_COMPACT_THRESHOLD: int = 8
 
-def row_does_matchJyFilter(
-    row: dict[ str, any ],
-    jyFilter: JyFilter
-    ) -> bool:
+# -- Typed Storage
+# `array.array` typecodes for numeric columns, used when a DataFrame has `typed = True`
+_ARRAY_TYPECODES: dict[ pl.DataType, str ] = {
+    pl.Int8: 'b',
+    pl.Int16: 'h',
+    pl.Int32: 'i',
+    pl.Int64: 'q',
+    pl.UInt8: 'B',
+    pl.UInt16: 'H',
+    pl.UInt32: 'I',
+    pl.UInt64: 'Q',
+    pl.Float32: 'f',
+    pl.Float64: 'd'
+}
+
+# Typecode for the integer codes of `shiftIndex` columns
+_SHIFTINDEX_TYPECODE: str = 'I'
+
+def _typecode_forDataType(
+    dataType: pl.DataType | None
+    ) -> str | None:
     """
-        The way to check if a row dictionary matches a jyFilter
-        
-        For dictionaries, check equality on every key
+        :param pl.DataType|None dataType: Type from a schema, as a class or instance
+        :returns: The `array.array` typecode to store it with, or `None` if it has to be a list
+        :rtype: str|None
+    """
+    if dataType is None:
+        return None
+    #
+    try:
+        return _ARRAY_TYPECODES.get( dataType.base_type() )
+    #
+    except AttributeError:
+        return None
+    #/try return _ARRAY_TYPECODES.get( ... )/except AttributeError
+#/def _typecode_forDataType
+
+class _ColumnView( Sequence ):
+    """
+        Read only window onto some rows of another column, so selecting rows doesn't copy them. See ``DataFrame._select_rows_andColumns()``
         
-        For Callables, just run the Callable on the row
+        :param Sequence base: The column viewed, a list, `array.array` or `memoryview`
+        :param range|list[ int ] rows: Rows of `base` in the view, in order
+        :param WeakSet|None views: The live views of `base`, kept by the df that owns it, which we join. That df calls ``.detach()`` on them before it changes `base` in place
     """
-    if isinstance( jyFilter, dict ):
-        return all(
-            row[ key ] == jyFilter[ key ] for key in jyFilter
-        )
+    def __init__(
+        self: Self,
+        base: Sequence,
+        rows: range | list[ int ],
+        views: WeakSet | None = None
+        ):
+        self.base = base
+        self.rows = rows
+        self.views = views
+        if views is not None:
+            views.add( self )
+        #
+    #/def __init__
+    
+    def __len__( self: Self ) -> int:
+        return len( self.rows )
     #
     
-    if isinstance( jyFilter, Callable ):
-        return jyFilter( row )
+    def __getitem__( self: Self, index: int | slice ) -> any:
+        if isinstance( index, slice ):
+            return _ColumnView( self.base, self.rows[ index ], self.views )
+        #
+        return self.base[ self.rows[ index ] ]
+    #/def __getitem__
+    
+    def __iter__( self: Self ) -> Generator[ any, None, None ]:
+        if isinstance( self.rows, range ) and self.rows.step == 1:
+            # Slicing the base is done in C
+            return iter( self.base[ self.rows.start:self.rows.stop ] )
+        #
+        return map( self.base.__getitem__, self.rows )
+    #/def __iter__
+    
+    def __repr__( self: Self ) -> str:
+        return "_ColumnView({})".format( list( self ) )
     #
     
-    raise Exception("Unrecognized jyFilter={}".format(jyFilter))
-#/def row_does_matchJyFilter
+    def __reduce__( self: Self ) -> tuple:
+        # Unpickled, the view isn't one of the live views of the original base
+        return ( _ColumnView, ( self.base, self.rows ) )
+    #
+    
+    def copy( self: Self ) -> list | array:
+        """
+            :returns: The values in the view as a new list, or an `array.array` if the base is typed
+            :rtype: list|array
+        """
+        if isinstance( self.base, array ):
+            return array( self.base.typecode, self )
+        #
+        if isinstance( self.base, memoryview ):
+            return array( self.base.format, self )
+        #
+        return list( self )
+    #/def copy
+    
+    def detach( self: Self ) -> None:
+        """
+            Copies our rows out of `base`, so the view keeps its values when the df owning `base` changes it. Costs the length of the view, not of `base`
+        """
+        self.base = self.copy()
+        self.rows = range( len( self.base ) )
+        self.views = None
+        return
+    #/def detach
+#/class _ColumnView
 
-class DataFrame():
+class RunLengthColumn( Sequence ):
     """
-        Stores column data as a combination of three parts:
+        Read only column held as runs of a repeated value, so a column like a sorted date takes memory by run instead of by row. Chosen by ``consolidate()`` and stored in `._shift` like any other column
         
-        :param dict[ str, any ] fixed: Columns with the same name for value in every row. You can change its value but that will essentially change it for every row; try to only change it in code that knows it's a fixed key, and sets and gets it with the fixed methods (`.keys_fixed()`, `.get_fixed(...)`)
-        :param dict[ str, list ] shift: Where we have a listed literal item as a value, typically a string, float or int, sometimes lists of them, sometimes dictionaries or any other objects
-        :param dict[ str list ] shiftIndex: Sometimes, shift columns will have the same value repeated many times. If its column name is in shift index, then the values in shift are integers, referring to the index in shiftIndex of the same column. I.e., if we have `shift["fur_color"] = [1,0,2]` and `shiftIndex["fur_color"] = ["green","orange","purple","red"]`, then the `"fur_color"`s are really `["orange","green","purple"]`
-        :param pl.Schema schema: Optional types to set for any columns. No enforcement is done by the DataFrame itself, whether inserting or retriving. It is for your own use. These will be serialized as strings using `str` so add the appropriate functions for custom classes to serialize it as you want, and convert into a class upon reading. Includes support for basic python types
-        :param dict[ str, any ] meta: Another arbitrary dictionary to hold domain specific data, in the df as `._meta`. No methods write or use this, so edit and read at will or subclass.
-        :param dict[ str, type ] customTypes: A reference to use for deserializing string types from `schema`. Gets checked before builtin types (NOT CURRENTLY SUPPORTED)
+        The first write to the column turns it into a list; see ``DataFrame._column_forWrite()``
         
-        see ``.__getitem__`` for acessing values
+        :param list values: The value of each run
+        :param list[ int ] ends: The row after the last of each run, increasing
     """
     def __init__(
         self: Self,
-        fixed: dict[ str, any ] = {},
-        shift: dict[ str, list] = {},
-        shiftIndex: dict[ str, list ] = {},
-        schema: pl.Schema = {},
-        meta: dict[ str, any ] = {},
-        customTypes: dict[ str, type ] = {}
+        values: list,
+        ends: list[ int ]
         ):
-        
-        self._fixed = fixed
-        self._shift = shift
-        self._shiftIndex = shiftIndex
-        self._meta = meta
-        self._customTypes = customTypes
-        
-        # Handle key types by using ._customTypes and _TYPES_DICT
-        if customTypes != {}:
-            raise Exception("customTypes UC")
-        #
-        self._schema = schema | customTypes
-        
-        assert all( key in self._shift for key in self._shiftIndex )
-        
-        if self._shift != {}:
-            self._len = 0
-            for key in self._shift:
-                if self._len == 0:
-                    self._len = len( self._shift[ key ] )
-                #
-                else:
-                    assert len( self._shift[key] ) == self._len
-                #/if self._len == 0/else
-            #/for key in self._shift
-        #/if self._shift != {}
-        else:
-            self._len = 0
-        #/if self._shift != {}/elif self._fixed != {}/else
-
-        self.shape = (self._len, len( self._fixed ) + len( self._shift ))
+        self.values = values
+        self.ends = ends
     #/def __init__
     
-    # -- Info
+    def __len__( self: Self ) -> int:
+        return self.ends[-1] if self.ends else 0
+    #
     
-    def _list_fromSlice(
+    def _run_forRow( self: Self, row: int ) -> int:
+        """
+            Index of the run holding `row`
+        """
+        from bisect import bisect_right
+        return bisect_right( self.ends, row )
+    #/def _run_forRow
+    
+    def __getitem__( self: Self, index: int | slice ) -> any:
+        if isinstance( index, slice ):
+            rows: range = range( *index.indices( len( self ) ) )
+            if rows.step != 1:
+                return [ self[ i ] for i in rows ]
+            #
+            if len( rows ) == 0:
+                return RunLengthColumn( [], [] )
+            #
+            first: int = self._run_forRow( rows.start )
+            last: int = self._run_forRow( rows.stop - 1 )
+            return RunLengthColumn(
+                self.values[ first:last + 1 ],
+                [ min( end, rows.stop ) - rows.start for end in self.ends[ first:last + 1 ] ]
+            )
+        #/if isinstance( index, slice )
+        if index < 0:
+            index += len( self )
+        #
+        if not 0 <= index < len( self ):
+            raise IndexError("Bad index={}".format( index ))
+        #
+        return self.values[ self._run_forRow( index ) ]
+    #/def __getitem__
+    
+    def lengths( self: Self ) -> list[ int ]:
+        """
+            :returns: The number of rows in each run
+            :rtype: list[ int ]
+        """
+        return [
+            end - start for start, end in zip( [ 0 ] + self.ends, self.ends )
+        ]
+    #/def lengths
+    
+    def __iter__( self: Self ) -> Iterator[ any ]:
+        from itertools import chain
+        return chain.from_iterable( map( repeat, self.values, self.lengths() ) )
+    #/def __iter__
+    
+    def index(
         self: Self,
-        rows: slice
-    ) -> list[ int ]:
+        value: any,
+        start: int = 0,
+        stop: int | None = None
+        ) -> int:
         """
-            Turns common slice notation into an appropriate list of ints
+            First row at or after `start`, and before `stop`, equal to `value`, checking each run once
         """
-        return [ i for i in range( *rows.indices(self._len) ) ]
-    #/def _list_fromSlice
+        if stop is None or stop > len( self ):
+            stop = len( self )
+        #
+        for run in range( self._run_forRow( start ), len( self.values ) ):
+            row: int = max( start, self.ends[ run - 1 ] if run > 0 else 0 )
+            if row >= stop:
+                break
+            #
+            if self.values[ run ] == value:
+                return row
+            #
+        #/for run in range( self._run_forRow( start ), len( self.values ) )
+        raise ValueError("{} is not in column".format( repr( value ) ))
+    #/def index
     
-    def __len__( self: Self ) -> int:
-        return self._len
+    def __repr__( self: Self ) -> str:
+        return "RunLengthColumn({})".format( list( zip( self.values, self.lengths() ) ) )
     #
     
-    def keys( self: Self ) -> list[ str ]:
+    def copy( self: Self ) -> list:
         """
-            :returns: All column names of the df, including fixed and nonfixed
-            :rtype: list[ str ]
+            :returns: The value of every row as a new list
+            :rtype: list
         """
-        return list( self._fixed.keys() ) + list( self._shift.keys() )
+        return list( self )
+    #/def copy
+#/class RunLengthColumn
+
+def _runLength_column(
+    column: Iterable,
+    limit: int | None = None
+    ) -> RunLengthColumn | None:
+    """
+        Run length encodes a column. If there are `limit` or more runs, stops as soon as it finds that many, and gives `None`
+    """
+    from itertools import groupby
+    
+    values: list = []
+    ends: list[ int ] = []
+    end: int = 0
+    for val, run in groupby( column ):
+        values.append( val )
+        if limit is not None and len( values ) >= limit:
+            return None
+        #
+        end += len( list( run ) )
+        ends.append( end )
+    #/for val, run in groupby( column )
+    return RunLengthColumn( values, ends )
+#/def _runLength_column
+
+def _view_column(
+    column: Sequence,
+    rows: range | list[ int ],
+    views: WeakSet | None = None
+    ) -> Sequence:
+    """
+        A view on `rows` of `column`, viewing the underlying column directly if `column` is already a view. Consecutive rows of a `RunLengthColumn` stay run length encoded
+        
+        :param WeakSet|None views: The live views of `column`, for a view on it to join. A view of a view joins the views of its base instead
+    """
+    if isinstance( column, RunLengthColumn ) and isinstance( rows, range ) and rows.step == 1:
+        return column[ rows.start:rows.stop ]
+    #
+    if isinstance( column, _ColumnView ):
+        if isinstance( rows, range ) and rows.step == 1:
+            return column[ rows.start:rows.stop ]
+        #
+        return _ColumnView( column.base, [ column.rows[ i ] for i in rows ], column.views )
+    #
+    return _ColumnView( column, rows, views )
+#/def _view_column
+
+def _copy_column(
+    column: Sequence
+    ) -> Sequence:
+    """
+        Copies a column so it can be written to. Read only buffers, like memory mapped columns from ``read_binary()``, become an `array.array` of the same type
+    """
+    from copy import deepcopy
+    if isinstance( column, _ColumnView ):
+        return column.copy()
+    #
+    if isinstance( column, memoryview ):
+        copied: array = array( column.format )
+        copied.frombytes( column.cast('B') )
+        return copied
+    #
+    return deepcopy( column )
+#/def _copy_column
+
+def _column_asList(
+    column: Sequence
+    ) -> list:
+    """
+        Gives a column as a list, as is if it's already a list, so it can be serialized
+    """
+    if isinstance( column, list ):
+        return column
+    #
+    return list( column )
+#/def _column_asList
+
+# -- Binary Format
+#    See `DataFrame.write_binary()` and `read_binary()`
+_BINARY_MAGIC: bytes = b"JABLEBIN"
+_BINARY_VERSION: int = 1
+# Byte alignment of each block, relative to the end of the header
+_BINARY_ALIGNMENT: int = 64
+
+def _binary_typecode(
+    column: Sequence,
+    typecode: str | None = None
+    ) -> str | None:
+    """
+        :param Sequence column: Column to write
+        :param str|None typecode: Preferred typecode, as from the schema
+        :returns: The `array.array` typecode to write `column` with as a fixed width block, or `None` if it has to be json
+        :rtype: str|None
+        
+        Only picks a typecode that gives back exactly the same values, so no `None`, and no mixing of `bool`, `int`, and `float`
+    """
+    if isinstance( column, array ):
+        return column.typecode
+    #
+    if isinstance( column, memoryview ):
+        return column.format
+    #
+    if not isinstance( column, list ):
+        column = list( column )
     #
     
-    def keys_fixed( self: Self ) -> list[ str ]:
+    if all( type( val ) is int for val in column ):
+        candidates: list[ str ] = [ 'q', 'Q' ]
+    #
+    elif all( type( val ) is float for val in column ):
+        candidates = [ 'd' ]
+    #
+    else:
+        return None
+    #/switch { type of values }
+    
+    if typecode is not None:
+        candidates = [ typecode ] + candidates
+    #
+    for candidate in candidates:
+        try:
+            converted: array = array( candidate, column )
+        #
+        except ( TypeError, OverflowError ):
+            continue
+        #
+        if converted.tolist() == column:
+            return candidate
+        #
+    #/for candidate in candidates
+    return None
+#/def _binary_typecode
+
+# -- Expressions
+#    A small expression language for filters and derived columns, like
+#    `( col("age") > 30 ) & col("city").is_in(["Paris","Rome"])`
+#    Evaluated a column at a time, and once per distinct value for `shiftIndex` columns
+
+# An evaluated expression, one of:
+#    ( "fixed", value ): The same value in every row
+#    ( "coded", codes, values ): `values[ codes[i] ]` in row `i`, with `None` codes for `None`
+#    ( "rows", values ): `values[i]` in row `i`
+#    ( "runs", values, ends ): `values[k]` in the rows before `ends[k]`, from `ends[k-1]`, as a `RunLengthColumn`
+Evaluated: type = tuple
+
+class Expr( ABC ):
+    """
+        Base of the expression language. Build with ``col()`` and ``lit()``, and combine with python operators:
+        
+        - Comparisons: `==`, `!=`, `<`, `<=`, `>`, `>=`
+        - Arithmetic: `+`, `-`, `*`, `/`, `//`, `%`, `**`, and unary `-`
+        - Logic: `&`, `|`, `~`, which treat `None` as `False`. Note that these bind tighter than comparisons, so use parentheses: `( col("a") > 1 ) & ( col("b") < 2 )`
+        
+        Other operations give `None` when any input is `None`, so use ``.is_null()`` to find missing values.
+        
+        Anywhere a `JyFilter` is accepted, an `Expr` is too. As a callable on a row dictionary it gives the same result as when evaluated on a whole df
+    """
+    # Comparisons return expressions, so keep hashing by identity
+    __hash__ = object.__hash__
+    
+    @abstractmethod
+    def _evaluate( self: Self, df: "DataFrame" ) -> Evaluated:
         """
-            :returns: Keys for the fixed dictionary. This is so we don't have to have `._fixed` used externally
-            :rtype: list[ str ]
+            :returns: The value of the expression in every row of `df`, in whichever `Evaluated` form is cheapest
+            :rtype: Evaluated
         """
-        return list( self._fixed.keys() )
     #
     
-    def keys_shift( self: Self ) -> list[ str ]:
+    @abstractmethod
+    def __call__( self: Self, row: dict[ str, any ] ) -> any:
         """
-            :returns: All named keys in `._shift`, which includes `._shiftIndex`
-            :rtype: list[ str ]
+            :returns: The value of the expression in one row dictionary
+            :rtype: any
         """
-        return list( self._shift.keys() )
     #
     
-    # -- Getting and Iterating
+    def __bool__( self: Self ) -> bool:
+        raise TypeError(
+            "Expr has no truth value; use `&`, `|`, `~` instead of `and`, `or`, `not`"
+        )
+    #
     
-    def __iter__( self: Self ) -> "DataFrameIterator":
+    def evaluate( self: Self, df: "DataFrame" ) -> list:
         """
-            Goes through by row giving each row as a dictionary
+            :returns: The value of the expression in every row of `df`
+            :rtype: list
         """
-        return DataFrameIterator( self )
+        return _evaluated_asList( self._evaluate( df ), len( df ) )
+    #/def evaluate
+    
+    # -- Comparisons
+    def __eq__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.eq, self, other )
+    #
+    def __ne__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.ne, self, other )
+    #
+    def __lt__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.lt, self, other )
+    #
+    def __le__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.le, self, other )
+    #
+    def __gt__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.gt, self, other )
+    #
+    def __ge__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.ge, self, other )
     #
     
-    def _item_by_rowCol(
-        self: Self,
-        row: int,
-        col: str
-        ) -> any:
-        if col in self._fixed:
-            return self._fixed[ col ]
-        #
-        elif col in self._shiftIndex:
-            return self._shiftIndex[ col ][ self._shift[col][row] ]
+    # -- Arithmetic
+    def __add__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.add, self, other )
+    #
+    def __radd__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.add, other, self )
+    #
+    def __sub__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.sub, self, other )
+    #
+    def __rsub__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.sub, other, self )
+    #
+    def __mul__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.mul, self, other )
+    #
+    def __rmul__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.mul, other, self )
+    #
+    def __truediv__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.truediv, self, other )
+    #
+    def __rtruediv__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.truediv, other, self )
+    #
+    def __floordiv__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.floordiv, self, other )
+    #
+    def __rfloordiv__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.floordiv, other, self )
+    #
+    def __mod__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.mod, self, other )
+    #
+    def __rmod__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.mod, other, self )
+    #
+    def __pow__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.pow, self, other )
+    #
+    def __rpow__( self: Self, other: any ) -> "Expr":
+        return _Operation( _operator.pow, other, self )
+    #
+    def __neg__( self: Self ) -> "Expr":
+        return _Operation( _operator.neg, self )
+    #
+    
+    # -- Logic
+    def __and__( self: Self, other: any ) -> "Expr":
+        return _Operation( _and, self, other, null_safe = True )
+    #
+    def __rand__( self: Self, other: any ) -> "Expr":
+        return _Operation( _and, other, self, null_safe = True )
+    #
+    def __or__( self: Self, other: any ) -> "Expr":
+        return _Operation( _or, self, other, null_safe = True )
+    #
+    def __ror__( self: Self, other: any ) -> "Expr":
+        return _Operation( _or, other, self, null_safe = True )
+    #
+    def __invert__( self: Self ) -> "Expr":
+        return _Operation( _not, self, null_safe = True )
+    #
+    
+    # -- Methods
+    def is_in( self: Self, values: Sequence ) -> "Expr":
+        """
+            True where the value is one of `values`
+        """
+        try:
+            lookup: set | list = set( values )
         #
-        elif col in self._shift:
-            return self._shift[ col ][ row ]
+        except TypeError:
+            # Unhashable values
+            lookup = list( values )
         #
-        else:
-            raise Exception("Bad col={}".format( col ))
+        def is_in( val: any ) -> bool:
+            return val in lookup
         #
-    #/def _item_by_rowCol
+        return _Operation( is_in, self )
+    #/def is_in
     
-    def _select_rows_andColumns(
-        self: Self,
-        rows: list[ int ] = [],
-        columns: list[ str ] = []
-        ) -> Self:
-        """
-            :param list[ int ] rows: Which rows to get. Default is all.
-            :param list[ str ] col: Which columns to get. Default is all.
+    def is_null( self: Self ) -> "Expr":
+        return _Operation( _is_null, self, null_safe = True )
+    #
+    
+    def is_not_null( self: Self ) -> "Expr":
+        return _Operation( _is_not_null, self, null_safe = True )
+    #
+#/class Expr
+
+class Column( Expr ):
+    """
+        The values of a column, whether fixed, shift, or shiftIndex. Make with ``col()``
+    """
+    def __init__( self: Self, name: str ):
+        self.name = name
+    #
+    
+    def __repr__( self: Self ) -> str:
+        return "col({})".format( repr( self.name ) )
+    #
+    
+    def __call__( self: Self, row: dict[ str, any ] ) -> any:
+        return row[ self.name ]
+    #
+    
+    def _evaluate( self: Self, df: "DataFrame" ) -> Evaluated:
+        if self.name in df._fixed:
+            return ( "fixed", df._fixed[ self.name ] )
+        #
+        elif self.name in df._shiftIndex:
+            return ( "coded", df._shift[ self.name ], df._shiftIndex[ self.name ] )
+        #
+        elif self.name in df._shift:
+            column: Sequence = df._shift[ self.name ]
+            if isinstance( column, RunLengthColumn ):
+                return ( "runs", column.values, column.ends )
+            #
+            return ( "rows", column )
+        #
+        raise KeyError( self.name )
+    #/def _evaluate
+#/class Column
+
+class LiteralExpr( Expr ):
+    """
+        The same value in every row. Make with ``lit()``
+    """
+    def __init__( self: Self, value: any ):
+        self.value = value
+    #
+    
+    def __repr__( self: Self ) -> str:
+        return "lit({})".format( repr( self.value ) )
+    #
+    
+    def __call__( self: Self, row: dict[ str, any ] ) -> any:
+        return self.value
+    #
+    
+    def _evaluate( self: Self, df: "DataFrame" ) -> Evaluated:
+        return ( "fixed", self.value )
+    #
+#/class LiteralExpr
+
+def col( name: str ) -> Column:
+    """
+        :param str name: Column name
+        :returns: Expression for the values of that column
+        :rtype: Column
+    """
+    return Column( name )
+#/def col
+
+def lit( value: any ) -> LiteralExpr:
+    """
+        :param any value: Any value
+        :returns: Expression with `value` in every row
+        :rtype: LiteralExpr
+    """
+    return LiteralExpr( value )
+#/def lit
+
+# For comparisons written backwards, like `5 < col("t")`
+_FLIPPED_COMPARISONS: dict[ Callable, Callable ] = {
+    _operator.lt: _operator.gt,
+    _operator.le: _operator.ge,
+    _operator.gt: _operator.lt,
+    _operator.ge: _operator.le,
+    _operator.eq: _operator.eq
+}
+
+def _and( left: any, right: any ) -> bool:
+    return bool( left ) and bool( right )
+#
+def _or( left: any, right: any ) -> bool:
+    return bool( left ) or bool( right )
+#
+def _not( val: any ) -> bool:
+    return not val
+#
+def _is_null( val: any ) -> bool:
+    return val is None
+#
+def _is_not_null( val: any ) -> bool:
+    return val is not None
+#
+
+class _Operation( Expr ):
+    """
+        A function applied to the values of other expressions. Unless `null_safe`, gives `None` when any input is `None`
+    """
+    def __init__(
+        self: Self,
+        function: Callable,
+        *operands: any,
+        null_safe: bool = False
+        ):
+        self.function = function
+        self.operands = [
+            operand if isinstance( operand, Expr ) else LiteralExpr( operand ) for operand in operands
+        ]
+        self.null_safe = null_safe
+    #/def __init__
+    
+    def _apply( self: Self, *values: any ) -> any:
+        if not self.null_safe and any( val is None for val in values ):
+            return None
+        #
+        return self.function( *values )
+    #/def _apply
+    
+    def __call__( self: Self, row: dict[ str, any ] ) -> any:
+        return self._apply(
+            *( operand( row ) for operand in self.operands )
+        )
+    #/def __call__
+    
+    def _evaluate( self: Self, df: "DataFrame" ) -> Evaluated:
+        evaluated: list[ Evaluated ] = [
+            operand._evaluate( df ) for operand in self.operands
+        ]
+        varying: list[ int ] = [
+            j for j in range( len( evaluated ) ) if evaluated[j][0] != "fixed"
+        ]
+        
+        if len( varying ) == 0:
+            return ( "fixed", self._apply( *( item[1] for item in evaluated ) ) )
+        #
+        
+        if len( varying ) == 1 and evaluated[ varying[0] ][0] == "coded":
+            # Apply once per distinct value, and keep the codes
+            j: int = varying[0]
+            _, codes, values = evaluated[j]
+            args: list = [ item[1] for item in evaluated ]
+            
+            def apply_at( val: any ) -> any:
+                args[ j ] = val
+                return self._apply( *args )
+            #
+            # Only values some row has, since the dictionary can keep values of removed rows, or rows outside a view
+            used: set = set( codes )
+            new_values: list = [
+                apply_at( values[ code ] ) if code in used else None for code in range( len( values ) )
+            ]
+            if self.null_safe:
+                # `None` rows can give a value too, like for `.is_null()`
+                null_value: any = apply_at( None )
+                if null_value is not None:
+                    codes = [
+                        len( values ) if code is None else code for code in codes
+                    ]
+                    new_values.append( null_value )
+                #
+            #/if self.null_safe
+            return ( "coded", codes, new_values )
+        #/if len( varying ) == 1 and evaluated[ varying[0] ][0] == "coded"
+        
+        if len( varying ) == 1 and evaluated[ varying[0] ][0] == "runs":
+            # Apply once per run
+            j: int = varying[0]
+            _, values, ends = evaluated[j]
+            args: list = [ item[1] for item in evaluated ]
+            new_values: list = []
+            for val in values:
+                args[ j ] = val
+                new_values.append( self._apply( *args ) )
+            #
+            return ( "runs", new_values, ends )
+        #/if len( varying ) == 1 and evaluated[ varying[0] ][0] == "runs"
+        
+        n: int = len( df )
+        columns: list[ Sequence ] = [
+            _evaluated_asList( item, n ) for item in evaluated
+        ]
+        return (
+            "rows",
+            [ self._apply( *values ) for values in zip( *columns ) ]
+        )
+    #/def _evaluate
+    
+    def __repr__( self: Self ) -> str:
+        return "{}({})".format(
+            getattr( self.function, "__name__", "function" ),
+            ", ".join( repr( operand ) for operand in self.operands )
+        )
+    #
+#/class _Operation
+
+def _evaluated_asList(
+    evaluated: Evaluated,
+    length: int
+    ) -> Sequence:
+    """
+        Gives the value of every row from an evaluated expression
+    """
+    if evaluated[0] == "fixed":
+        return [ evaluated[1] ]*length
+    #
+    if evaluated[0] == "coded":
+        _, codes, values = evaluated
+        return [
+            values[ code ] if code is not None else None for code in codes
+        ]
+    #
+    if evaluated[0] == "runs":
+        return RunLengthColumn( evaluated[1], evaluated[2] )
+    #
+    return evaluated[1]
+#/def _evaluated_asList
+
+def _truthy_positions(
+    evaluated: Evaluated,
+    length: int
+    ) -> list[ int ]:
+    """
+        Indices of rows where an evaluated expression is truthy
+    """
+    if evaluated[0] == "fixed":
+        return list( range( length ) ) if evaluated[1] else []
+    #
+    if evaluated[0] == "coded":
+        _, codes, values = evaluated
+        truthy: list[ int ] = [ code for code, val in enumerate( values ) if val ]
+        if len( truthy ) == 0:
+            return []
+        #
+        if len( truthy ) == 1:
+            return _positions_ofValue( codes, truthy[0] )
+        #
+        truthy_set: set[ int ] = set( truthy )
+        return [ i for i, code in enumerate( codes ) if code in truthy_set ]
+    #
+    if evaluated[0] == "runs":
+        _, values, ends = evaluated
+        positions: list[ int ] = []
+        for run, val in enumerate( values ):
+            if val:
+                positions.extend( range( ends[ run - 1 ] if run > 0 else 0, ends[ run ] ) )
+            #
+        #
+        return positions
+    #
+    return [ i for i, val in enumerate( evaluated[1] ) if val ]
+#/def _truthy_positions
+
+# JyFilter: A way to check if rows match some criterion, either by equality with every value in a dictionary, evaluating as true with a lambda taking the row as an input, or an `Expr`
+#   The row a lambda gets is a new dict for each row, so it can be kept or changed
+JyFilter: type = dict[ str, any ] | Callable[ dict[ str, any ], bool ] | Expr
+
+def row_does_matchJyFilter(
+    row: dict[ str, any ],
+    jyFilter: JyFilter
+    ) -> bool:
+    """
+        The way to check if a row dictionary matches a jyFilter
+        
+        For dictionaries, check equality on every key
+        
+        For Callables, just run the Callable on the row
+    """
+    if isinstance( jyFilter, dict ):
+        return all(
+            row[ key ] == jyFilter[ key ] for key in jyFilter
+        )
+    #
+    
+    if isinstance( jyFilter, Callable ):
+        return jyFilter( row )
+    #
+    
+    raise Exception("Unrecognized jyFilter={}".format(jyFilter))
+#/def row_does_matchJyFilter
+
+def _build_shiftIndexMap(
+    shiftIndex: list
+    ) -> dict[ any, int ]:
+    """
+        :param list shiftIndex: The distinct values of a shiftIndex column
+        :returns: Map from each value to its index in `shiftIndex`, keeping the first index for repeated values
+        :rtype: dict[ any, int ]
+        
+        Unhashable values (like lists) are left out, and get found by searching `shiftIndex` instead
+    """
+    shiftIndexMap: dict[ any, int ] = {}
+    for i, val in enumerate( shiftIndex ):
+        try:
+            shiftIndexMap.setdefault( val, i )
+        #
+        except TypeError:
+            # Unhashable, found by search in `_get_shiftIndexCode`
+            continue
+        #/try shiftIndexMap.setdefault( val, i )/except TypeError
+    #/for i, val in enumerate( shiftIndex )
+    return shiftIndexMap
+#/def _build_shiftIndexMap
+
+def _positions_ofValue(
+    column: Sequence,
+    value: any
+    ) -> list[ int ]:
+    """
+        :param Sequence column: Raw column to search, as in `._shift`
+        :param any value: Raw value to find, a code for `shiftIndex` columns
+        :returns: Every index `i` with `column[ i ] == value`, in order
+        :rtype: list[ int ]
+        
+        Uses the C level `.index()` of lists and arrays to skip between matches, and checks a `RunLengthColumn` once per run
+    """
+    if isinstance( column, RunLengthColumn ):
+        return _truthy_positions(
+            ( "runs", [ val == value for val in column.values ], column.ends ),
+            len( column )
+        )
+    #
+    if not hasattr( column, "index" ):
+        return [ i for i, val in enumerate( column ) if val == value ]
+    #
+    positions: list[ int ] = []
+    i: int = -1
+    try:
+        while True:
+            i = column.index( value, i + 1 )
+            positions.append( i )
+        #
+    #
+    except ValueError:
+        # No more matches
+        return positions
+    #
+    except TypeError:
+        # Like an `array.array` searched for a value of another type
+        return [ i for i, val in enumerate( column ) if val == value ]
+    #/try column.index( ... )/except
+#/def _positions_ofValue
+
+class DataFrame():
+    """
+        Stores column data as a combination of three parts:
+        
+        :param dict[ str, any ] fixed: Columns with the same name for value in every row. You can change its value but that will essentially change it for every row; try to only change it in code that knows it's a fixed key, and sets and gets it with the fixed methods (`.keys_fixed()`, `.get_fixed(...)`)
+        :param dict[ str, list ] shift: Where we have a listed literal item as a value, typically a string, float or int, sometimes lists of them, sometimes dictionaries or any other objects
+        :param dict[ str list ] shiftIndex: Sometimes, shift columns will have the same value repeated many times. If its column name is in shift index, then the values in shift are integers, referring to the index in shiftIndex of the same column. I.e., if we have `shift["fur_color"] = [1,0,2]` and `shiftIndex["fur_color"] = ["green","orange","purple","red"]`, then the `"fur_color"`s are really `["orange","green","purple"]`
+        :param pl.Schema schema: Optional types to set for any columns. No enforcement is done by the DataFrame itself, whether inserting or retriving. It is for your own use. These will be serialized as strings using `str` so add the appropriate functions for custom classes to serialize it as you want, and convert into a class upon reading. Includes support for basic python types
+        :param dict[ str, any ] meta: Another arbitrary dictionary to hold domain specific data, in the df as `._meta`. No methods write or use this, so edit and read at will or subclass.
+        :param dict[ str, type ] customTypes: A reference to use for deserializing string types from `schema`. Gets checked before builtin types (NOT CURRENTLY SUPPORTED)
+        :param bool typed: If `True`, shift columns with a numeric type in `schema`, and the codes of `shiftIndex` columns, are held in compact `array.array` buffers instead of lists. See ``.set_typedStorage()``
+        
+        see ``.__getitem__`` for acessing values
+    """
+    def __init__(
+        self: Self,
+        fixed: dict[ str, any ] = {},
+        shift: dict[ str, list] = {},
+        shiftIndex: dict[ str, list ] = {},
+        schema: pl.Schema = {},
+        meta: dict[ str, any ] = {},
+        customTypes: dict[ str, type ] = {},
+        typed: bool = False
+        ):
+        
+        self._fixed = fixed
+        self._shift = shift
+        self._shiftIndex = shiftIndex
+        # value -> index in `._shiftIndex[ col ]`, so lookups are O(1)
+        self._shiftIndexMap = {
+            col: _build_shiftIndexMap( val ) for col, val in self._shiftIndex.items()
+        }
+        self._meta = meta
+        self._customTypes = customTypes
+        
+        # Handle key types by using ._customTypes and _TYPES_DICT
+        if customTypes != {}:
+            raise Exception("customTypes UC")
+        #
+        self._schema = schema | customTypes
+        
+        assert all( key in self._shift for key in self._shiftIndex )
+        
+        if self._shift != {}:
+            self._len = 0
+            for key in self._shift:
+                if self._len == 0:
+                    self._len = len( self._shift[ key ] )
+                #
+                else:
+                    assert len( self._shift[key] ) == self._len
+                #/if self._len == 0/else
+            #/for key in self._shift
+        #/if self._shift != {}
+        else:
+            self._len = 0
+        #/if self._shift != {}/elif self._fixed != {}/else
+
+        self.shape = (self._len, len( self._fixed ) + len( self._shift ))
+        
+        self._typed = False
+        if typed:
+            self.set_typedStorage( True )
+        #
+        
+        # Column the rows are in order of, from ``.set_sortedBy()``
+        self._sortedBy: str | None = None
+        
+        # Secondary hash indexes, from ``.create_index()``
+        # columns -> { key: [ rows ] }, or `None` when it needs rebuilding
+        self._indexes: dict[ tuple[ str, ... ], dict[ any, list[ int ] ] | None ] = {}
+        
+        # Shift columns whose storage another df also holds, as from a selection. Copied before they're written to
+        self._shared: set[ str ] = set()
+        # Likewise for `._shiftIndex`, and `._shiftIndexMap`
+        self._sharedIndex: set[ str ] = set()
+        # Live `_ColumnView`s of our shift columns, from selections. Detached before a column is changed in place
+        self._views: dict[ str, WeakSet[ _ColumnView ] ] = {}
+        
+        # From ``.track_secondOrderStats()``, kept up to date by the change hooks
+        self._liveStats: list[ LiveSecondOrderStats ] = []
+    #/def __init__
+    
+    def __getstate__( self: Self ) -> dict:
+        """
+            For pickling. A pickled df holds its own copies, so no views of it are live
+        """
+        state: dict = dict( self.__dict__ )
+        state["_views"] = {}
+        return state
+    #/def __getstate__
+    
+    # -- Info
+    
+    def _list_fromSlice(
+        self: Self,
+        rows: slice
+    ) -> range:
+        """
+            Turns common slice notation into an appropriate range of ints
+        """
+        return range( *rows.indices( self._len ) )
+    #/def _list_fromSlice
+    
+    def __len__( self: Self ) -> int:
+        return self._len
+    #
+    
+    def keys( self: Self ) -> list[ str ]:
+        """
+            :returns: All column names of the df, including fixed and nonfixed
+            :rtype: list[ str ]
+        """
+        return list( self._fixed.keys() ) + list( self._shift.keys() )
+    #
+    
+    def keys_fixed( self: Self ) -> list[ str ]:
+        """
+            :returns: Keys for the fixed dictionary. This is so we don't have to have `._fixed` used externally
+            :rtype: list[ str ]
+        """
+        return list( self._fixed.keys() )
+    #
+    
+    def encodings( self: Self ) -> dict[ str, str ]:
+        """
+            :returns: How each column is stored: `"fixed"`, `"shiftIndex"`, `"shiftRun"` for a `RunLengthColumn`, or `"shift"`, followed by the `array.array` typecode, like `"shift[d]"`, for typed storage
+            :rtype: dict[ str, str ]
+        """
+        encodings: dict[ str, str ] = { col: "fixed" for col in self._fixed }
+        for col, column in self._shift.items():
+            encoding: str = "shiftIndex" if col in self._shiftIndex else "shift"
+            if isinstance( column, RunLengthColumn ):
+                encoding = "shiftRun"
+            #
+            elif isinstance( column, array ):
+                encoding += "[{}]".format( column.typecode )
+            #
+            encodings[ col ] = encoding
+        #
+        return encodings
+    #/def encodings
+    
+    def keys_shift( self: Self ) -> list[ str ]:
+        """
+            :returns: All named keys in `._shift`, which includes `._shiftIndex`
+            :rtype: list[ str ]
+        """
+        return list( self._shift.keys() )
+    #
+    
+    def _find_shiftIndexCode(
+        self: Self,
+        col: str,
+        val: any
+        ) -> int | None:
+        """
+            :returns: The index of `val` in `._shiftIndex[ col ]`, or `None` if it's not present. Never adds it
+            :rtype: int|None
+        """
+        try:
+            return self._shiftIndexMap[ col ].get( val )
+        #
+        except TypeError:
+            # Unhashable, like a list
+            if val in self._shiftIndex[ col ]:
+                return self._shiftIndex[ col ].index( val )
+            #
+            return None
+        #/try return self._shiftIndexMap[ col ].get( val )/except TypeError
+    #/def _find_shiftIndexCode
+    
+    def _get_shiftIndexCode(
+        self: Self,
+        col: str,
+        val: any
+        ) -> int:
+        """
+            :param str col: A column in `._shiftIndex`
+            :param any val: Value to look up
+            :returns: The index of `val` in `._shiftIndex[ col ]`, appending it first if it's not present
+            :rtype: int
+            
+            Keeps `._shiftIndexMap[ col ]` in step with `._shiftIndex[ col ]`. All additions to a shiftIndex should go through here
+        """
+        shiftIndexMap: dict[ any, int ] = self._shiftIndexMap[ col ]
+        try:
+            return shiftIndexMap[ val ]
+        #
+        except KeyError:
+            self._shiftIndex_forWrite( col )
+            code: int = len( self._shiftIndex[ col ] )
+            self._shiftIndex[ col ].append( val )
+            self._shiftIndexMap[ col ][ val ] = code
+            return code
+        #
+        except TypeError:
+            # Unhashable, like a list; search the old fashioned way
+            if val in self._shiftIndex[ col ]:
+                return self._shiftIndex[ col ].index( val )
+            #
+            self._shiftIndex_forWrite( col ).append( val )
+            return len( self._shiftIndex[ col ] ) - 1
+        #/try return shiftIndexMap[ val ]/except
+    #/def _get_shiftIndexCode
+    
+    def _shiftIndex_forWrite( self: Self, col: str ) -> list:
+        """
+            Gives `._shiftIndex[ col ]` ready to be added to, first copying it and its map if they're shared with another df
+        """
+        if col in self._sharedIndex:
+            self._sharedIndex.discard( col )
+            self._shiftIndex[ col ] = list( self._shiftIndex[ col ] )
+            self._shiftIndexMap[ col ] = dict( self._shiftIndexMap[ col ] )
+        #
+        return self._shiftIndex[ col ]
+    #/def _shiftIndex_forWrite
+    
+    def _share_columns(
+        self: Self,
+        df: Self,
+        columns: Sequence[ str ]
+        ) -> None:
+        """
+            Puts our storage for the shift `columns` into `df` without copying, as the start of copy on write. Both dfs copy a column, or its shiftIndex, before they first change it
+        """
+        for col in columns:
+            df._shift[ col ] = self._shift[ col ]
+            self._shared.add( col )
+            df._shared.add( col )
+            if col in self._shiftIndex:
+                df._shiftIndex[ col ] = self._shiftIndex[ col ]
+                df._shiftIndexMap[ col ] = self._shiftIndexMap[ col ]
+                self._sharedIndex.add( col )
+                df._sharedIndex.add( col )
+            #
+        #/for col in columns
+        return
+    #/def _share_columns
+    
+    def _view_columns(
+        self: Self,
+        df: Self,
+        columns: Sequence[ str ],
+        rows: range | list[ int ]
+        ) -> None:
+        """
+            Puts views of `rows` of our shift `columns` into `df` without copying, sharing their shiftIndex as in ``._share_columns()``
+            
+            Unlike a shared column, a view doesn't make us copy the whole column before we change it: we detach the views still alive, each copying only its rows. See ``._detach_views()``
+        """
+        for col in columns:
+            df._shift[ col ] = _view_column(
+                self._shift[ col ], rows, self._views.setdefault( col, WeakSet() )
+            )
+            if col in self._shiftIndex:
+                df._shiftIndex[ col ] = self._shiftIndex[ col ]
+                df._shiftIndexMap[ col ] = self._shiftIndexMap[ col ]
+                self._sharedIndex.add( col )
+                df._sharedIndex.add( col )
+            #
+        #/for col in columns
+        return
+    #/def _view_columns
+    
+    def _detach_views( self: Self, col: str ) -> None:
+        """
+            Detaches the live views of `._shift[ col ]`, before it's changed in place
+        """
+        views: WeakSet | None = self._views.pop( col, None )
+        if not views:
+            return
+        #
+        column: Sequence = self._shift[ col ]
+        for view in list( views ):
+            if view.base is column:
+                view.detach()
+            #
+        #
+        return
+    #/def _detach_views
+    
+    # -- Typed Storage
+    
+    def _typecode_forCol( self: Self, col: str ) -> str | None:
+        """
+            The `array.array` typecode for `col` under typed storage, or `None` if it stays a list
+        """
+        if col in self._shiftIndex:
+            return _SHIFTINDEX_TYPECODE
+        #
+        return _typecode_forDataType( self._schema.get( col ) )
+    #/def _typecode_forCol
+    
+    def _type_column( self: Self, col: str ) -> None:
+        """
+            Converts `._shift[ col ]` to an `array.array` if it has a typecode and every value fits. Otherwise it's left as is, for example when it has `None` values
+        """
+        typecode: str | None = self._typecode_forCol( col )
+        if typecode is None or isinstance( self._shift[ col ], array | RunLengthColumn ):
+            return
+        #
+        try:
+            self._shift[ col ] = array( typecode, self._shift[ col ] )
+        #
+        except ( TypeError, OverflowError ):
+            # Values that don't fit, like `None`; keep it a list
+            return
+        #/try self._shift[ col ] = array( ... )/except
+        return
+    #/def _type_column
+    
+    def _column_forWrite( self: Self, col: str ) -> list | array:
+        """
+            Gives `._shift[ col ]` ready to be modified in place, first copying read only storage (like a memory mapped column, a view, or a `RunLengthColumn`), or storage shared with another df, into memory
+        """
+        column: Sequence = self._shift[ col ]
+        if col in self._shared:
+            self._shared.discard( col )
+            if isinstance( column, list | array ):
+                column = column[:]
+                self._shift[ col ] = column
+                return column
+            #
+        #/if col in self._shared
+        if not isinstance( column, list | array ):
+            column = _copy_column( column )
+            if not isinstance( column, list | array ):
+                column = list( column )
+            #
+            self._shift[ col ] = column
+            return column
+        #
+        self._detach_views( col )
+        return column
+    #/def _column_forWrite
+    
+    def _untype_column( self: Self, col: str ) -> list:
+        """
+            Converts `._shift[ col ]` back to a list, and returns it
+        """
+        if not isinstance( self._shift[ col ], list ) or col in self._shared:
+            self._shift[ col ] = list( self._shift[ col ] )
+            self._shared.discard( col )
+        #
+        else:
+            self._detach_views( col )
+        #
+        return self._shift[ col ]
+    #/def _untype_column
+    
+    def materialize( self: Self ) -> None:
+        """
+            Copies the columns of a view, like from ``.__getitem__()``, and any storage shared with another df, so self holds its own
+            
+            Not needed to write to a view, since the first write to a column copies it anyway
+        """
+        for col in self._shift:
+            if col in self._shared or isinstance( self._shift[ col ], _ColumnView ):
+                self._column_forWrite( col )
+            #
+        #
+        return
+    #/def materialize
+    
+    def set_typedStorage( self: Self, typed: bool = True ) -> None:
+        """
+            :param bool typed: If `True`, store shift columns with a numeric type in `._schema`, and the integer codes behind `._shiftIndex`, as `array.array` buffers. If `False`, store every shift column as a list
+            
+            Typed storage is opt in. A typed column that gets a value it can't hold, like `None` or a float in an integer column, goes back to being a list
+        """
+        self._typed = typed
+        for col in self._shift:
+            if typed:
+                self._type_column( col )
+            #
+            elif not isinstance( self._shift[ col ], RunLengthColumn ):
+                self._untype_column( col )
+            #/if typed/else
+        #/for col in self._shift
+        return
+    #/def set_typedStorage
+    
+    def _append_toColumn( self: Self, col: str, val: any ) -> None:
+        """
+            Appends a raw value (a code for `shiftIndex` columns) to `._shift[ col ]`, falling back to a list if a typed column can't hold it
+        """
+        try:
+            self._column_forWrite( col ).append( val )
+        #
+        except ( TypeError, OverflowError ):
+            self._untype_column( col ).append( val )
+        #/try self._shift[ col ].append( val )/except
+        return
+    #/def _append_toColumn
+    
+    def _extend_column( self: Self, col: str, values: Sequence ) -> None:
+        """
+            Extends `._shift[ col ]` with raw values (codes for `shiftIndex` columns), falling back to a list if a typed column can't hold them
+        """
+        column: list | array = self._column_forWrite( col )
+        length: int = len( column )
+        if isinstance( values, array ) and not (
+            isinstance( column, array ) and column.typecode == values.typecode
+        ):
+            # An array only extends from an array of the same kind
+            values = values.tolist()
+        #
+        try:
+            column.extend( values )
+        #
+        except ( TypeError, OverflowError ):
+            # An array may have taken some values before failing
+            del column[ length: ]
+            self._untype_column( col ).extend( values )
+        #/try column.extend( values )/except
+        return
+    #/def _extend_column
+    
+    def _set_toColumn( self: Self, col: str, index: int, val: any ) -> None:
+        """
+            Sets a raw value (a code for `shiftIndex` columns) in `._shift[ col ]`, falling back to a list if a typed column can't hold it
+        """
+        try:
+            self._column_forWrite( col )[ index ] = val
+        #
+        except ( TypeError, OverflowError ):
+            self._untype_column( col )[ index ] = val
+        #/try self._shift[ col ][ index ] = val/except
+        return
+    #/def _set_toColumn
+    
+    # -- Secondary Indexes
+    
+    def create_index( self: Self, cols: str | Sequence[ str ] ) -> None:
+        """
+            :param str|Sequence[ str ] cols: One column, or several for a composite key
+            
+            Builds a hash index from the values of `cols` (a tuple of them for several) to the rows holding them. It's kept up to date as the df changes, and dict jyFilters with a key for every column in `cols` use it automatically, so `filter_expectOne()` and the like become O(1) lookups
+            
+            Raises `TypeError` if any values are unhashable
+        """
+        if isinstance( cols, str ):
+            cols = [ cols ]
+        #
+        cols = tuple( cols )
+        for col in cols:
+            if col not in self._fixed and col not in self._shift:
+                raise KeyError( col )
+            #
+        #
+        self._indexes[ cols ] = self._build_index( cols )
+        return
+    #/def create_index
+    
+    def drop_index( self: Self, cols: str | Sequence[ str ] ) -> None:
+        """
+            Removes an index made by ``.create_index()``
+        """
+        if isinstance( cols, str ):
+            cols = [ cols ]
+        #
+        del self._indexes[ tuple( cols ) ]
+        return
+    #/def drop_index
+    
+    def _build_index(
+        self: Self,
+        cols: tuple[ str, ... ]
+        ) -> dict[ any, list[ int ] ]:
+        index: dict[ any, list[ int ] ] = {}
+        keys: Sequence
+        if len( cols ) == 1:
+            keys = Column( cols[0] ).evaluate( self )
+        #
+        else:
+            keys = zip(
+                *( Column( col ).evaluate( self ) for col in cols )
+            )
+        #/if len( cols ) == 1/else
+        for i, key in enumerate( keys ):
+            try:
+                index[ key ].append( i )
+            #
+            except KeyError:
+                index[ key ] = [ i ]
+            #
+        #/for i, key in enumerate( keys )
+        return index
+    #/def _build_index
+    
+    def _get_index(
+        self: Self,
+        cols: tuple[ str, ... ]
+        ) -> dict[ any, list[ int ] ]:
+        """
+            The index for `cols`, rebuilding it first if it's out of date
+        """
+        if self._indexes[ cols ] is None:
+            self._indexes[ cols ] = self._build_index( cols )
+        #
+        return self._indexes[ cols ]
+    #/def _get_index
+    
+    def _index_key( self: Self, cols: tuple[ str, ... ], row: int ) -> any:
+        if len( cols ) == 1:
+            return self._item_by_rowCol( row, cols[0] )
+        #
+        return tuple( self._item_by_rowCol( row, col ) for col in cols )
+    #/def _index_key
+    
+    def _index_forFilter(
+        self: Self,
+        jyFilter: dict[ str, any ]
+        ) -> tuple[ str, ... ] | None:
+        """
+            The index with the most columns, all of which are keys of `jyFilter`, if any
+        """
+        best: tuple[ str, ... ] | None = None
+        for cols in self._indexes:
+            if all( col in jyFilter for col in cols ) and (
+                best is None or len( cols ) > len( best )
+            ):
+                best = cols
+            #
+        #/for cols in self._indexes
+        return best
+    #/def _index_forFilter
+    
+    # -- Sorted Ranges
+    
+    def set_sortedBy( self: Self, col: str | None ) -> None:
+        """
+            :param str|None col: Column the rows are in ascending order of, or `None` to clear it
+            
+            Declares the rows sorted by `col`, kept in `._sortedBy`. It isn't saved with the df. Raises `ValueError` if they're not, or if there are `None` values.
+            
+            Appends and updates that keep the order keep the declaration, and ones that break it clear it. While it holds, ``.range_rows()`` and ``.first_atOrAfter()`` use binary search, as do comparisons of `col` with a value in an `Expr` filter
+        """
+        if col is None:
+            self._sortedBy = None
+            return
+        #
+        if col in self._fixed:
+            if self._fixed[ col ] is None:
+                raise ValueError("None values in col={}".format( col ))
+            #
+        #
+        else:
+            values: list = Column( col ).evaluate( self )
+            for i in range( len( values ) ):
+                if values[ i ] is None:
+                    raise ValueError("None values in col={}".format( col ))
+                #
+                if i > 0 and values[ i ] < values[ i - 1 ]:
+                    raise ValueError(
+                        "Rows not sorted by col={} at row {}".format( col, i )
+                    )
+                #
+            #/for i in range( len( values ) )
+        #/if col in self._fixed/else
+        self._sortedBy = col
+        return
+    #/def set_sortedBy
+    
+    def get_sortedBy( self: Self ) -> str | None:
+        """
+            :returns: The column declared by ``.set_sortedBy()``, if any
+            :rtype: str|None
+        """
+        return self._sortedBy
+    #/def get_sortedBy
+    
+    def _bisect(
+        self: Self,
+        col: str,
+        value: any,
+        right: bool = False
+        ) -> int:
+        """
+            Binary search on the sorted `col`, like `bisect.bisect_left` (or `bisect_right`)
+        """
+        from bisect import bisect_left, bisect_right
+        _bisect: Callable = bisect_right if right else bisect_left
+        if col in self._fixed:
+            return _bisect( [ self._fixed[ col ] ], value )*len( self )
+        #
+        if col in self._shiftIndex:
+            codes: Sequence = self._shift[ col ]
+            values: list = self._shiftIndex[ col ]
+            return _bisect(
+                range( len( self ) ), value, key = lambda i: values[ codes[ i ] ]
+            )
+        #
+        return _bisect( self._shift[ col ], value )
+    #/def _bisect
+    
+    def _check_sortedBy( self: Self ) -> str:
+        col: str | None = self.get_sortedBy()
+        if col is None:
+            raise ValueError("No sorted column; see .set_sortedBy()")
+        #
+        return col
+    #/def _check_sortedBy
+    
+    def range_rows(
+        self: Self,
+        lower: any = None,
+        upper: any = None,
+        include_upper: bool = False
+        ) -> slice:
+        """
+            :param any lower: Smallest value to include, or `None` for no bound
+            :param any upper: Value to stop at, or `None` for no bound
+            :param bool include_upper: If `True`, rows equal to `upper` are included
+            :returns: The rows with `lower <= value < upper` (or `<= upper`) in the sorted column, so `df[ df.range_rows( ... ) ]` gives them
+            :rtype: slice
+            
+            Found by binary search, so O(log n). Requires ``.set_sortedBy()``
+        """
+        col: str = self._check_sortedBy()
+        start: int = 0 if lower is None else self._bisect( col, lower )
+        stop: int = len( self ) if upper is None else self._bisect(
+            col, upper, right = include_upper
+        )
+        return slice( start, max( start, stop ) )
+    #/def range_rows
+    
+    def first_atOrAfter(
+        self: Self,
+        value: any,
+        strict: bool = False
+        ) -> int | None:
+        """
+            :param any value: Value to search for in the sorted column
+            :param bool strict: If `True`, find the first row strictly after `value` instead
+            :returns: The index of the first row at or after `value`, or `None` if there isn't one
+            :rtype: int|None
+            
+            Found by binary search, so O(log n). Requires ``.set_sortedBy()``
+        """
+        i: int = self._bisect( self._check_sortedBy(), value, right = strict )
+        return i if i < len( self ) else None
+    #/def first_atOrAfter
+    
+    def _sortedRange_forExpr(
+        self: Self,
+        expr: Expr
+        ) -> range | None:
+        """
+            Rows matching `expr` as a range, if it compares the sorted column with literals, possibly combined with `&`. Otherwise `None`
+        """
+        col: str | None = self.get_sortedBy()
+        if col is None or not isinstance( expr, _Operation ):
+            return None
+        #
+        if expr.function is _and:
+            ranges: list[ range | None ] = [
+                self._sortedRange_forExpr( operand ) for operand in expr.operands
+            ]
+            if any( _range is None for _range in ranges ):
+                return None
+            #
+            return range(
+                max( _range.start for _range in ranges ),
+                max(
+                    max( _range.start for _range in ranges ),
+                    min( _range.stop for _range in ranges )
+                )
+            )
+        #/if expr.function is _and
+        
+        if len( expr.operands ) != 2:
+            return None
+        #
+        left, right = expr.operands
+        function: Callable = expr.function
+        if isinstance( left, LiteralExpr ) and isinstance( right, Column ):
+            # Flip, like `5 < col("t")`
+            left, right = right, left
+            function = _FLIPPED_COMPARISONS.get( function )
+        #
+        if not (
+            isinstance( left, Column ) and left.name == col and isinstance( right, LiteralExpr )
+        ) or right.value is None:
+            return None
+        #
+        value: any = right.value
+        n: int = len( self )
+        try:
+            if function is _operator.ge:
+                return range( self._bisect( col, value ), n )
+            #
+            if function is _operator.gt:
+                return range( self._bisect( col, value, right = True ), n )
+            #
+            if function is _operator.lt:
+                return range( 0, self._bisect( col, value ) )
+            #
+            if function is _operator.le:
+                return range( 0, self._bisect( col, value, right = True ) )
+            #
+            if function is _operator.eq:
+                return range(
+                    self._bisect( col, value ), self._bisect( col, value, right = True )
+                )
+            #
+        #
+        except TypeError:
+            # A value that doesn't order against the column, like a str against ints. Checking row by row gives what an unsorted df would
+            return None
+        #/try return range( ... )/except TypeError
+        return None
+    #/def _sortedRange_forExpr
+    
+    # -- Live Statistics
+    
+    def track_secondOrderStats(
+        self: Self,
+        groups: list[ str ],
+        numerics: list[ str ]
+        ) -> "LiveSecondOrderStats":
+        """
+            :param list[ str ] groups: As in ``secondOrderStats()``
+            :param list[ str ] numerics: As in ``secondOrderStats()``
+            :returns: Statistics kept up to date as rows are appended, set, inserted and removed, at O(1) a row
+            :rtype: LiveSecondOrderStats
+            
+            Stop with ``.untrack_secondOrderStats()``
+        """
+        for col in list( groups ) + list( numerics ):
+            if col not in self._fixed and col not in self._shift:
+                raise KeyError( col )
+            #
+        #
+        live: LiveSecondOrderStats = LiveSecondOrderStats( self, groups, numerics )
+        self._liveStats.append( live )
+        return live
+    #/def track_secondOrderStats
+    
+    def untrack_secondOrderStats( self: Self, live: "LiveSecondOrderStats" ) -> None:
+        """
+            Stops updating `live`, from ``.track_secondOrderStats()``
+        """
+        self._liveStats.remove( live )
+        return
+    #/def untrack_secondOrderStats
+    
+    # -- Change Hooks
+    #    Called by every path that modifies rows, to keep indexes and live statistics up to date
+    
+    def _on_rowsAppended( self: Self, start: int ) -> None:
+        """
+            Rows from `start` to the end are new
+        """
+        for live in self._liveStats:
+            for i in range( start, len( self ) ):
+                live._add_row( i )
+            #
+        #
+        for cols, index in list( self._indexes.items() ):
+            if index is None:
+                continue
+            #
+            try:
+                for i in range( start, len( self ) ):
+                    index.setdefault( self._index_key( cols, i ), [] ).append( i )
+                #
+            #
+            except TypeError:
+                # An unhashable value can't be indexed; drop the index, and search instead
+                del self._indexes[ cols ]
+            #/try index.setdefault( ... )/except TypeError
+        #/for cols, index in list( self._indexes.items() )
+        
+        if self.get_sortedBy() is not None:
+            for i in range( max( start, 1 ), len( self ) ):
+                self._check_sortedAt( i )
+            #
+            if start == 0 and len( self ) > 0:
+                self._check_sortedAt( 0 )
+            #
+        #/if self.get_sortedBy() is not None
+        return
+    #/def _on_rowsAppended
+    
+    def _check_sortedAt( self: Self, row: int ) -> None:
+        """
+            Clears the sorted column declaration if `row` is out of order with its neighbours, or `None`
+        """
+        col: str | None = self.get_sortedBy()
+        if col is None or col in self._fixed:
+            return
+        #
+        value: any = self._item_by_rowCol( row, col )
+        try:
+            if value is None or (
+                row > 0 and value < self._item_by_rowCol( row - 1, col )
+            ) or (
+                row < len( self ) - 1 and self._item_by_rowCol( row + 1, col ) < value
+            ):
+                self.set_sortedBy( None )
+            #
+        #
+        except TypeError:
+            # Not comparable, like `None` in a neighbour
+            self.set_sortedBy( None )
+        #/try if value is None or ...
+        return
+    #/def _check_sortedAt
+    
+    def _on_rowChanging(
+        self: Self,
+        row: int,
+        keys: Sequence[ str ]
+        ) -> list[ tuple[ "tuple[ str, ... ] | LiveSecondOrderStats", any ] ]:
+        """
+            Before the values of `keys` change in an existing `row`. Gives what ``._on_rowChanged()`` needs afterwards
+        """
+        changing: list[ tuple[ tuple[ str, ... ] | LiveSecondOrderStats, any ] ] = [
+            ( cols, self._index_key( cols, row ) ) for cols, index in self._indexes.items()\
+                if index is not None and any( col in keys for col in cols )
+        ]
+        for live in self._liveStats:
+            if any( col in keys for col in live.columns ):
+                # Take the old values out now, and put the new ones in after
+                live._add_row( row, remove = True )
+                changing.append( ( live, None ) )
+            #
+        #/for live in self._liveStats
+        return changing
+    #/def _on_rowChanging
+    
+    def _on_rowChanged(
+        self: Self,
+        row: int,
+        changing: list[ tuple[ "tuple[ str, ... ] | LiveSecondOrderStats", any ] ]
+        ) -> None:
+        """
+            After the values in an existing `row` changed, with what ``._on_rowChanging()`` gave before
+        """
+        from bisect import insort
+        for cols, old_key in changing:
+            if isinstance( cols, LiveSecondOrderStats ):
+                cols._add_row( row )
+                continue
+            #
+            index: dict[ any, list[ int ] ] | None = self._indexes[ cols ]
+            if index is None:
+                continue
+            #
+            new_key: any = self._index_key( cols, row )
+            if new_key == old_key:
+                continue
+            #
+            index[ old_key ].remove( row )
+            if not index[ old_key ]:
+                del index[ old_key ]
+            #
+            try:
+                insort( index.setdefault( new_key, [] ), row )
+            #
+            except TypeError:
+                # An unhashable value can't be indexed; drop the index, and search instead
+                del self._indexes[ cols ]
+            #
+        #/for cols, old_key in changing
+        
+        self._check_sortedAt( row )
+        return
+    #/def _on_rowChanged
+    
+    def _on_rowsShifted( self: Self ) -> None:
+        """
+            Rows were inserted or removed, moving the positions of others
+        """
+        for cols in self._indexes:
+            self._indexes[ cols ] = None
+        #
+        return
+    #/def _on_rowsShifted
+    
+    def _on_rowInserted( self: Self, row: int ) -> None:
+        """
+            A placeholder `row` was inserted, before its values are set as a change to an existing row
+        """
+        self._on_rowsShifted()
+        for live in self._liveStats:
+            live._add_row( row )
+        #
+        return
+    #/def _on_rowInserted
+    
+    def _on_rowsRemoving( self: Self, rows: Iterable[ int ] ) -> None:
+        """
+            Before `rows` are removed. ``._on_rowsShifted()`` follows
+        """
+        if self._liveStats:
+            rows = list( rows )
+        #
+        for live in self._liveStats:
+            for i in rows:
+                live._add_row( i, remove = True )
+            #
+        #
+        return
+    #/def _on_rowsRemoving
+    
+    def _on_fixedChanged( self: Self, col: str ) -> None:
+        """
+            The fixed value of `col` changed, and so every row
+        """
+        for cols in self._indexes:
+            if col in cols:
+                self._indexes[ cols ] = None
+            #
+        #
+        for live in self._liveStats:
+            if col in live.columns:
+                live._stale = True
+            #
+        #
+        return
+    #/def _on_fixedChanged
+    
+    # -- Getting and Iterating
+    
+    def __iter__( self: Self ) -> "DataFrameIterator":
+        """
+            Goes through by row giving each row as a dictionary
+        """
+        return DataFrameIterator( self )
+    #
+    
+    def _iter_col( self: Self, col: str ) -> Iterator[ any ]:
+        """
+            The values of `col` in order, decoded from `shiftIndex` codes as needed
+        """
+        if col in self._fixed:
+            return repeat( self._fixed[ col ], len( self ) )
+        #
+        if col in self._shiftIndex:
+            decode: dict[ int | None, any ] = dict(
+                enumerate( self._shiftIndex[ col ] )
+            ) | { None: None }
+            return map( decode.__getitem__, self._shift[ col ] )
+        #
+        if col in self._shift:
+            return iter( self._shift[ col ] )
+        #
+        raise KeyError( col )
+    #/def _iter_col
+    
+    def iter_tuples(
+        self: Self,
+        columns: Sequence[ str ] | None = None
+        ) -> Iterator[ tuple ]:
+        """
+            :param Sequence[ str ]|None columns: Columns to give, in order. Default is all, as in ``.keys()``
+            :returns: Each row as a plain tuple of the values of `columns`
+            :rtype: Iterator[ tuple ]
+            
+            Much faster than iterating over the df, since no dicts are built
+        """
+        if columns is None:
+            columns = self.keys()
+        #
+        if len( columns ) == 0:
+            return repeat( (), len( self ) )
+        #
+        return zip( *[ self._iter_col( col ) for col in columns ] )
+    #/def iter_tuples
+    
+    def _iter_rowDicts( self: Self ) -> Iterator[ dict[ str, any ] ]:
+        """
+            Each row as a new dict, as from iterating over self, but built from ``.iter_tuples()``. What callable jyFilters get
+        """
+        keys: list[ str ] = self.keys()
+        return ( dict( zip( keys, values ) ) for values in self.iter_tuples( keys ) )
+    #/def _iter_rowDicts
+    
+    def iter_rowProxy( self: Self ) -> Generator[ "RowProxy", None, None ]:
+        """
+            :returns: The same `RowProxy` over and over, moved to each row in turn
+            :rtype: Generator[ RowProxy, None, None ]
+            
+            Reads values from the columns only as they're asked for. Since the proxy is reused, use ``dict( proxy )`` to keep a row
+        """
+        proxy: RowProxy = RowProxy( self )
+        for i in range( len( self ) ):
+            proxy._row = i
+            yield proxy
+        #
+        return
+    #/def iter_rowProxy
+    
+    def iter_batches( self: Self, size: int ) -> Generator[ Self, None, None ]:
+        """
+            :param int size: Number of rows in each batch; the last may be short
+            :returns: Consecutive dfs of `size` rows, as views of self without copying. See ``._select_rows_andColumns()``
+            :rtype: Generator[ DataFrame, None, None ]
+        """
+        if size < 1:
+            raise ValueError("Bad size={}".format( size ))
+        #
+        for start in range( 0, len( self ), size ):
+            yield self._select_rows_andColumns(
+                rows = range( start, min( start + size, len( self ) ) )
+            )
+        #
+        return
+    #/def iter_batches
+    
+    def _item_by_rowCol(
+        self: Self,
+        row: int,
+        col: str
+        ) -> any:
+        if col in self._fixed:
+            return self._fixed[ col ]
+        #
+        elif col in self._shiftIndex:
+            code: int | None = self._shift[ col ][ row ]
+            return self._shiftIndex[ col ][ code ] if code is not None else None
+        #
+        elif col in self._shift:
+            return self._shift[ col ][ row ]
+        #
+        else:
+            raise Exception("Bad col={}".format( col ))
+        #
+    #/def _item_by_rowCol
+    
+    def _select_rows_andColumns(
+        self: Self,
+        rows: list[ int ] = [],
+        columns: list[ str ] = []
+        ) -> Self:
+        """
+            :param list[ int ] rows: Which rows to get. Default is all.
+            :param list[ str ] col: Which columns to get. Default is all.
+            
+            Returns a new table of the given rows and columns. Used primarily by ``.__getitem__()``
             
-            Returns a new table copy of the given rows and columns. Used primarily by ``.__getitem__()``
+            The new table is a view: its columns are `_ColumnView`s reading through to ours without copying. If it writes to a column it copies its rows first, and if we change a column in place we first detach its live views, so neither sees the other's changes. See ``.materialize()`` to copy up front
         """
-        from copy import deepcopy
-        
-        if rows == []:
-            rows = [ i for i in range( len(self) ) ]
+        all_rows: bool = len( rows ) == 0
+        if all_rows:
+            rows = range( len( self ) )
         #
         
-        if columns == []:
+        if len( columns ) == 0:
             columns = self.keys()
         #
         
@@ -255,24 +2030,30 @@ class DataFrame():
             key: val for key, val in self._fixed.items() if key in columns
         }
         
-        shift = {
-            col: [
-                self._shift[ col ][ i ] for i in rows
-            ] for col in columns if col in self._shift
-        }
-        
-        # Need all shiftIndex values
-        shiftIndex = {
-            col: self._shiftIndex[ col ] for col in columns if col in self._shiftIndex
-        }
-        return DataFrame(
+        df: DataFrame = DataFrame(
             fixed = fixed,
-            shift = shift,
-            shiftIndex = shiftIndex,
-            schema = deepcopy( self._schema ),
-            meta = deepcopy( self._meta ),
-            customTypes = deepcopy( self._customTypes )
+            shift = {},
+            shiftIndex = {},
+            schema = dict( self._schema ),
+            meta = dict( self._meta ),
+            customTypes = dict( self._customTypes )
         )
+        self._view_columns( df, [ col for col in columns if col in self._shift ], rows )
+        if self._sortedBy in columns:
+            df._sortedBy = self._sortedBy
+        #
+        if not all_rows:
+            if df.get_sortedBy() is not None and any(
+                rows[ i ] > rows[ i + 1 ] for i in range( len( rows ) - 1 )
+            ):
+                df.set_sortedBy( None )
+            #
+        #/if not all_rows
+        # Typed storage applies from the first write, instead of converting now
+        df._typed = self._typed
+        df._len = len( rows )
+        df.shape = ( df._len, len( df._fixed ) + len( df._shift ) )
+        return df
     #/def _select_rows_andColumns
     
     def __getitem__(
@@ -291,7 +2072,7 @@ class DataFrame():
         
             `df[ row: int, col: str ] -> any` A single item at a location
 
-            `df[ col: str ] -> list` The entire column of values
+            `df[ col: str ] -> list` The entire column of values. A column stored as a list is given as is, so changing it changes the df. Other storage (typed arrays, memory mapped files, views, run length columns) is read into a new list, so set values with `df[ row, col ] = ...` instead
 
             `df[ row: int ] -> dict[ str, any ]` One row as a dictionary with all keys
 
@@ -357,7 +2138,7 @@ class DataFrame():
                     }
                     for col in item:
                         if item[ col ] is not None and col in self._shiftIndex:
-                            item[ col ] == self._shiftIndex[ col ][
+                            item[ col ] = self._shiftIndex[ col ][
                                 item[ col ]
                             ]
                         #/if item[ col ] is not None and col in self._shiftIndex
@@ -395,11 +2176,18 @@ class DataFrame():
             # Name a column
             if index in self._shiftIndex:
                 return [
-                    self._shiftIndex[ index ][ val ] for val in self._shift[ index ]
+                    self._shiftIndex[ index ][ val ] if val is not None else None\
+                        for val in self._shift[ index ]
                 ]
             #
             elif index in self._shift:
-                return self._shift[ index ]
+                column: Sequence = self._shift[ index ]
+                if not isinstance( column, list ):
+                    # Typed, memory mapped, viewed or run length storage, read into a new list
+                    return list( column )
+                #
+                # Our own copy of the rows, so changing it can't reach another df or a view
+                return self._column_forWrite( index )
             #
             else:
                 raise Exception("Bad column={}".format(index))
@@ -463,14 +2251,29 @@ class DataFrame():
             The dictionary, ready to be saved to the disk as json
             
             Saves types as their stringified version (if the types are serializable)
+            
+            A `RunLengthColumn` is saved as a list of `[ value, length ]` runs, with its name in `"_shiftRun"`. Versions without `RunLengthColumn` would read the runs as values, so only use them for files read by this version or later
         """
-        return {
+        dfDict: DataFrameDict = {
             "_fixed": self._fixed,
-            "_shift": self._shift,
+            "_shift": {
+                col: [
+                    list( run ) for run in zip( val.values, val.lengths() )
+                ] if isinstance( val, RunLengthColumn ) else _column_asList(
+                    val
+                ) for col, val in self._shift.items()
+            },
             "_shiftIndex": self._shiftIndex,
             "_schema": schema_to_dict( self._schema ),
             "_meta": self._meta
         }
+        shiftRun: list[ str ] = [
+            col for col, val in self._shift.items() if isinstance( val, RunLengthColumn )
+        ]
+        if shiftRun:
+            dfDict["_shiftRun"] = shiftRun
+        #
+        return dfDict
     #/def as_dict
     
     def __str__( self ):
@@ -494,13 +2297,14 @@ class DataFrame():
         elif col in self._shiftIndex:
             # Indexd value, from ._shiftIndex
             return (
-                self._shiftIndex[ val ] for val in self._shift[ col ]
+                self._shiftIndex[ col ][ val ] if val is not None else None\
+                    for val in self._shift[ col ]
             )
         #
         elif col in self._shift and col not in self._shiftIndex:
             #
             return (
-                val for val in self._shiftIndex[ col ]
+                val for val in self._shift[ col ]
             )
         else:
             raise ValueError("No col={} in self.keys()={}".format(col, self.keys()))
@@ -515,13 +2319,83 @@ class DataFrame():
         }
     #/def to_colGenerators
     
+    def series_for_col(
+        self: Self,
+        col: str,
+        categorical: bool = False
+    ) -> pl.Series:
+        """
+            :param str col: Column to convert
+            :param bool categorical: If `True`, string `shiftIndex` columns become `pl.Categorical` instead of `pl.Enum`
+            :rtype: pl.Series
+            
+            Builds the column as one `pl.Series`, from whole buffers rather than value by value, with the type from `._schema` if present
+            
+            - `fixed`: The value repeated by polars, not as a python list
+            - `shiftIndex`: If the values are distinct strings, and `._schema` doesn't give another type, the codes are cast straight to `pl.Enum` (or `pl.Categorical`). Otherwise, the values are gathered by the codes
+            - `shift`: The list or typed buffer as is, or the value of each run of a `RunLengthColumn` repeated by polars
+        """
+        dtype: pl.DataType | None = self._schema.get( col )
+        if col in self._fixed:
+            return pl.Series(
+                col, [ self._fixed[ col ] ], dtype = dtype
+            ).new_from_index( 0, len( self ) )
+        #
+        elif col in self._shiftIndex:
+            values: list = self._shiftIndex[ col ]
+            codes: pl.Series = pl.Series(
+                col, _copy_column( self._shift[ col ] ) if isinstance(
+                    self._shift[ col ], _ColumnView
+                ) else self._shift[ col ], dtype = pl.UInt32
+            )
+            if (
+                dtype is None or dtype.base_type() in ( pl.Categorical, pl.Enum )
+            ) and all(
+                isinstance( val, str ) for val in values
+            ) and len( set( values ) ) == len( values ):
+                series: pl.Series = codes.cast( pl.Enum( values ) )
+                if categorical or ( dtype is not None and dtype.base_type() is pl.Categorical ):
+                    series = series.cast( pl.Categorical )
+                #
+                return series
+            #
+            return pl.Series(
+                col, values, dtype = dtype
+            ).gather( codes ).alias( col )
+        #
+        elif col in self._shift:
+            if isinstance( self._shift[ col ], RunLengthColumn ):
+                # Each run's value repeated by polars
+                column: RunLengthColumn = self._shift[ col ]
+                runs: pl.Series = pl.int_range(
+                    len( column.values ), eager = True, dtype = pl.UInt32
+                ).repeat_by(
+                    pl.Series( column.lengths(), dtype = pl.UInt32 )
+                ).explode()
+                return pl.Series(
+                    col, column.values, dtype = dtype
+                ).gather( runs ).alias( col )
+            #
+            return pl.Series(
+                col, _copy_column( self._shift[ col ] ) if isinstance(
+                    self._shift[ col ], _ColumnView
+                ) else self._shift[ col ], dtype = dtype
+            )
+        #
+        else:
+            raise ValueError("No col={} in self.keys()={}".format(col, self.keys()))
+        #/switch col
+    #/def series_for_col
+    
     def to_polars(
         self: Self,
         *args,
+        categorical: bool = False,
         **kwargs
     ) -> pl.DataFrame:
         """
             :param *args: Passed to :py:func:`pl.DataFrame`
+            :param bool categorical: If `True`, string `shiftIndex` columns become `pl.Categorical` instead of `pl.Enum`
             :param *kwargs: Passed to :py:func:`pl.DataFrame`
                 Includes:
                     - :param pl.SchemaDict|None schema_overrides: `= None`
@@ -531,11 +2405,12 @@ class DataFrame():
                     - :param bool nan_to_null: `= False`
             :rtype: pl.DataFrame
             
-            Gets data from self, and schema from `self._schema`
+            Gets data from self, and schema from `self._schema`. Each column is built whole by ``.series_for_col()``, so `shiftIndex` columns come straight from their codes, and `fixed` values are never repeated as python objects. See ``from_polars()`` for the reverse
         """
         return pl.DataFrame(
-            data = self.to_colGenerators(),
-            schema = self._schema,
+            [
+                self.series_for_col( col, categorical = categorical ) for col in self.keys()
+            ],
             *args,
             **kwargs
         )
@@ -557,6 +2432,168 @@ class DataFrame():
         )
     #/def does_matchIndex
     
+    def _matchingIndices_forDict(
+        self: Self,
+        jyFilter: dict[ str, any ]
+        ) -> list[ int ]:
+        """
+            :param dict[ str, any ] jyFilter: Values every matching row must equal
+            :returns: Indices of matching rows, in order
+            :rtype: list[ int ]
+            
+            Evaluates a dict jyFilter by column, without building any rows:
+            
+            - `fixed` keys are checked once, for the whole df
+            - `shiftIndex` keys become one code lookup, then a search of the code column for that integer
+            - `shift` keys search only their own column
+            
+            If an index from ``.create_index()`` covers some of the keys, its rows are the starting point. Otherwise, the first shift key is searched in full. Later keys only check the rows still matching
+        """
+        shift_items: list[ tuple[ str, any ] ] = []
+        for key, val in jyFilter.items():
+            if key in self._fixed:
+                if not self._fixed[ key ] == val:
+                    return []
+                #
+            #
+            elif key in self._shift:
+                shift_items.append( ( key, val ) )
+            #
+            else:
+                raise KeyError( key )
+            #/switch key
+        #/for key, val in jyFilter.items()
+        
+        matches: list[ int ] | None = None
+        index_cols: tuple[ str, ... ] | None = self._index_forFilter( jyFilter )
+        if index_cols is not None:
+            try:
+                matches = list(
+                    self._get_index( index_cols ).get(
+                        self._filter_indexKey( index_cols, jyFilter ), []
+                    )
+                )
+            #
+            except TypeError:
+                # Unhashable filter value; search instead
+                matches = None
+            #/try matches = ...
+            if matches is not None:
+                if not matches:
+                    return []
+                #
+                shift_items = [
+                    ( key, val ) for key, val in shift_items if key not in index_cols
+                ]
+            #/if matches is not None
+        #/if index_cols is not None
+        
+        for key, val in shift_items:
+            target: any = val
+            if key in self._shiftIndex and val is not None:
+                target = self._find_shiftIndexCode( key, val )
+                if target is None:
+                    # Value isn't anywhere in the column
+                    return []
+                #
+            #/if key in self._shiftIndex and val is not None
+            column: Sequence = self._shift[ key ]
+            if matches is None:
+                matches = _positions_ofValue( column, target )
+            #
+            else:
+                matches = [ i for i in matches if column[ i ] == target ]
+            #/if matches is None/else
+            if not matches:
+                return []
+            #
+        #/for key, val in shift_items
+        
+        if matches is None:
+            # Only fixed keys, all matching
+            return list( range( len( self ) ) )
+        #
+        return matches
+    #/def _matchingIndices_forDict
+    
+    def _filter_indexKey(
+        self: Self,
+        cols: tuple[ str, ... ],
+        jyFilter: dict[ str, any ]
+        ) -> any:
+        if len( cols ) == 1:
+            return jyFilter[ cols[0] ]
+        #
+        return tuple( jyFilter[ col ] for col in cols )
+    #/def _filter_indexKey
+    
+    def _take_rows(
+        self: Self,
+        rows: list[ int ]
+        ) -> Self:
+        """
+            :param list[ int ] rows: Indices of the rows to take, in order
+            :returns: A new df with those rows, and copies of `fixed`, schema and meta
+            :rtype: DataFrame
+            
+            Gathers each column by `rows` in one pass. `shiftIndex` columns are re-indexed to only the values present, in order of appearance, just as appending the rows one by one would give
+            
+            A `None` in `rows` gives `None` in every shift column, as for an unmatched row of a join
+        """
+        has_null: bool = None in rows
+        shift: dict[ str, list ] = {}
+        shiftIndex: dict[ str, list ] = {}
+        for col, column in self._shift.items():
+            if col in self._shiftIndex:
+                values: list = self._shiftIndex[ col ]
+                remap: dict[ int, int ] = {}
+                new_values: list = []
+                codes: list[ int | None ] = []
+                for i in rows:
+                    code: int | None = column[ i ] if i is not None else None
+                    if code is None:
+                        codes.append( None )
+                        continue
+                    #
+                    if code not in remap:
+                        remap[ code ] = len( new_values )
+                        new_values.append( values[ code ] )
+                    #
+                    codes.append( remap[ code ] )
+                #/for i in rows
+                shift[ col ] = codes
+                shiftIndex[ col ] = new_values
+            #
+            elif has_null:
+                shift[ col ] = [ column[ i ] if i is not None else None for i in rows ]
+            #
+            else:
+                shift[ col ] = [ column[ i ] for i in rows ]
+            #/if col in self._shiftIndex/else
+        #/for col, column in self._shift.items()
+        
+        df: DataFrame = DataFrame(
+            fixed = dict( self._fixed ),
+            shift = shift,
+            shiftIndex = shiftIndex,
+            schema = dict( self._schema ),
+            meta = dict( self._meta ),
+            typed = self._typed
+        )
+        df._len = len( rows )
+        df.shape = ( df._len, df.shape[1] )
+        df._sortedBy = self._sortedBy
+        if df.get_sortedBy() is not None and has_null:
+            df.set_sortedBy( None )
+        #
+        elif df.get_sortedBy() is not None and any(
+            rows[ i ] > rows[ i + 1 ] for i in range( len( rows ) - 1 )
+        ):
+            df.set_sortedBy( None )
+        #
+        return df
+    #/def _take_rows
+    
     def any_matchingIndices(
         self: Self,
         jyFilter: JyFilter
@@ -564,11 +2601,8 @@ class DataFrame():
         """
             Says if at least one row matches jyFilter
         """
-        if isinstance( jyFilter, dict ):
-            fixed_keys = [ key for key in jyFilter if key in self._fixed ]
-            if not all( self._fixed[key] == jyFilter[key] for key in fixed_keys ):
-                return False
-            #
+        if isinstance( jyFilter, dict | Expr ):
+            return len( self.get_matchingIndices( jyFilter ) ) > 0
         #
         
         return any(
@@ -588,16 +2622,20 @@ class DataFrame():
             Get a list of indices which match jyFilter
         """
         if isinstance( jyFilter, dict ):
-            fixed_keys = [ key for key in jyFilter if key in self._fixed ]
-            if not all( self._fixed[key] == jyFilter[key] for key in fixed_keys ):
-                return []
+            return self._matchingIndices_forDict( jyFilter )
+        #
+        if isinstance( jyFilter, Expr ):
+            sorted_range: range | None = self._sortedRange_forExpr( jyFilter )
+            if sorted_range is not None:
+                return list( sorted_range )
             #
+            return _truthy_positions( jyFilter._evaluate( self ), len( self ) )
         #
         
         return [
-            index for index in range( len( self ) ) if self.does_matchIndex(
-                jyFilter = jyFilter,
-                index = index
+            i for i, row in enumerate( self._iter_rowDicts() ) if row_does_matchJyFilter(
+                row = row,
+                jyFilter = jyFilter
             )
         ]
     #/def get_matchingIndices
@@ -633,6 +2671,11 @@ class DataFrame():
         #/switch type( row )
         
         updated_shift: bool = False
+        
+        changing: list = []
+        if index < len( self ):
+            changing = self._on_rowChanging( index, row )
+        #
     
         for key, val in row.items():
             if key in self._fixed:
@@ -642,6 +2685,9 @@ class DataFrame():
                 else:
                     # 2025-02-21: We now support updating the fixed value
                     # It's "fixed" in the sense that it's the same for every row
+                    if self._fixed[ key ] != val:
+                        self._on_fixedChanged( key )
+                    #
                     self._fixed[ key ] = val
                 #/if self._fixed[ key ] is None/else
             else:
@@ -654,21 +2700,15 @@ class DataFrame():
                     raise Exception("Bad key")
                 #
                 if val is None:
-                    self._shift[ key ][ index ] = val
+                    self._set_toColumn( key, index, val )
                 #
                 elif key in self._shiftIndex:
-                    newvalue_index: int
-                    if val in self._shiftIndex[ key ]:
-                        newvalue_index = self._shiftIndex[ key ].index( val )
-                    #
-                    else:
-                        newvalue_index = len( self._shiftIndex[ key ] )
-                        self._shiftIndex[ key ].append( val )
-                    #
-                    self._shift[ key ][ index ] = newvalue_index
+                    self._set_toColumn(
+                        key, index, self._get_shiftIndexCode( key, val )
+                    )
                 #
                 else:
-                    self._shift[ key ][ index ] = val
+                    self._set_toColumn( key, index, val )
                 #/switch val/key
                 updated_shift = True
             #/if key in self._fixed/else
@@ -676,8 +2716,9 @@ class DataFrame():
         if index == len( self ) and updated_shift:
             self._len += 1
             self.shape = ( self._len, self.shape[1] )
+            self._on_rowsAppended( index )
         elif index < len( self ):
-            ...
+            self._on_rowChanged( index, changing )
         else:
             raise Exception("Bad index={} for updating len={}".format( index, len( self ) ))
         #/switch index
@@ -690,6 +2731,7 @@ class DataFrame():
         newvalue: any
         ) -> None:
         self._fixed[ col ] = newvalue
+        self._on_fixedChanged( col )
         return
     #/def _set_fixed
     
@@ -881,7 +2923,7 @@ class DataFrame():
             # newvalue can be a list of dictionaries,
             #  or perhaps a DataFrame. Either way, iterate through
             #  and add to the rows
-            rows: list[ int ] = self._list_fromSlice( index )
+            rows: range = self._list_fromSlice( index )
             self._setItem_withDuple(
                 newvalue = newvalue,
                 rows = rows
@@ -948,9 +2990,16 @@ class DataFrame():
         #
         
         for key in self._shift.keys():
-            self._shift[ key ].insert( index, None )
+            if isinstance( self._shift[ key ], array | memoryview ) and key in newvalue:
+                # Placeholder the typed column can hold, set below
+                self._column_forWrite( key ).insert( index, 0 )
+            #
+            else:
+                self._untype_column( key ).insert( index, None )
+            #/if isinstance( self._shift[ key ], array ) and key in newvalue/else
         #
         self._len += 1
+        self._on_rowInserted( index )
         self.__setitem__( index = index, newvalue = newvalue )
         return
     #/def insert
@@ -971,16 +3020,26 @@ class DataFrame():
             limit = len( self )
         #
         
-        if isinstance( jyFilter, dict ):
-            # Convert dict to proper selection
-            _lambda = lambda _row: all( _row[ key ] == val for key, val in jyFilter.items() )
-        #
-        else:
-            _lambda = jyFilter
-        #
-        
         update_count: int = 0
         
+        if isinstance( jyFilter, dict | Expr ):
+            for i in self.get_matchingIndices( jyFilter )[ :limit ]:
+                if verbose > 2:
+                    print("[{}] -> {}".format(i, row))
+                #
+                for key, val in row.items():
+                    self[ i, key ] = val
+                #
+                update_count += 1
+            #/for i in self.get_matchingIndices( jyFilter )[ :limit ]
+            if verbose > 0:
+                print("Updated {} rows".format( update_count ) )
+            #
+            return
+        #/if isinstance( jyFilter, dict | Expr )
+        
+        _lambda = jyFilter
+        
         for i in range( len( self ) ):
             if _lambda( self[ i ] ):
                 if verbose > 2:
@@ -1039,20 +3098,14 @@ class DataFrame():
                     continue
                 #
                 if val is None:
-                    self._shift[ key ].append( val )
+                    self._append_toColumn( key, val )
                 elif key in self._shiftIndex:
-                    newvalue_index: int
-                    if row[ key ] in self._shiftIndex[ key ]:
-                        newvalue_index = self._shiftIndex[ key ].index( row[ key ] )
-                    #
-                    else:
-                        newvalue_index = len( self._shiftIndex[ key ] )
-                        self._shiftIndex[ key ].append( row[ key ] )
-                    #
-                    self._shift[ key ].append( newvalue_index )
+                    self._append_toColumn(
+                        key, self._get_shiftIndexCode( key, val )
+                    )
                 #
                 elif key in self._shift:
-                    self._shift[ key ].append( row[ key ] )
+                    self._append_toColumn( key, row[ key ] )
                 #
                 # else: guaranteed to be in self.fixed and matching
                 #    due to earlier check
@@ -1064,30 +3117,25 @@ class DataFrame():
                 if key in row:
                     val = row[ key ]
                     if val is None:
-                        self._shift[ key ].append( val )
+                        self._append_toColumn( key, val )
                     #
                     elif key in self._shiftIndex:
-                        newvalue_index: int
-                        if val in self._shiftIndex[ key ]:
-                            newvalue_index = self._shiftIndex[ key ].index( val )
-                        #
-                        else:
-                            newvalue_index = len( self._shiftIndex[ key ] )
-                            self._shiftIndex[ key ].append( val )
-                        #
-                        self._shift[ key ].append( newvalue_index )
+                        self._append_toColumn(
+                            key, self._get_shiftIndexCode( key, val )
+                        )
                     #
                     else:
-                        self._shift[ key ].append( val )
+                        self._append_toColumn( key, val )
                     #/switch val/key
                 #
                 else:
-                    self._shift[ key ].append( None )
+                    self._append_toColumn( key, None )
                 #/if key in row/else
             #/for key in self._shift.keys()
         #/if strict/else
         self._len += 1
         self.shape = ( self._len, self.shape[1])
+        self._on_rowsAppended( self._len - 1 )
         return
     #/def append
     
@@ -1098,16 +3146,180 @@ class DataFrame():
         ) -> None:
         """
             Extend with a DataFrame, or something like a list of dictionaries
+            
+            Either way the rows are added column by column; see ``.extend_columns()``
         """
-        for val in newvalue:
-            self.append(
-                val,
-                strict = strict
-            )
+        if isinstance( newvalue, DataFrame | dict | pl.DataFrame ):
+            self.extend_columns( newvalue, strict = strict )
+            return
         #
+        
+        rows: list[ dict[ str, any ] ] = list( newvalue )
+        if strict:
+            keys: list[ str ] = self.keys()
+            for row in rows:
+                if not all( key in keys for key in row ):
+                    raise ValueError(
+                        "Extra keys in row: got {}, expected {}".format(
+                            list( row.keys() ), keys
+                        )
+                    )
+                #
+            #/for row in rows
+        #/if strict
+        for key, val in self._fixed.items():
+            for row in rows:
+                if key in row and row[ key ] != val:
+                    raise ValueError(
+                        "Mismatch: row['{}']={}, self._fixed['{}']={}".format(
+                            key, row[ key ], key, val
+                        )
+                    )
+                #
+            #/for row in rows
+        #/for key, val in self._fixed.items()
+        self.extend_columns(
+            { key: [ row.get( key ) for row in rows ] for key in self._shift }
+        )
         return
     #/def extend
     
+    def extend_columns(
+        self: Self,
+        data: dict[ str, Sequence ] | Self | pl.DataFrame,
+        strict: bool = False
+        ) -> None:
+        """
+            :param dict[ str, Sequence ]|DataFrame|pl.DataFrame data: Rows to add, as lists by column, or another frame
+            :param bool strict: If `True`, raise on columns of `data` missing from self. If `False`, they're ignored
+            
+            Appends the rows of `data` column by column. Shift columns missing from `data` get `None`, and values for fixed columns have to match, like with ``.append()``.
+            
+            From another `DataFrame`, its shiftIndex values are merged into ours once, and its codes remapped in bulk, without decoding each row
+        """
+        if isinstance( data, pl.DataFrame ):
+            data = data.to_dict( as_series = False )
+        #
+        
+        source: DataFrame | None = None
+        n: int
+        if isinstance( data, DataFrame ):
+            source = data
+            n = len( source )
+            columns: list[ str ] = source.keys()
+        #
+        else:
+            lengths: set[ int ] = { len( values ) for values in data.values() }
+            if len( lengths ) > 1:
+                raise ValueError(
+                    "Columns have different lengths: {}".format(
+                        { key: len( values ) for key, values in data.items() }
+                    )
+                )
+            #
+            n = lengths.pop() if lengths else 0
+            columns = list( data.keys() )
+        #/if isinstance( data, DataFrame )/else
+        
+        if strict:
+            keys: list[ str ] = self.keys()
+            if not all( key in keys for key in columns ):
+                raise ValueError(
+                    "Extra keys in data: got {}, expected {}".format( columns, keys )
+                )
+            #
+        #/if strict
+        if n == 0:
+            return
+        #
+        
+        # Check everything before changing anything
+        for key, val in self._fixed.items():
+            if key not in columns:
+                continue
+            #
+            if source is not None and key in source._fixed:
+                mismatch: bool = source._fixed[ key ] != val
+            #
+            elif source is not None:
+                mismatch = any( item != val for item in source.generator_for_col( key ) )
+            #
+            else:
+                mismatch = any( item != val for item in data[ key ] )
+            #/switch source, key
+            if mismatch:
+                raise ValueError(
+                    "Mismatch: data['{}'] has values other than self._fixed['{}']={}".format(
+                        key, key, val
+                    )
+                )
+            #/if mismatch
+        #/for key, val in self._fixed.items()
+        
+        start: int = len( self )
+        values: Sequence
+        for key in self._shift:
+            if key not in columns:
+                self._extend_column( key, [ None ]*n )
+                continue
+            #
+            if source is not None:
+                self._extend_column( key, self._codes_fromFrame( key, source ) )
+                continue
+            #
+            values = data[ key ]
+            if key in self._shiftIndex:
+                values = [
+                    self._get_shiftIndexCode( key, val ) if val is not None else None
+                    for val in values
+                ]
+            #
+            self._extend_column( key, values )
+        #/for key in self._shift
+        self._len += n
+        self.shape = ( self._len, self.shape[1] )
+        self._on_rowsAppended( start )
+        return
+    #/def extend_columns
+    
+    def _codes_fromFrame(
+        self: Self,
+        col: str,
+        source: Self
+        ) -> Sequence:
+        """
+            The raw values of `col` in `source`, ready to extend `._shift[ col ]` with. When both are shiftIndex columns, each distinct value of `source` is looked up once, and its codes remapped
+        """
+        if col in source._fixed:
+            val: any = source._fixed[ col ]
+            if val is not None and col in self._shiftIndex:
+                val = self._get_shiftIndexCode( col, val )
+            #
+            return [ val ]*len( source )
+        #
+        
+        column: Sequence = source._shift[ col ]
+        if col in source._shiftIndex:
+            remap: list = [
+                self._get_shiftIndexCode( col, val ) if col in self._shiftIndex else val
+                for val in source._shiftIndex[ col ]
+            ]
+            if col in self._shiftIndex and remap == list( range( len( remap ) ) ):
+                # Same dictionary, so the codes carry over as they are
+                return column
+            #
+            return [ remap[ code ] if code is not None else None for code in column ]
+        #/if col in source._shiftIndex
+        
+        if col in self._shiftIndex:
+            return [
+                self._get_shiftIndexCode( col, val ) if val is not None else None
+                for val in column
+            ]
+        #
+        return column
+    #/def _codes_fromFrame
+    
     def makeColumn_shift(
         self: Self,
         col: str
@@ -1121,6 +3333,9 @@ class DataFrame():
         if col in self._fixed:
             self._shift[ col ] = [ self._fixed[ col ] ]*len( self )
             del self._fixed[ col ]
+            if self._typed:
+                self._type_column( col )
+            #
             return
         #
         raise Exception("Missing from keys col={}".format(col))
@@ -1129,25 +3344,35 @@ class DataFrame():
     def addColumn(
         self: Self,
         col: str,
-        values: list,
+        values: list | Expr,
         dtype: pl.DataType | str | None = None
         ) -> None:
         """
             :param str col: Name for the new column
-            :param list values: A new literal column of values. Have `len(values) == len(self)`
+            :param list|Expr values: A new literal column of values. Have `len(values) == len(self)`. Or, an expression to derive the column from others
             :param type|str|None dtype: A type for the new column. If `None` (the default), nothing gets added to `._schema`
             
             Add a new column as the exact list of values
+            
+            A column from an expression keeps its layout: constant values go in `fixed`, and values derived from a `shiftIndex` column go in `shiftIndex`
         """
         from copy import deepcopy
         if col in self.keys():
             raise ValueError(
                 "Already have {} in self.keys()={}".format(
-                    self.keys()
+                    col, self.keys()
                 )
             )
         #/if col in self.keys()
         
+        if isinstance( values, Expr ):
+            self._addColumn_fromExpr( col, values )
+            if dtype is not None:
+                self._schema[ col ] = _infer_dataType( dtype )
+            #
+            return
+        #/if isinstance( values, Expr )
+        
         if not isinstance( values, list ):
             raise TypeError(
                 "Expected type(values)=list, got type(values)={}".format(
@@ -1170,20 +3395,143 @@ class DataFrame():
         if dtype is not None:
             self._schema[ col ] = _infer_dataType( dtype )
         #
+        if self._typed:
+            self._type_column( col )
+        #
         return
     #/def addColumn
     
+    def _addColumn_fromExpr(
+        self: Self,
+        col: str,
+        expr: Expr
+        ) -> None:
+        """
+            Adds the values of `expr` as a new column, in `fixed`, `shiftIndex`, or `shift` as it was evaluated
+        """
+        evaluated: Evaluated = expr._evaluate( self )
+        if evaluated[0] == "fixed":
+            self._fixed[ col ] = evaluated[1]
+        #
+        elif evaluated[0] == "coded":
+            _, codes, values = evaluated
+            # Values can repeat, like `True` from several codes; make them distinct
+            distinct: dict[{
+                "shift": list[ int ],
+                "shiftIndex": list
+            }] = _index( values )
+            self._shiftIndex[ col ] = distinct["shiftIndex"]
+            self._sharedIndex.discard( col )
+            self._shiftIndexMap[ col ] = _build_shiftIndexMap( distinct["shiftIndex"] )
+            self._shift[ col ] = [
+                distinct["shift"][ code ] if code is not None else None for code in codes
+            ]
+        #
+        elif evaluated[0] == "runs":
+            self._shift[ col ] = RunLengthColumn( evaluated[1], evaluated[2] )
+        #
+        else:
+            self._shift[ col ] = list( evaluated[1] )
+        #/switch evaluated[0]
+        
+        self.shape = ( self._len, len( self._fixed ) + len( self._shift ) )
+        if self._typed and col in self._shift:
+            self._type_column( col )
+        #
+        return
+    #/def _addColumn_fromExpr
+    
+    def evaluate( self: Self, expr: Expr ) -> list:
+        """
+            :param Expr expr: Expression over the columns of self
+            :returns: The value of `expr` in every row
+            :rtype: list
+        """
+        return expr.evaluate( self )
+    #/def evaluate
+    
+    # -- Grouping
+    
+    def _group_ids(
+        self: Self,
+        groups: Sequence[ str ]
+        ) -> tuple[ list[ int ], list[ tuple ] ]:
+        """
+            :param Sequence[ str ] groups: Columns to group rows by
+            :returns: The group of each row, numbered in order of first appearance, and the values of `groups` for each group
+            :rtype: tuple[ list[ int ], list[ tuple ] ]
+            
+            Works on the stored columns: `shiftIndex` codes are grouped as they are, other shift values by hashing, and fixed columns are the same for every row. Keys are only decoded once per group
+        """
+        for col in groups:
+            if col not in self._fixed and col not in self._shift:
+                raise KeyError( col )
+            #
+        #
+        shift_groups: list[ str ] = [ col for col in groups if col in self._shift ]
+        group_map: dict[ any, int ] = {}
+        ids: list[ int ]
+        if len( self ) == 0:
+            ids = []
+        #
+        elif len( shift_groups ) == 0:
+            group_map[ () ] = 0
+            ids = [ 0 ]*len( self )
+        #
+        elif len( shift_groups ) == 1:
+            ids = [
+                group_map.setdefault( code, len( group_map ) )
+                for code in self._shift[ shift_groups[0] ]
+            ]
+        #
+        else:
+            ids = [
+                group_map.setdefault( codes, len( group_map ) )
+                for codes in zip( *[ self._shift[ col ] for col in shift_groups ] )
+            ]
+        #/switch len( shift_groups )
+        
+        keys: list[ tuple ] = []
+        for codes in group_map:
+            if len( shift_groups ) == 1:
+                codes = ( codes, )
+            #
+            decoded: dict[ str, any ] = dict( zip( shift_groups, codes ) )
+            for col in shift_groups:
+                if col in self._shiftIndex and decoded[ col ] is not None:
+                    decoded[ col ] = self._shiftIndex[ col ][ decoded[ col ] ]
+                #
+            #
+            keys.append( tuple(
+                self._fixed[ col ] if col in self._fixed else decoded[ col ]
+                for col in groups
+            ) )
+        #/for codes in group_map
+        return ids, keys
+    #/def _group_ids
+    
+    def group_by( self: Self, groups: str | Sequence[ str ] ) -> "GroupBy":
+        """
+            :param str|Sequence[ str ] groups: Column, or columns, to group rows by
+            :returns: The grouped rows, to aggregate with ``GroupBy.agg()``
+            :rtype: GroupBy
+        """
+        return GroupBy( self, groups )
+    #/def group_by
+    
     # -- Removal
     
     def __delitem__( self: Self, index: int ) -> None:
         assert isinstance( index, int )
         assert 0 <= index <= len( self ) - 1
         
+        self._on_rowsRemoving( [ index ] )
         for key in self._shift:
-            del self._shift[ key ][ index ]
+            del self._column_forWrite( key )[ index ]
         #
         self._len -= 1
         self.shape = ( self._len, self.shape[1])
+        self._on_rowsShifted()
         return
     #/def __delitem__
     
@@ -1196,7 +3544,7 @@ class DataFrame():
         #   index previously removed
         remove_count: int = 0
         true_index: int
-        for i in index:
+        for i in sorted( set( index ) ):
             true_index = i - remove_count
             self.__delitem__( true_index )
             remove_count += 1
@@ -1204,19 +3552,81 @@ class DataFrame():
         return
     #/def _remove_list
     
+    def _compact_rows(
+        self: Self,
+        keep: list[ bool ]
+        ) -> None:
+        """
+            :param list[ bool ] keep: For each row, if it stays
+            
+            Removes the rows not kept, rebuilding each column in one pass
+        """
+        from itertools import compress
+        
+        self._on_rowsRemoving( i for i in range( len( keep ) ) if not keep[ i ] )
+        column: Sequence
+        for key in self._shift:
+            column = self._shift[ key ]
+            if isinstance( column, array ):
+                self._shift[ key ] = array( column.typecode, compress( column, keep ) )
+            #
+            elif isinstance( column, memoryview ):
+                self._shift[ key ] = array( column.format, compress( column, keep ) )
+            #
+            else:
+                self._shift[ key ] = list( compress( column, keep ) )
+            #
+            self._shared.discard( key )
+        #/for key in self._shift
+        self._len = sum( keep )
+        self.shape = ( self._len, self.shape[1] )
+        self._on_rowsShifted()
+        return
+    #/def _compact_rows
+    
     def remove(
         self: Self,
-        index: int | list[ int ]
+        index: int | list[ int ] | list[ bool ]
         ) -> None:
         """
             Remove a single row, or list of rows. Note that this changes the numeric index of subsequent rows.
+            
+            A list can be row indices, like from ``.get_matchingIndices()``, or a `bool` for every row saying which to remove. Negative indices count from the end, as for a list, and any out of range raises `IndexError` before a row is removed. More than a few rows are removed in a single pass over each column
         """
         if isinstance( index, list ):
-            self._remove_list(
-                index
-            )
+            keep: list[ bool ]
+            if len( index ) > 0 and isinstance( index[0], bool ):
+                if len( index ) != len( self ):
+                    raise ValueError(
+                        "Mask has {} values for {} rows".format( len( index ), len( self ) )
+                    )
+                #
+                keep = [ not remove for remove in index ]
+            #
+            else:
+                n: int = len( self )
+                if index and not ( -n <= min( index ) and max( index ) < n ):
+                    raise IndexError("Bad index={} for len={}".format(
+                        next( i for i in index if not -n <= i < n ), n
+                    ))
+                #
+                if index and min( index ) < 0:
+                    index = [ i + n if i < 0 else i for i in index ]
+                #
+                if len( index ) <= _COMPACT_THRESHOLD:
+                    self._remove_list(
+                        index
+                    )
+                    return
+                #
+                keep = [ True ]*n
+                for i in index:
+                    keep[ i ] = False
+                #
+            #/if len( index ) > 0 and isinstance( index[0], bool )/else
+            self._compact_rows( keep )
             return
-        #
+        #/if isinstance( index, list )
         
         # One index, as an int
         self.__delitem__(
@@ -1230,10 +3640,8 @@ class DataFrame():
         jyFilter: JyFilter
         ) -> None:
         """
+            Remove every row matching `jyFilter`
         """
-        # Have to change indices as we remove them
-        # Since we go from low to high, subtract 1 from the matching index for each
-        #   index previously removed
         matchingIndices: list[ int ] = self.get_matchingIndices(
             jyFilter
         )
@@ -1268,6 +3676,107 @@ class DataFrame():
         
         return
     #/def write_file
+    
+    def write_binary(
+        self: Self,
+        fp: str,
+        encoder: json.JSONEncoder | None = None
+        ) -> None:
+        """
+            :param str fp: File path to write
+            :param json.JSONEncoder|None encoder: Optional custom encoder for the header and any json blocks
+            
+            Writes the df in the binary columnar format, which can be read back with ``read_binary()``
+            
+            `_fixed`, `_schema` and `_meta` go in a small json header. Each shift column, and each code column of `_shiftIndex`, is written as an aligned block of fixed width numbers when all of its values fit one (see ``_binary_typecode()``), which ``read_binary()`` maps into memory without copying. Other columns, and the `_shiftIndex` values, are written as json blocks
+        """
+        import os
+        from sys import byteorder
+        
+        blocks: list[ bytes | memoryview ] = []
+        offset: int = 0
+        
+        def add_block( data: bytes | memoryview ) -> dict[ str, int ]:
+            nonlocal offset
+            padding: int = -offset % _BINARY_ALIGNMENT
+            if padding:
+                blocks.append( bytes( padding ) )
+                offset += padding
+            #
+            block: dict[ str, int ] = {
+                "offset": offset,
+                "nbytes": len( data )
+            }
+            blocks.append( data )
+            offset += len( data )
+            return block
+        #/def add_block
+        
+        def add_jsonBlock( obj: any ) -> dict[ str, any ]:
+            return {
+                "kind": "json"
+            } | add_block(
+                json.dumps( obj, cls = encoder ).encode('utf-8')
+            )
+        #/def add_jsonBlock
+        
+        shift_blocks: dict[ str, dict[ str, any ] ] = {}
+        for col, column in self._shift.items():
+            typecode: str | None = _binary_typecode(
+                column,
+                _SHIFTINDEX_TYPECODE if col in self._shiftIndex else self._typecode_forCol( col )
+            )
+            if typecode is None:
+                shift_blocks[ col ] = add_jsonBlock( _column_asList( column ) )
+            #
+            else:
+                if not isinstance( column, array | memoryview ):
+                    column = array( typecode, column )
+                #
+                shift_blocks[ col ] = {
+                    "kind": "array",
+                    "typecode": typecode
+                } | add_block( memoryview( column ).cast('B') )
+            #/if typecode is None/else
+        #/for col, column in self._shift.items()
+        
+        header: dict[ str, any ] = {
+            "version": _BINARY_VERSION,
+            "byteorder": byteorder,
+            "_len": len( self ),
+            "_fixed": self._fixed,
+            "_schema": schema_to_dict( self._schema ),
+            "_meta": self._meta,
+            "_shift": shift_blocks,
+            "_shiftIndex": {
+                col: add_jsonBlock( val ) for col, val in self._shiftIndex.items()
+            }
+        }
+        header_bytes: bytes = json.dumps( header, cls = encoder ).encode('utf-8')
+        preamble: bytes = _BINARY_MAGIC + len( header_bytes ).to_bytes( 8, 'little' )
+        start: int = len( preamble ) + len( header_bytes )
+        
+        # Columns may be memory mapped from `fp` itself, as from ``read_binary()``, so write beside it and swap it in at the end
+        temp_fp: str = "{}.{}.tmp".format( fp, os.getpid() )
+        try:
+            with open( temp_fp, 'wb' ) as _file:
+                _file.write( preamble )
+                _file.write( header_bytes )
+                _file.write( bytes( -start % _BINARY_ALIGNMENT ) )
+                for data in blocks:
+                    _file.write( data )
+                #
+            #/with open( temp_fp, 'wb' ) as _file
+            os.replace( temp_fp, fp )
+        #
+        except BaseException:
+            if os.path.exists( temp_fp ):
+                os.remove( temp_fp )
+            #
+            raise
+        #/try os.replace( temp_fp, fp )/except BaseException
+        return
+    #/def write_binary
 #/class DataFrame
 
 class DataFrameIterator():
@@ -1287,6 +3796,7 @@ class DataFrameIterator():
             self._index += 1
             return self._df._fixed | {
                 key: self._df._shiftIndex[ key ][ val[ self._index-1 ] ] \
+                    if val[ self._index-1 ] is not None else None \
                     for key, val in self._df._shift.items() if key in self._df._shiftIndex
             } | {
                 key: val[ self._index-1 ] \
@@ -1296,27 +3806,191 @@ class DataFrameIterator():
     #/def __next__
 #/class DataFrameIterator
 
+class RowProxy( Mapping ):
+    """
+        One row of a df, read from the columns as keys are looked up, without building a dict. A read only `Mapping`, like the row dictionaries from iterating over a df
+        
+        Given by ``DataFrame.iter_rowProxy()``, which moves the same proxy from row to row
+    """
+    __slots__ = ( "_df", "_row" )
+    
+    def __init__(
+        self: Self,
+        df: DataFrame,
+        row: int = 0
+        ):
+        self._df = df
+        self._row = row
+    #/def __init__
+    
+    @property
+    def index( self: Self ) -> int:
+        """
+            :returns: Which row of the df the proxy is on
+            :rtype: int
+        """
+        return self._row
+    #
+    
+    def __getitem__( self: Self, key: str ) -> any:
+        if key not in self._df._fixed and key not in self._df._shift:
+            raise KeyError( key )
+        #
+        return self._df._item_by_rowCol( self._row, key )
+    #/def __getitem__
+    
+    def __iter__( self: Self ) -> Iterator[ str ]:
+        return iter( self._df.keys() )
+    #
+    
+    def __len__( self: Self ) -> int:
+        return self._df.shape[1]
+    #
+    
+    def __repr__( self: Self ) -> str:
+        return "RowProxy({})".format( dict( self ) )
+    #
+#/class RowProxy
+
+class LiveSecondOrderStats():
+    """
+        Grouped counts, sums and sums of squares, like from ``secondOrderStats()``, kept up to date as the df changes. Made by ``DataFrame.track_secondOrderStats()``
+        
+        Each appended, set, inserted or removed row adds to or subtracts from its group, so it's O(1) a row. Rows with `None` in any of `numerics` are left out. Subtracting floats adds rounding, so after many changes ``.refresh()`` gives the exact values again
+    """
+    def __init__(
+        self: Self,
+        df: DataFrame,
+        groups: list[ str ],
+        numerics: list[ str ]
+        ):
+        self._df: DataFrame = df
+        self.groups: list[ str ] = list( groups )
+        self.numerics: list[ str ] = list( numerics )
+        self.columns: set[ str ] = set( self.groups ) | set( self.numerics )
+        self._stats: dict[ tuple[any,...], dict[ str, list[float] ] ] = {}
+        self._counts: dict[ tuple[any,...], int ] = {}
+        # Set when a whole column changes, to rebuild on the next read
+        self._stale: bool = False
+        self.refresh()
+    #/def __init__
+    
+    def refresh( self: Self ) -> None:
+        """
+            Recomputes from every row of the df
+        """
+        self._stats = {}
+        self._counts = {}
+        self._stale = False
+        n_groups: int = len( self.groups )
+        for row in self._df.iter_tuples( self.groups + self.numerics ):
+            self._add( row[ :n_groups ], row[ n_groups: ], False )
+        #
+        return
+    #/def refresh
+    
+    def value( self: Self ) -> dict[ tuple[any,...], dict[ str, list[float] ] ]:
+        """
+            :returns: The current statistics, in the format of ``secondOrderStats()``, ready for ``fromSecondOrderStats()``
+            :rtype: dict[ tuple[any,...], dict[ str, list[float] ] ]
+        """
+        if self._stale:
+            self.refresh()
+        #
+        return {
+            key: { col: list( powers ) for col, powers in cols.items() }
+            for key, cols in self._stats.items()
+        }
+    #/def value
+    
+    def _add_row( self: Self, row: int, remove: bool = False ) -> None:
+        """
+            Adds the values in `row` of the df, or takes them away if `remove`
+        """
+        if self._stale:
+            return
+        #
+        self._add(
+            tuple( self._df._item_by_rowCol( row, col ) for col in self.groups ),
+            [ self._df._item_by_rowCol( row, col ) for col in self.numerics ],
+            remove
+        )
+        return
+    #/def _add_row
+    
+    def _add(
+        self: Self,
+        key: tuple[any,...],
+        values: Sequence,
+        remove: bool
+        ) -> None:
+        if any( val is None for val in values ):
+            return
+        #
+        if key not in self._stats:
+            self._stats[ key ] = { col: [ 0, 0, 0 ] for col in self.numerics }
+            self._counts[ key ] = 0
+        #
+        cols: dict[ str, list[float] ] = self._stats[ key ]
+        powers: list[float]
+        for col, val in zip( self.numerics, values ):
+            powers = cols[ col ]
+            if remove:
+                powers[0] -= 1 # Power 0
+                powers[1] -= val # Power 1
+                powers[2] -= val**2 # Power 2
+            #
+            else:
+                powers[0] += 1 # Power 0
+                powers[1] += val # Power 1
+                powers[2] += val**2 # Power 2
+            #/if remove/else
+        #/for col, val in zip( self.numerics, values )
+        self._counts[ key ] += -1 if remove else 1
+        if self._counts[ key ] == 0:
+            del self._stats[ key ]
+            del self._counts[ key ]
+        #
+        return
+    #/def _add
+#/class LiveSecondOrderStats
+
 # -- Initializers
 
 def fromDict(
-    dfDict: DataFrameDict
+    dfDict: DataFrameDict,
+    typed: bool = False
     ) -> DataFrame:
     """
+        :param DataFrameDict dfDict: Raw dictionary, as from ``DataFrame.as_dict()``
+        :param bool typed: If `True`, use typed storage; see ``DataFrame.set_typedStorage()``
+        
         Converts the raw json to DataFrame, without adding any structure
     """
+    from itertools import accumulate
+    
     dfDict = {
         "_fixed": {},
         "_shift": {},
         "_shiftIndex": {},
         "_schema": {},
-        "_meta": {}
+        "_meta": {},
+        "_shiftRun": []
     } | dfDict
+    # `[ value, length ]` runs, as from a `RunLengthColumn`
+    shift: dict[ str, Sequence ] = dfDict["_shift"] | {
+        col: RunLengthColumn(
+            [ run[0] for run in dfDict["_shift"][ col ] ],
+            list( accumulate( run[1] for run in dfDict["_shift"][ col ] ) )
+        ) for col in dfDict["_shiftRun"] if col in dfDict["_shift"]
+    }
     return DataFrame(
         fixed = dfDict["_fixed"],
-        shift = dfDict["_shift"],
+        shift = shift,
         shiftIndex = dfDict["_shiftIndex"],
         schema = plSchema_from_dict( dfDict["_schema"] ),
-        meta = dfDict["_meta"]
+        meta = dfDict["_meta"],
+        typed = typed
     )
 #/def fromDict
 
@@ -1383,10 +4057,13 @@ def fromHeaders(
     shiftHeader: list[ str ] = [],
     shiftIndexHeader: list[ str ] = [],
     schema: dict[ str, type | pl.DataType ] = {},
-    meta: any = {}
+    meta: any = {},
+    typed: bool = False
     ) -> DataFrame:
     """
         Initializes a df with the given headers, but no data (with the possible exception of `fixed`)
+        
+        If `typed`, numeric columns start as empty `array.array` buffers; see ``DataFrame.set_typedStorage()``
     """
     if isinstance( fixed, list ):
         # Convert list of strings to a map to `None`
@@ -1395,107 +4072,490 @@ def fromHeaders(
         }
     #
     
-    shiftHeaderAll = shiftIndexHeader + [
-        col for col in shiftHeader if col not in shiftIndexHeader
-    ]
+    shiftHeaderAll = shiftIndexHeader + [
+        col for col in shiftHeader if col not in shiftIndexHeader
+    ]
+    
+    return DataFrame(
+        fixed = fixed,
+        shift = { col: [] for col in shiftHeaderAll },
+        shiftIndex = { col: [] for col in shiftIndexHeader },
+        schema = plSchema_from_dict( schema ),
+        meta = meta,
+        typed = typed
+    )
+#/def fromHeaders
+
+def fromDict_shift(
+    data: dict[ str, list ],
+    validate: bool = True
+    ) -> DataFrame:
+    """
+        :param dict[ str, list ] data: Reads a dictionary of lists, with keys as column names and values as those columns. Result is making the shift dict from `data`
+        :param bool validate: If `True` check each value of `data` is a list of the same length
+        :rtype: DataFrame
+    """
+    # Check for correct data lengths
+    if validate:
+        assert isinstance( data, dict )
+        data_len: int | None = None
+        for val in data.values():
+            assert isinstance( val, list )
+            if data_len is None:
+                data_len = len( val )
+            #
+            else:
+                assert len( val ) == data_len
+            #/if data_len is None
+        #/for val in data.values()
+    #/if validate
+    
+    return DataFrame( shift = data )
+#/def fromDict_shift
+
+def from_polars(
+    pldf: pl.DataFrame,
+    make_fixed: bool = True,
+    typed: bool = False
+    ) -> DataFrame:
+    """
+        :param pl.DataFrame pldf: Frame to convert
+        :param bool make_fixed: If `True`, columns with one unique value go into `fixed`
+        :param bool typed: If `True`, use typed storage; see ``DataFrame.set_typedStorage()``
+        :rtype: DataFrame
+        
+        The reverse of ``DataFrame.to_polars()``. `pl.Categorical` and `pl.Enum` columns go into `shiftIndex`, with their categories as the values and their physical codes as the codes, and other columns into `shift`. Types of `fixed` and `shift` columns are kept in the schema, when they can be serialized.
+    """
+    fixed: dict[ str, any ] = {}
+    shift: dict[ str, list ] = {}
+    shiftIndex: dict[ str, list ] = {}
+    schema: dict[ str, pl.DataType ] = {}
+    
+    for series in pldf.get_columns():
+        col: str = series.name
+        is_categorical: bool = series.dtype.base_type() in ( pl.Categorical, pl.Enum )
+        if make_fixed and len( series ) > 0:
+            try:
+                is_constant: bool = series.n_unique() == 1
+            #
+            except pl.exceptions.PolarsError:
+                # Types polars can't hash
+                is_constant = False
+            #
+            if is_constant:
+                fixed[ col ] = series[0]
+                if not is_categorical and _is_serializable_dtype( series.dtype ):
+                    schema[ col ] = series.dtype
+                #
+                continue
+            #/if is_constant
+        #/if make_fixed and len( series ) > 0
+        
+        if is_categorical:
+            categories: pl.Series = series.cat.get_categories()
+            shiftIndex[ col ] = categories.to_list()
+            shift[ col ] = series.cast(
+                pl.Enum( categories )
+            ).to_physical().to_list()
+        #
+        else:
+            shift[ col ] = series.to_list()
+            if _is_serializable_dtype( series.dtype ):
+                schema[ col ] = series.dtype
+            #
+        #/if is_categorical/else
+    #/for series in pldf.get_columns()
+    
+    df: DataFrame = DataFrame(
+        fixed = fixed,
+        shift = shift,
+        shiftIndex = shiftIndex,
+        schema = schema,
+        typed = typed
+    )
+    if shift == {}:
+        df._len = len( pldf )
+        df.shape = ( df._len, df.shape[1] )
+    #
+    return df
+#/def from_polars
+
+def likeDataFrame(
+    df: DataFrame
+    ) -> DataFrame:
+    """
+        :param DataFrame df: Frame to intialize like, copying fixed, the shift header, the shift index header, schema, and meta
+        :returns: a blank df with copied headers
+        :rtype: DataFrame
+    """
+    from copy import deepcopy
+    
+    return fromHeaders(
+        fixed = deepcopy( df._fixed ),
+        shiftHeader = [
+            key for key in df._shift.keys()
+        ],
+        shiftIndexHeader = [
+            key for key in df._shiftIndex.keys()
+        ],
+        schema = df._schema,
+        meta = deepcopy( df._meta ),
+        typed = df._typed
+    )
+#/def likeDataFrame
+
+def copyDataFrame(
+    df: DataFrame
+    ) -> DataFrame:
+    """
+        :param DataFrame df: Frame to intialize like, copying fixed, the shift header, the shift index header, schema, and meta
+        :returns: a new df with copied headers and the same values
+        :rtype: DataFrame
+        
+        Copy on write: the new df shares the columns and shiftIndex values of `df`, and either copies a column only when it first changes it. So copying costs O(columns), whatever the number of rows
+    """
+    from copy import deepcopy
+    
+    new_df: DataFrame = DataFrame(
+        fixed = deepcopy( df._fixed ),
+        shift = {},
+        shiftIndex = {},
+        schema = dict( df._schema ),
+        meta = deepcopy( df._meta )
+    )
+    df._share_columns( new_df, df.keys_shift() )
+    new_df._sortedBy = df._sortedBy
+    new_df._typed = df._typed
+    new_df._len = len( df )
+    new_df.shape = df.shape
+    # Keep the same indexes, rebuilt when first used
+    new_df._indexes = { cols: None for cols in df._indexes }
+    return new_df
+#/def copyDataFrame
+
+# -- Streaming json
+#    Used by `fromFile( ..., stream = True )` to decode a file a piece at a time
+
+# Characters which can follow a complete json value
+_JSON_DELIMITERS: str = ' \t\n\r,:]}'
+# Characters that matter when skipping a value without decoding it
+_SKIP_STRUCTURE: re.Pattern = re.compile(r'["\[\]{}]')
+_SKIP_STRING: re.Pattern = re.compile(r'["\\]')
+
+class _JsonStreamReader():
+    """
+        Decodes a json document from an open text file a chunk at a time, so we never hold the whole text in memory
+        
+        Objects and arrays can be walked with ``.iter_object()`` and ``.iter_array()``, and any value decoded whole with ``.read_value()``
+    """
+    def __init__(
+        self: Self,
+        _file,
+        decoder: json.JSONDecoder | None = None,
+        chunk_size: int = 1 << 16
+        ):
+        self._file = _file
+        self._decoder = ( json.JSONDecoder if decoder is None else decoder )()
+        self._chunk_size = chunk_size
+        self._buffer: str = ''
+        self._pos: int = 0
+        self._eof: bool = False
+    #/def __init__
+    
+    def _fill( self: Self, size: int | None = None ) -> bool:
+        """
+            Drops what's been consumed and reads more of the file. Returns `False` at the end of the file
+        """
+        if self._eof:
+            return False
+        #
+        chunk: str = self._file.read(
+            max( self._chunk_size, size or 0 )
+        )
+        self._buffer = self._buffer[ self._pos: ] + chunk
+        self._pos = 0
+        if chunk == '':
+            self._eof = True
+            return False
+        #
+        return True
+    #/def _fill
+    
+    def _peek( self: Self ) -> str:
+        """
+            Skips whitespace and gives the next character, without consuming it. Gives `''` at the end of the file
+        """
+        while True:
+            self._pos = json.decoder.WHITESPACE.match(
+                self._buffer, self._pos
+            ).end()
+            if self._pos < len( self._buffer ):
+                return self._buffer[ self._pos ]
+            #
+            if not self._fill():
+                return ''
+            #
+        #/while True
+    #/def _peek
+    
+    def _expect( self: Self, char: str ) -> None:
+        found: str = self._peek()
+        if found != char:
+            raise ValueError(
+                "Expected '{}', found '{}' in json stream".format( char, found )
+            )
+        #
+        self._pos += 1
+        return
+    #/def _expect
+    
+    def read_value( self: Self ) -> any:
+        """
+            Decodes the next whole value, reading more of the file until it's complete
+        """
+        self._peek()
+        while True:
+            try:
+                val, end = self._decoder.raw_decode( self._buffer, self._pos )
+            #
+            except json.JSONDecodeError:
+                # Incomplete; read more, growing with the buffer for large values
+                if not self._fill( len( self._buffer ) ):
+                    raise
+                #
+                continue
+            #/try val, end = ...raw_decode( ... )/except json.JSONDecodeError
+            if self._eof or (
+                end < len( self._buffer ) and self._buffer[ end ] in _JSON_DELIMITERS
+            ):
+                self._pos = end
+                return val
+            #
+            # A number like `12` might continue past the end of the buffer, as `12.5`
+            self._fill( len( self._buffer ) )
+        #/while True
+    #/def read_value
+    
+    def skip_value( self: Self ) -> None:
+        """
+            Moves past the next value without decoding it, only tracking strings and nesting
+        """
+        if self._peek() not in '[{"':
+            # A number or literal; small, so just decode it
+            self.read_value()
+            return
+        #
+        depth: int = 0
+        in_string: bool = False
+        while True:
+            buffer: str = self._buffer
+            pos: int = self._pos
+            while True:
+                if in_string:
+                    found: re.Match | None = _SKIP_STRING.search( buffer, pos )
+                    if found is None:
+                        pos = len( buffer )
+                        break
+                    #
+                    if found.group() == '\\':
+                        if found.end() >= len( buffer ):
+                            # Need the escaped character, in the next chunk
+                            pos = found.start()
+                            break
+                        #
+                        pos = found.end() + 1
+                        continue
+                    #
+                    in_string = False
+                    pos = found.end()
+                    if depth == 0:
+                        self._pos = pos
+                        return
+                    #
+                #
+                else:
+                    found = _SKIP_STRUCTURE.search( buffer, pos )
+                    if found is None:
+                        pos = len( buffer )
+                        break
+                    #
+                    pos = found.end()
+                    if found.group() == '"':
+                        in_string = True
+                    #
+                    elif found.group() in '[{':
+                        depth += 1
+                    #
+                    else:
+                        depth -= 1
+                        if depth == 0:
+                            self._pos = pos
+                            return
+                        #
+                    #/switch found.group()
+                #/if in_string/else
+            #/while True
+            self._pos = pos
+            if not self._fill():
+                raise ValueError("Unexpected end of json stream")
+            #
+        #/while True
+    #/def skip_value
+    
+    def _end_ofContainer( self: Self, close: str ) -> bool:
+        """
+            After an item, consumes the separator and says if the container has ended
+        """
+        char: str = self._peek()
+        if char == ',':
+            self._pos += 1
+            return False
+        #
+        if char == close:
+            self._pos += 1
+            return True
+        #
+        raise ValueError(
+            "Expected ',' or '{}', found '{}' in json stream".format( close, char )
+        )
+    #/def _end_ofContainer
     
-    return DataFrame(
-        fixed = fixed,
-        shift = { col: [] for col in shiftHeaderAll },
-        shiftIndex = { col: [] for col in shiftIndexHeader },
-        schema = plSchema_from_dict( schema ),
-        meta = meta
-    )
-#/def fromHeaders
-
-def fromDict_shift(
-    data: dict[ str, list ],
-    validate: bool = True
-    ) -> DataFrame:
-    """
-        :param dict[ str, list ] data: Reads a dictionary of lists, with keys as column names and values as those columns. Result is making the shift dict from `data`
-        :param bool validate: If `True` check each value of `data` is a list of the same length
-        :rtype: DataFrame
-    """
-    # Check for correct data lengths
-    if validate:
-        assert isinstance( data, dict )
-        data_len: int | None = None
-        for val in data.values():
-            assert isinstance( val, list )
-            if data_len is None:
-                data_len = len( val )
+    def iter_object( self: Self ) -> Generator[ str, None, None ]:
+        """
+            Walks an object, giving each key. The caller must consume the value (with ``.read_value()``, etc) before asking for the next key
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        #
+        while True:
+            key: str = self.read_value()
+            self._expect(':')
+            yield key
+            if self._end_ofContainer('}'):
+                return
             #
-            else:
-                assert len( val ) == data_len
-            #/if data_len is None
-        #/for val in data.values()
-    #/if validate
+        #/while True
+    #/def iter_object
     
-    return DataFrame( shift = data )
-#/def fromDict_shift
+    def iter_array( self: Self ) -> Generator[ any, None, None ]:
+        """
+            Walks an array, decoding and giving one item at a time
+        """
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        #
+        while True:
+            yield self.read_value()
+            if self._end_ofContainer(']'):
+                return
+            #
+        #/while True
+    #/def iter_array
+#/class _JsonStreamReader
 
-def likeDataFrame(
-    df: DataFrame
-    ) -> DataFrame:
+def _check_projection(
+    columns: list[ str ],
+    found: list[ str ]
+    ) -> None:
     """
-        :param DataFrame df: Frame to intialize like, copying fixed, the shift header, the shift index header, schema, and meta
-        :returns: a blank df with copied headers
-        :rtype: DataFrame
+        Raises if any of the requested `columns` weren't in the file
     """
-    return fromHeaders(
-        fixed = df._fixed,
-        shiftHeader = [
-            key for key in df._shift.keys()
-        ],
-        shiftIndexHeader = [
-            key for key in df._shiftIndex.keys()
-        ],
-        schema = df._schema,
-        meta = df._meta
-    )
-#/def likeDataFrame
+    missing: list[ str ] = [ col for col in columns if col not in found ]
+    if missing:
+        raise KeyError(
+            "Columns={} not found in file".format( missing )
+        )
+    #
+    return
+#/def _check_projection
 
-def copyDataFrame(
-    df: DataFrame
-    ) -> DataFrame:
+def _read_dfDict_streaming(
+    _file,
+    decoder: json.JSONDecoder | None = None,
+    columns: list[ str ] | None = None
+    ) -> DataFrameDict:
     """
-        :param DataFrame df: Frame to intialize like, copying fixed, the shift header, the shift index header, schema, and meta
-        :returns: a new df with copied headers and the same values
-        :rtype: DataFrame
+        Reads the sections of a df file one at a time, and the `_shift` and `_shiftIndex` sections one column at a time, so peak memory is about the finished df plus one chunk of text
+        
+        If `columns` is given, only those columns are decoded from `_fixed`, `_shift`, and `_shiftIndex`, and the text of the others is skipped over
     """
-    new_df: DataFrame = likeDataFrame(
-        df
-    )
+    reader: _JsonStreamReader = _JsonStreamReader( _file, decoder = decoder )
+    data: DataFrameDict = {}
+    for section in reader.iter_object():
+        if section in ( "_fixed", "_shift", "_shiftIndex" ) and reader._peek() == '{':
+            data[ section ] = {}
+            for col in reader.iter_object():
+                if columns is not None and col not in columns:
+                    reader.skip_value()
+                #
+                elif section != "_fixed" and reader._peek() == '[':
+                    data[ section ][ col ] = list( reader.iter_array() )
+                #
+                else:
+                    data[ section ][ col ] = reader.read_value()
+                #
+            #/for col in reader.iter_object()
+        #
+        elif section == "_schema" and columns is not None:
+            data[ section ] = {
+                col: val for col, val in reader.read_value().items() if col in columns
+            }
+        #
+        else:
+            data[ section ] = reader.read_value()
+        #/switch section
+    #/for section in reader.iter_object()
     
-    for row in df:
-        new_df.append( row )
+    if columns is not None:
+        _check_projection(
+            columns,
+            list( data.get( "_fixed", {} ) ) + list( data.get( "_shift", {} ) )
+        )
     #
-    return new_df
-#/def copyDataFrame
+    return data
+#/def _read_dfDict_streaming
 
 def fromFile(
     fp: str,
     decoder: json.JSONDecoder | None = None,
     strict: bool = False,
-    update: bool = False
+    update: bool = False,
+    typed: bool = False,
+    stream: bool = False,
+    columns: list[ str ] | None = None
     ) -> DataFrame:
     """
         :param str fp: File path to read
         :param json.JSONDecoder|None decoder: Optional custom decoder
         :param bool strict: If `True` require exact correct formatting, will raise if not
         :param bool update: If `True` and `strict = False` it will update the file on the disk with missing fields
+        :param bool typed: If `True`, use typed storage; see ``DataFrame.set_typedStorage()``
+        :param bool stream: If `True`, decode the file incrementally, section by section and column by column, instead of all at once with `json.load`. Gives the same df with a much lower peak memory for large files
+        :param list[ str ]|None columns: If given, only read these columns, from `_fixed` or `_shift`, skipping over the rest of the file without decoding it. Always reads incrementally, as with `stream = True`. Raises `KeyError` if any are missing
         
         Reads directly as a df on the disk in json form
     """
+    data: DataFrameDict
     with open( fp, 'r' ) as _file:
-        data: DataFrameDict = json.load( fp = _file, cls = decoder )
+        if stream or columns is not None:
+            data = _read_dfDict_streaming(
+                _file, decoder = decoder, columns = columns
+            )
+        #
+        else:
+            data = json.load( fp = _file, cls = decoder )
+        #/if stream/else
     #
     
     data_all: DataFrameDict
     
     # Check is has all required fields when `strict` mode
-    _REQUIRED_KEYS = ["_fixed","_shift","_shiftIndex","_schema'", "_meta"]
+    _REQUIRED_KEYS = ["_fixed","_shift","_shiftIndex","_schema", "_meta"]
+    _OPTIONAL_KEYS = ["_shiftRun"]
     if strict:
         if any( key not in data for key in _REQUIRED_KEYS ):
             raise Exception(
@@ -1504,7 +4564,7 @@ def fromFile(
                 )
             )
         #/if any( key not in data for key in _REQUIRED_KEYS )
-        if any( key not in _REQUIRED_KEYS for key in data ):
+        if any( key not in _REQUIRED_KEYS + _OPTIONAL_KEYS for key in data ):
             raise Exception(
                 "Unrecognized file keys={}".format(
                     data.keys()
@@ -1522,11 +4582,11 @@ def fromFile(
         } | data
     #/if strict/else
     
-    jFrame: DataFrame = fromDict( data_all )
+    jFrame: DataFrame = fromDict( data_all, typed = typed )
     
     # Write file if it's missing a section and
-    if update and any( key not in data for key in _REQUIRED_KEYS ):
-        jFrame.write_file( file = file )
+    if update and columns is None and any( key not in data for key in _REQUIRED_KEYS ):
+        jFrame.write_file( fp = fp )
     #
     
     return jFrame
@@ -1547,28 +4607,163 @@ def from_file(
 
 def read_file(
     fp: str,
-    decoder: json.JSONDecoder | None = None
+    decoder: json.JSONDecoder | None = None,
+    typed: bool = False,
+    stream: bool = False,
+    columns: list[ str ] | None = None
     ) -> DataFrame:
     """
         :param str fp: File path to read
         :param json.JSONDecoder|None decoder: Optional customer decoder
+        :param bool typed: If `True`, use typed storage; see ``DataFrame.set_typedStorage()``
+        :param bool stream: If `True`, decode the file incrementally; see ``fromFile()``
+        :param list[ str ]|None columns: If given, only read these columns; see ``fromFile()``
         
         Directly reads from a regular json on the disc. Synonym to `fromFile()`
     """
-    return fromFile( fp = fp, decoder = decoder )
+    return fromFile(
+        fp = fp,
+        decoder = decoder,
+        typed = typed,
+        stream = stream,
+        columns = columns
+    )
 #/def read_file
 
+def read_binary(
+    fp: str,
+    decoder: json.JSONDecoder | None = None,
+    columns: list[ str ] | None = None
+    ) -> DataFrame:
+    """
+        :param str fp: File path to read, as written by ``DataFrame.write_binary()``
+        :param json.JSONDecoder|None decoder: Optional custom decoder for the header and any json blocks
+        :param list[ str ]|None columns: If given, only read these columns. The blocks of the others are never touched
+        
+        Memory maps the file, so fixed width columns are views onto the file with no copying, and only the parts of it that get read are loaded from the disk. Columns get copied into memory the first time they're modified.
+    """
+    import mmap
+    from sys import byteorder
+    
+    with open( fp, 'rb' ) as _file:
+        mapped: mmap.mmap = mmap.mmap( _file.fileno(), 0, access = mmap.ACCESS_READ )
+    #
+    
+    if mapped[ :len( _BINARY_MAGIC ) ] != _BINARY_MAGIC:
+        raise ValueError("Not a binary jable file: fp={}".format( fp ))
+    #
+    header_start: int = len( _BINARY_MAGIC ) + 8
+    header_len: int = int.from_bytes(
+        mapped[ len( _BINARY_MAGIC ):header_start ], 'little'
+    )
+    if header_start + header_len > len( mapped ):
+        raise ValueError(
+            "Truncated binary jable file, header past the end: fp={}".format( fp )
+        )
+    #
+    _decoder: json.JSONDecoder = ( json.JSONDecoder if decoder is None else decoder )()
+    header: dict[ str, any ] = _decoder.decode(
+        mapped[ header_start:header_start + header_len ].decode('utf-8')
+    )
+    if header["version"] > _BINARY_VERSION:
+        raise ValueError(
+            "Unsupported binary version={}".format( header["version"] )
+        )
+    #
+    
+    data_start: int = header_start + header_len
+    data_start += -data_start % _BINARY_ALIGNMENT
+    buffer: memoryview = memoryview( mapped )
+    
+    def read_block( block: dict[ str, any ] ) -> Sequence:
+        start: int = data_start + block["offset"]
+        if block["offset"] < 0 or block["nbytes"] < 0 or start + block["nbytes"] > len( mapped ):
+            raise ValueError(
+                "Truncated binary jable file, block past the end: fp={}".format( fp )
+            )
+        #
+        data: memoryview = buffer[ start:start + block["nbytes"] ]
+        if block["kind"] == "json":
+            return _decoder.decode( str( data, 'utf-8' ) )
+        #
+        if header["byteorder"] != byteorder:
+            # Have to copy to swap bytes
+            swapped: array = array( block["typecode"] )
+            swapped.frombytes( data )
+            swapped.byteswap()
+            return swapped
+        #
+        return data.cast( block["typecode"] )
+    #/def read_block
+    
+    fixed: dict[ str, any ] = header["_fixed"]
+    if columns is not None:
+        _check_projection(
+            columns, list( fixed ) + list( header["_shift"] )
+        )
+        fixed = {
+            col: val for col, val in fixed.items() if col in columns
+        }
+    #
+    shift: dict[ str, Sequence ] = {
+        col: read_block( block ) for col, block in header["_shift"].items()\
+            if columns is None or col in columns
+    }
+    shiftIndex: dict[ str, list ] = {
+        col: read_block( block ) for col, block in header["_shiftIndex"].items()\
+            if col in shift
+    }
+    df: DataFrame = DataFrame(
+        fixed = fixed,
+        shift = shift,
+        shiftIndex = shiftIndex,
+        schema = plSchema_from_dict(
+            {
+                col: val for col, val in header["_schema"].items()\
+                    if columns is None or col in columns
+            }
+        ),
+        meta = header["_meta"]
+    )
+    if df._shift == {}:
+        df._len = header["_len"]
+        df.shape = ( df._len, df.shape[1] )
+    #
+    return df
+#/def read_binary
+
 def fromFile_shift(
     fp: str,
-    decoder: json.JSONDecoder | None = None
+    decoder: json.JSONDecoder | None = None,
+    columns: list[ str ] | None = None
     ) -> DataFrame:
     """
+        :param str fp: File path to read
+        :param json.JSONDecoder|None decoder: Optional customer decoder
+        :param list[ str ]|None columns: If given, only read these columns, skipping over the rest of the file without decoding it
+        
         Reads the df as the shift data only, with no fixed and no meta
         
         This is a niche use, for when a df has been stored as a dictionary of lists at the top level
     """
+    data: dict
     with open( fp, 'r' ) as _file:
-        data: dict = json.load( fp = _file, cls = decoder )
+        if columns is None:
+            data = json.load( fp = _file, cls = decoder )
+        #
+        else:
+            reader: _JsonStreamReader = _JsonStreamReader( _file, decoder = decoder )
+            data = {}
+            for col in reader.iter_object():
+                if col in columns:
+                    data[ col ] = list( reader.iter_array() )
+                #
+                else:
+                    reader.skip_value()
+                #
+            #/for col in reader.iter_object()
+            _check_projection( columns, list( data ) )
+        #/if columns is None/else
     #
     
     return fromDict_shift( data )
@@ -1622,21 +4817,22 @@ def filter(
         Gets a new df with the same header, adding in rows where `jyFilter` is true
     """
     
-    new_df: DataFrame = likeDataFrame( df )
+    if isinstance( jyFilter, dict | Expr ) and len( df ) > 0:
+        return df._take_rows(
+            df.get_matchingIndices( jyFilter )
+        )
+    #
+    
     if len( df ) == 0:
-        return new_df
+        return likeDataFrame( df )
     #
     
-    for row in df:
-        if _does_matchRow(
+    return df._take_rows( [
+        i for i, row in enumerate( df._iter_rowDicts() ) if _does_matchRow(
             jyFilter,
             row
-        ):
-            new_df.append( row )
-        #/if _does_matchRow( ... )
-    #/for row in df
-    
-    return new_df
+        )
+    ] )
 #/def filter
 
 def filter_returnFirst(
@@ -1657,15 +4853,33 @@ def filter_returnFirst(
         return {}
     #
     
+    if isinstance( jyFilter, dict | Expr ):
+        matches: Sequence[ int ] | None = None
+        if isinstance( jyFilter, Expr ):
+            # On the sorted column, this is a binary search
+            matches = df._sortedRange_forExpr( jyFilter )
+        #
+        if matches is None:
+            matches = df.get_matchingIndices( jyFilter )
+        #
+        if matches:
+            return df[ matches[0] ]
+        #
+        elif allow_zero:
+            return {}
+        #
+        raise Exception("No matching rows for jyFilter={}".format( jyFilter ))
+    #/if isinstance( jyFilter, dict | Expr )
+    
     row: dict[ str, any ]
-    for row in df:
+    for row in df._iter_rowDicts():
         if _does_matchRow(
             jyFilter,
             row
         ):
             return row
         #/if _does_matchRow( ... )
-    #/for row in df
+    #/for row in df._iter_rowDicts()
     
     # Made it here, it means no matches
     if allow_zero:
@@ -1694,74 +4908,381 @@ def filter_expectOne(
         Returns a row as a dict
     """
     
-    new_df: DataFrame = filter( df, jyFilter )
+    new_df: DataFrame = filter( df, jyFilter )
+    
+    if len( new_df ) == 0:
+        if allow_zero:
+            return {}
+        else:
+            raise Exception("Zero results")
+        #
+    #
+    
+    if len( new_df ) == 1:
+        return new_df[0]
+    #
+    
+    if len( new_df ) > 1:
+        raise Exception(
+            "Too many results;  len( new_df )={}".format(
+                len( new_df )
+            )
+        )
+    #
+    raise Exception("# Bad new_df={}".format(new_df))
+#/def filter_expectOne
+
+# -- Sorting
+
+def sortedBy(
+    df: DataFrame,
+    by: str | list[ str ],
+    descending: bool | list[ bool ] = False,
+    nulls_last: bool = True
+    ) -> DataFrame:
+    """
+        :param DataFrame df: Frame to return new sorted version of
+        :param str|list[ str ] by: Columns by which to sort rows
+        :param bool|list[ bool ] descending: Sort in descending order, for all of `by` or each column
+        :param bool nulls_last: If `True`, `None` values go after the others, otherwise before, either way round
+        
+        Returns a new df, sorting by the values in the `by` list of columns. The sort is stable
+        Does not change the order of columns at all
+        
+        Only the `by` columns are read to work out the new order of rows, which is then applied to each column at once. `shiftIndex` columns are sorted by ranking their values once and comparing the ranks
+        
+        When sorted ascending by a shift column with no `None` values, the result is declared sorted by it, as with ``DataFrame.set_sortedBy()``. `._meta` is left as is
+    """
+    if isinstance( by, str ):
+        by = [ by ]
+    #
+    if isinstance( descending, bool ):
+        descending = [ descending ]*len( by )
+    #
+    if len( descending ) != len( by ):
+        raise ValueError(
+            "Got {} descending flags for {} columns".format( len( descending ), len( by ) )
+        )
+    #
+    
+    # Stable sorts from the last key to the first give the order by all of them
+    order: list[ int ] = list( range( len( df ) ) )
+    any_nulls: bool = False
+    for col, reverse in reversed( list( zip( by, descending ) ) ):
+        if col in df._fixed:
+            continue
+        #
+        if col not in df._shift:
+            raise KeyError( col )
+        #
+        key: Sequence = _sortKey_forCol( df, col )
+        nulls: list[ int ] = [ i for i in order if key[ i ] is None ]
+        if nulls:
+            any_nulls = True
+            order = [ i for i in order if key[ i ] is not None ]
+        #
+        order.sort( key = key.__getitem__, reverse = reverse )
+        order = order + nulls if nulls_last else nulls + order
+    #/for col, reverse in reversed( list( zip( by, descending ) ) )
+    
+    new_df: DataFrame = df._take_rows( order )
+    if not any_nulls and not descending[0] and by[0] in df._shift:
+        # Known sorted by the first column, so save checking it
+        new_df._sortedBy = by[0]
+    #
+    return new_df
+#/def sortedBy
+
+def _sortKey_forCol(
+    df: DataFrame,
+    col: str
+    ) -> Sequence:
+    """
+        A sequence giving, for each row, a value to sort the rows of `col` by, or `None` for null values
+    """
+    column: Sequence = df._shift[ col ]
+    if col not in df._shiftIndex:
+        return column
+    #
+    values: list = df._shiftIndex[ col ]
+    ranked: list[ int ] = sorted(
+        ( code for code in range( len( values ) ) if values[ code ] is not None ),
+        key = values.__getitem__
+    )
+    rank: list[ int | None ] = [ None ]*len( values )
+    for position, code in enumerate( ranked ):
+        rank[ code ] = position
+    #
+    return [ rank[ code ] if code is not None else None for code in column ]
+#/def _sortKey_forCol
+
+def _join_keys(
+    left: DataFrame,
+    right: DataFrame,
+    on: list[ str ]
+    ) -> tuple[ Sequence, Sequence ]:
+    """
+        The key of each row of `left` and `right` for ``join()``, comparable between them. A column in the `shiftIndex` of both is compared by the codes of `left`, after mapping the values of `right` onto them once
+    """
+    left_cols: list[ Sequence ] = []
+    right_cols: list[ Sequence ] = []
+    for col in on:
+        if col not in left.keys() or col not in right.keys():
+            raise KeyError( col )
+        #
+        if col in left._shiftIndex and col in right._shiftIndex:
+            shiftIndexMap: dict[ any, int ] = left._shiftIndexMap[ col ]
+            try:
+                # Values only on the right can't match; -1 is never a code
+                remap: list[ int ] = [
+                    shiftIndexMap.get( val, -1 ) for val in right._shiftIndex[ col ]
+                ]
+            #
+            except TypeError:
+                # Unhashable values, so compare the values themselves
+                pass
+            #
+            else:
+                left_cols.append( left._shift[ col ] )
+                right_cols.append( [
+                    remap[ code ] if code is not None else None for code in right._shift[ col ]
+                ] )
+                continue
+            #/try remap = [ ... ]/except/else
+        #/if col in left._shiftIndex and col in right._shiftIndex
+        left_cols.append( list( left._iter_col( col ) ) )
+        right_cols.append( list( right._iter_col( col ) ) )
+    #/for col in on
+    if len( on ) == 1:
+        return left_cols[0], right_cols[0]
+    #
+    return list( zip( *left_cols ) ), list( zip( *right_cols ) )
+#/def _join_keys
+
+def join(
+    left: DataFrame,
+    right: DataFrame,
+    on: str | list[ str ],
+    how: Literal["inner","left","semi","anti"] = "inner",
+    suffix: str = "_right"
+    ) -> DataFrame:
+    """
+        :param DataFrame left: Rows to join onto
+        :param DataFrame right: Rows to join
+        :param str|list[ str ] on: Column, or columns, which have to be equal in both
+        :param Literal["inner","left","semi","anti"] how: Which rows to give
+            * "inner": Each pair of matching rows
+            * "left": The same, and also each row of `left` without a match, with `None` for the columns of `right`
+            * "semi": The rows of `left` with a match, with only the columns of `left`
+            * "anti": The rows of `left` without a match, with only the columns of `left`
+        :param str suffix: Added to the names of columns of `right` which `left` also has
+        :returns: The joined rows, in the order of `left`, then of `right`
+        :rtype: DataFrame
+        
+        A hash join, building the table on the smaller side. `None` keys don't match anything. Fixed columns equal in both stay fixed; a fixed column in both with different values becomes shift columns
+    """
+    if isinstance( on, str ):
+        on = [ on ]
+    #
+    if how not in ( "inner", "left", "semi", "anti" ):
+        raise ValueError("Bad how={}".format( how ))
+    #
+    
+    left_keys: Sequence
+    right_keys: Sequence
+    left_keys, right_keys = _join_keys( left, right, on )
+    if len( on ) == 1:
+        is_null: Callable = lambda key: key is None
+    #
+    else:
+        is_null = lambda key: None in key
+    #
+    
+    if how in ( "semi", "anti" ):
+        right_set: set = { key for key in right_keys if not is_null( key ) }
+        return left._take_rows( [
+            i for i, key in enumerate( left_keys )
+            if ( not is_null( key ) and key in right_set ) == ( how == "semi" )
+        ] )
+    #/if how in ( "semi", "anti" )
+    
+    left_rows: list[ int ] = []
+    right_rows: list[ int | None ] = []
+    table: dict[ any, list[ int ] ] = {}
+    if len( right ) <= len( left ):
+        for j, key in enumerate( right_keys ):
+            if not is_null( key ):
+                table.setdefault( key, [] ).append( j )
+            #
+        #
+        for i, key in enumerate( left_keys ):
+            matches: list[ int ] | None = None if is_null( key ) else table.get( key )
+            if matches:
+                left_rows.extend( [ i ]*len( matches ) )
+                right_rows.extend( matches )
+            #
+            elif how == "left":
+                left_rows.append( i )
+                right_rows.append( None )
+            #
+        #/for i, key in enumerate( left_keys )
+    #
+    else:
+        for i, key in enumerate( left_keys ):
+            if not is_null( key ):
+                table.setdefault( key, [] ).append( i )
+            #
+        #
+        # Matches of each row of left, in the order of right
+        matched: dict[ int, list[ int ] ] = {}
+        for j, key in enumerate( right_keys ):
+            if is_null( key ):
+                continue
+            #
+            for i in table.get( key, () ):
+                matched.setdefault( i, [] ).append( j )
+            #
+        #/for j, key in enumerate( right_keys )
+        for i in range( len( left ) ):
+            if i in matched:
+                left_rows.extend( [ i ]*len( matched[ i ] ) )
+                right_rows.extend( matched[ i ] )
+            #
+            elif how == "left":
+                left_rows.append( i )
+                right_rows.append( None )
+            #
+        #/for i in range( len( left ) )
+    #/if len( right ) <= len( left )/else
+    
+    result: DataFrame = left._take_rows( left_rows )
+    right_columns: list[ str ] = [ col for col in right.keys() if col not in on ]
+    right_part: DataFrame = right._select_rows_andColumns(
+        columns = right_columns
+    )._take_rows( right_rows ) if right_columns else right
+    has_null: bool = None in right_rows
     
-    if len( new_df ) == 0:
-        if allow_zero:
-            return {}
+    name: str
+    for col in right_columns:
+        name = col
+        if col in result._fixed and col in right._fixed:
+            if result._fixed[ col ] == right._fixed[ col ] and not has_null:
+                continue
+            #
+            # Conflicting, so both become shift columns
+            result.makeColumn_shift( col )
+        #
+        if col in result._fixed or col in result._shift:
+            name = col + suffix
+            if name in result._fixed or name in result._shift:
+                raise ValueError(
+                    "Column {} of right is already in left, as is {}".format( col, name )
+                )
+            #
+        #/if col in result._fixed or col in result._shift
+        
+        if col in right._fixed:
+            if has_null or col in left._fixed:
+                result._shift[ name ] = [
+                    right._fixed[ col ] if j is not None else None for j in right_rows
+                ]
+            #
+            else:
+                result._fixed[ name ] = right._fixed[ col ]
+            #
+        #
         else:
-            raise Exception("Zero results")
+            result._shift[ name ] = right_part._shift[ col ]
+            if col in right_part._shiftIndex:
+                result._shiftIndex[ name ] = right_part._shiftIndex[ col ]
+                result._shiftIndexMap[ name ] = right_part._shiftIndexMap[ col ]
+            #
+        #/if col in right._fixed/else
+        if col in right._schema:
+            result._schema[ name ] = right._schema[ col ]
         #
-    #
-    
-    if len( new_df ) == 1:
-        return new_df[0]
-    #
-    
-    if len( new_df ) > 1:
-        raise Exception(
-            "Too many results;  len( new_df )={}".format(
-                len( new_df )
-            )
-        )
-    #
-    raise Exception("# Bad new_df={}".format(new_df))
-#/def filter_expectOne
-
-# -- Sorting
+        if result._typed and name in result._shift:
+            result._type_column( name )
+        #
+    #/for col in right_columns
+    result.shape = ( len( result ), len( result._fixed ) + len( result._shift ) )
+    return result
+#/def join
 
-def sortedBy(
-    df: DataFrame,
-    by: list[ str ]
+def concat(
+    frames: Sequence[ DataFrame ]
     ) -> DataFrame:
     """
-        :param DataFrame df: Frame to return new sorted version of
-        :param list[ str ] by: Columns by which to sort rows
+        :param Sequence[ DataFrame ] frames: Frames to stack, in order
+        :returns: The rows of every frame
+        :rtype: DataFrame
         
-        Returns a new df, sorting by the values in the `by` list of columns
-        Does not change the order of columns at all
+        Works out the columns of the result once, then adds each frame column by column with ``DataFrame.extend_columns()``:
+        
+        - A key fixed and equal in every frame stays fixed
+        - A key fixed with different values, like a "date" for each day, becomes a `shiftIndex` column, with one code for all the rows of each frame
+        - `shiftIndex` columns are unified, remapping the codes of each frame with one lookup per distinct value
+        - A key missing from a frame is `None` for its rows
+        
+        Schema and meta come from the first frame with them
     """
+    from copy import deepcopy
     
+    if len( frames ) == 0:
+        raise ValueError("No frames to concat")
+    #
     
-    # Get df as list of sorted dicts
-    # Return into a new df
-    list_sorted = [
-        row for row in df
-    ]
+    keys: list[ str ] = list( dict.fromkeys(
+        key for df in frames for key in df.keys()
+    ) )
+    fixed: dict[ str, any ] = {}
+    shiftIndexHeader: list[ str ] = []
+    shiftHeader: list[ str ] = []
+    for key in keys:
+        fixed_values: list = [ df._fixed[ key ] for df in frames if key in df._fixed ]
+        if len( fixed_values ) == len( frames ) and all(
+            val == fixed_values[0] for val in fixed_values
+        ):
+            fixed[ key ] = fixed_values[0]
+        #
+        elif fixed_values or any( key in df._shiftIndex for df in frames ):
+            shiftIndexHeader.append( key )
+        #
+        else:
+            shiftHeader.append( key )
+        #/switch key
+    #/for key in keys
     
-    list_sorted.sort(
-        key = lambda dict: tuple(
-            dict[ _key ] for _key in by
-        )
+    schema: dict[ str, pl.DataType ] = {}
+    for df in reversed( frames ):
+        schema |= df._schema
+    #
+    result: DataFrame = fromHeaders(
+        fixed = fixed,
+        shiftHeader = shiftHeader,
+        shiftIndexHeader = shiftIndexHeader,
+        schema = schema,
+        meta = deepcopy( next( ( df._meta for df in frames if df._meta ), {} ) ),
+        typed = frames[0]._typed
     )
-  
-    new_df: DataFrame = likeDataFrame( df )
-    for row in list_sorted:
-        new_df.append( row )
+    for df in frames:
+        result.extend_columns( df )
     #
-    
-    return new_df
-#/def sortedBy
+    return result
+#/def concat
 
 # -- Other transformations
 def _index(
-    shift: list
+    shift: list,
+    limit: int | None = None
     ) -> dict[{
         "shift": list[ int ],
         "shiftIndex": list
-    }]:
+    }] | None:
     """
         Gets the shift index representation of a column. Used by ``consolidate()`` to figure out if a column is worth converting to a `fixed` or `shiftIndex` column
+        
+        If there are `limit` or more unique values, stops as soon as it finds that many, and gives `None`
     """
     shiftDict: dict[{
         "shift": list[ int ],
@@ -1770,17 +5291,32 @@ def _index(
         "shift": [],
         "shiftIndex": []
     }
+    # value -> index in shiftDict["shiftIndex"]
+    shiftIndexMap: dict[ any, int ] = {}
     
     for val in shift:
         try:
-            # Existent item
-            i = shiftDict["shiftIndex"].index( val )
+            i = shiftIndexMap[ val ]
         #
-        except ValueError:
+        except KeyError:
             # Not yet present
             i = len( shiftDict["shiftIndex"] )
             shiftDict["shiftIndex"].append( val )
-        #/try i = shiftDict["shiftIndex"].index( val )/except ValueError
+            shiftIndexMap[ val ] = i
+        #
+        except TypeError:
+            # Unhashable, like a list; search instead
+            try:
+                i = shiftDict["shiftIndex"].index( val )
+            #
+            except ValueError:
+                i = len( shiftDict["shiftIndex"] )
+                shiftDict["shiftIndex"].append( val )
+            #/try i = shiftDict["shiftIndex"].index( val )/except ValueError
+        #/try i = shiftIndexMap[ val ]/except
+        if limit is not None and len( shiftDict["shiftIndex"] ) >= limit:
+            return None
+        #
         
         shiftDict["shift"].append( i )
     #/for val in shift
@@ -1795,27 +5331,69 @@ def _unindex(
         Converts a shift indexed column into just a raw list of values, aka a shift column
     """
     return [
-        shiftIndex[ key ] for key in shift
+        shiftIndex[ key ] if key is not None else None for key in shift
     ]
 #/def _unidex
 
+def _index_forConsolidate(
+    shift: list,
+    limit: int,
+    sample_rows: range | None = None,
+    sample_limit: int | None = None,
+    run_limit: int | None = None
+    ) -> dict[{
+        "shift": list[ int ],
+        "shiftIndex": list
+    }] | RunLengthColumn | None:
+    """
+        ``_index()`` of a column for ``consolidate()``, or `None` if there are `limit` or more unique values, or the `sample_rows` already have `sample_limit`
+        
+        If given `run_limit`, first tries run length encoding, giving a `RunLengthColumn` if it has more than one run and less than `run_limit`, as ``_runLength_column()`` counts them
+    """
+    if run_limit is not None:
+        runs: RunLengthColumn | None
+        if isinstance( shift, RunLengthColumn ):
+            runs = shift if len( shift.values ) < run_limit else None
+        #
+        else:
+            runs = _runLength_column( shift, limit = run_limit )
+        #
+        if runs is not None and len( runs.values ) > 1:
+            return runs
+        #
+    #/if run_limit is not None
+    if sample_rows is not None and _index(
+        [ shift[ i ] for i in sample_rows ],
+        limit = sample_limit
+    ) is None:
+        return None
+    #
+    return _index( shift, limit = limit )
+#/def _index_forConsolidate
+
 def consolidate(
     df: DataFrame,
     threshold: float|int = 0.5,
     make_fixed: bool = True,
-    unindex: bool = True
+    unindex: bool = True,
+    sample: int | None = None,
+    verbose: int = 0,
+    run_length: int | None = None
     ) -> DataFrame:
     """
         :param DataFrame df: Frame to consolidate and make more efficient
         :param float|int threshold: If the number of unique values is less than, it will be converted to a shiftIndex. Proportion of `len(df)` if a float, literal number if int.
         :param bool make_fixed: Places columns with a single unique value into `fixed`. If not, it goes into the `shiftIndex` instead.
         :param bool unindex: Whether to convert `shiftIndex` columns to `shift` columns if they surpas threshold in unique count
+        :param int|None sample: If given, and the df has more rows, first count the unique values in this many evenly spaced rows. Columns where the sample has as large a proportion of unique values as `threshold` allows are left as shift columns without a full pass. This is an estimate, so might leave a column that would just have been indexed
+        :param int verbose: If above 0, print the encoding chosen for each column
+        :param int|None run_length: If given, shift columns whose runs of a repeated value are at least this long on average (fewer than `len(df)//run_length + 1` runs) become a `RunLengthColumn`, ahead of a shiftIndex. Default `None`, so no column is run length encoded unless asked: it's opt in, since these columns are read only, with any write turning the whole column back into a list, and are saved in a form older versions can't read (see ``DataFrame.as_dict()``). If `None`, never
         
         Checks columns, converting to a shiftIndex when there are few enough unique values (less than `threshold`, as a proportion of `len(df)` rounded down if a float, literal amount if an int). If there's one unique value, it will become `fixed`, unless `make_fixed = False` in which case it will be in the `shiftIndex`
         
-        `shiftIndex` will stay the same if `unindex = False`. `fixed` values will stay fixed. `meta`, `schema`, and `customTypes` will be deepcopied.
-        
+        Each column is checked in one hashed pass, which stops as soon as there are too many unique values, after a pass counting runs which likewise stops as soon as there are too many.
         
+        `shiftIndex` will stay the same if `unindex = False`. `fixed` values will stay fixed. `meta`, `schema`, and `customTypes` will be deepcopied. Columns kept as they are share storage with `df`, copied on write. See ``DataFrame.encodings()`` for the encoding of each column of the result
     """
     from copy import deepcopy
     
@@ -1832,7 +5410,36 @@ def consolidate(
     fixed: dict[ str, any ] = {}
     shift: dict[ str, list ] = {}
     shiftIndex: dict[ str, list[ int ] ] = {}
+    # Kept as they are, so shared with `df`
+    shared: list[ str ] = []
+    
+    sample_rows: range | None = None
+    sample_limit: int | None = None
+    if sample is not None and len( df ) > sample:
+        sample_rows = range( 0, len( df ), len( df )//sample )
+        sample_limit = max( 2, threshold_int*len( sample_rows )//len( df ) )
+    #
+    run_limit: int | None = None
+    if run_length is not None:
+        run_limit = len( df )//run_length + 1
+    #
+    # A pass has to count to 2 to tell a single valued column, which can be fixed
+    index_limit: int = max( threshold_int, 2 ) if make_fixed else threshold_int
     
+    # The new storage for each shift column, or whether it's too many values
+    results: dict[ str, any ] = {}
+    for col in df.keys():
+        if col in df._shiftIndex:
+            if unindex and len( df._shiftIndex[col] ) >= threshold_int:
+                results[ col ] = _unindex( df._shift[ col ], df._shiftIndex[ col ] )
+            #
+        #
+        elif col in df._shift:
+            results[ col ] = _index_forConsolidate(
+                df._shift[ col ], index_limit, sample_rows, sample_limit, run_limit
+            )
+        #
+    #/for col in df.keys()
     
     for col in df.keys():
         if col in df.keys_fixed():
@@ -1840,17 +5447,15 @@ def consolidate(
         #
         elif col in df._shiftIndex:
             # Check if there are enough unique values to unindex
-            if unindex and len( df._shiftIndex[col] ) >= threshold_int:
+            if col in results:
                 # Many unique values, unindex
-                shift[ col ] = _unindex(
-                    shift = df._shift[ col ],
-                    shiftIndex = df._shiftIndex[ col ]
-                )
+                shift[ col ] = results[ col ]
             #
             else:
                 # Not enough unique values, leave as shiftIndex
-                shiftIndex[ col ] = deepcopy( df._shiftIndex[ col ] )
-                shift[ col ] = deepcopy( df._shift[ col ] )
+                shiftIndex[ col ] = df._shiftIndex[ col ]
+                shift[ col ] = df._shift[ col ]
+                shared.append( col )
             #
         #
         elif col in df._shift and col not in df._shiftIndex:
@@ -1858,34 +5463,64 @@ def consolidate(
             _shiftDict: dict[{
                 "shift": list[ int ],
                 "shiftIndex": list
-            }] = _index( df._shift[ col ] )
-            if make_fixed and len( _shiftDict[ "shiftIndex"] ) == 1:
+            }] | RunLengthColumn | None = results[ col ]
+            if isinstance( _shiftDict, RunLengthColumn ):
+                # Long runs of repeated values
+                shift[ col ] = _shiftDict
+            #
+            elif _shiftDict is None:
+                # Too many unique values, do not index
+                shift[ col ] = df._shift[ col ]
+                shared.append( col )
+            #
+            elif make_fixed and len( _shiftDict[ "shiftIndex"] ) == 1:
                 # One value, it can be fixed
                 fixed[ col ] = _shiftDict["shiftIndex"][ 0 ]
             #
-            elif len( _shiftDict[ "shiftIndex" ] ) < threshold_int:
+            elif len( _shiftDict["shiftIndex"] ) >= threshold_int:
+                # Counted past the threshold to check for one value, so too many to index
+                shift[ col ] = df._shift[ col ]
+                shared.append( col )
+            #
+            else:
                 # Few enough values to index
                 shiftIndex[ col ] = _shiftDict["shiftIndex"]
                 shift[ col ] = _shiftDict["shift"]
             #
-            else:
-                # Too many unique values, do not index
-                shift[ col ] = deepcopy( df._shift[ col ] )
-            #
         #
         else:
             raise Exception("Bad df.keys()={}".format( df.keys() ))
         #/switch col
     #/for col in df.keys()
     
-    return DataFrame(
+    new_df: DataFrame = DataFrame(
         fixed = fixed,
         shift = shift,
         shiftIndex = shiftIndex,
         schema = deepcopy( df._schema ),
         meta = deepcopy( df._meta ),
-        customTypes = deepcopy( df._customTypes )
+        customTypes = deepcopy( df._customTypes ),
+        typed = df._typed
     )
+    # Same rows in the same order
+    new_df._sortedBy = df._sortedBy
+    for col in shared:
+        if new_df._shift[ col ] is df._shift[ col ]:
+            df._shared.add( col )
+            new_df._shared.add( col )
+        #
+        if col in shiftIndex:
+            df._sharedIndex.add( col )
+            new_df._sharedIndex.add( col )
+        #
+    #/for col in shared
+    
+    if verbose > 0:
+        for col, encoding in new_df.encodings().items():
+            print("{}: {}".format( col, encoding ))
+        #
+    #
+    return new_df
 #/def consolidate
 
 ## -- Second Order stats (Method of moments online estimator)
@@ -1896,6 +5531,8 @@ def fromSecondOrderStats(
     standard_error: bool = True,
     digits: int = 3
     ) -> DataFrame:
+    from .printing import secondOrderString
+    
     if len( stats ) == 0:
         return DataFrame()
     #
@@ -1909,31 +5546,348 @@ def fromSecondOrderStats(
         shiftIndexHeader = groups
     )
     
-    for key, val in stats.items():
-        # key: tuple of groups
-        # val: { numeric: [ power0, power1, power 2]
-        
-        row = {}
-        
-        # Set groups
-        for j in range( len(groups ) ):
-            row[ groups[j] ] = key[j]
-        #
-        
-        # Set numerics
-        for col in numerics:
-            row[ col ] = secondOrderString(
+    # key: tuple of groups
+    # val: { numeric: [ power0, power1, power 2]
+    columns: dict[ str, list ] = {
+        groups[j]: [ key[j] for key in stats ] for j in range( len( groups ) )
+    } | {
+        col: [
+            secondOrderString(
                 val[ col ],
                 standard_error = standard_error,
                 digits = digits
-            )
-        #
-        df.append( row )
-    #/for key, val in stats.items()
+            ) for val in stats.values()
+        ] for col in numerics
+    }
+    df.extend_columns( columns )
     
     return df
 #/def fromSecondOrderStats
 
+def _group_counts(
+    ids: Sequence[ int ],
+    n_groups: int
+    ) -> array:
+    """
+        :returns: The number of rows in each group, from ``DataFrame._group_ids()``
+        :rtype: array
+    """
+    counts: array = array( 'q', [ 0 ] )*n_groups
+    for group in ids:
+        counts[ group ] += 1
+    #
+    return counts
+#/def _group_counts
+
+def _group_sums(
+    ids: Sequence[ int ],
+    values: Iterable,
+    floats: bool = False
+    ) -> tuple[ list | array, list | array ]:
+    """
+        :param Sequence[ int ] ids: Group of each row, numbered in order of first appearance, from ``DataFrame._group_ids()``
+        :param Iterable values: Value of each row
+        :param bool floats: If `True` the values are known to be floats, so accumulate in `array.array('d')`
+        :returns: The sum, and the sum of squares, of the values in each group
+        :rtype: tuple[ list|array, list|array ]
+        
+        Adds in row order, starting from each group's first value, so the results are exactly those of summing row by row. Otherwise python numbers are kept as they are, like arbitrarily large `int`
+    """
+    sums: list | array = array('d') if floats else []
+    squares: list | array = array('d') if floats else []
+    for group, val in zip( ids, values ):
+        if group == len( sums ):
+            # First row of the group
+            sums.append( val )
+            squares.append( val**2 )
+        #
+        else:
+            sums[ group ] += val
+            squares[ group ] += val**2
+        #
+    #/for group, val in zip( ids, values )
+    return sums, squares
+#/def _group_sums
+
+def _agg_count(
+    ids: Sequence[ int ],
+    values: Iterable,
+    n_groups: int
+    ) -> list[ int ]:
+    counts: array = array( 'q', [ 0 ] )*n_groups
+    for group, val in zip( ids, values ):
+        if val is not None:
+            counts[ group ] += 1
+        #
+    #
+    return counts.tolist()
+#/def _agg_count
+
+def _agg_sum(
+    ids: Sequence[ int ],
+    values: Iterable,
+    n_groups: int
+    ) -> list:
+    sums: list = [ 0 ]*n_groups
+    for group, val in zip( ids, values ):
+        if val is not None:
+            sums[ group ] += val
+        #
+    #
+    return sums
+#/def _agg_sum
+
+def _agg_mean(
+    ids: Sequence[ int ],
+    values: Iterable,
+    n_groups: int
+    ) -> list[ float | None ]:
+    sums: list = [ 0 ]*n_groups
+    counts: array = array( 'q', [ 0 ] )*n_groups
+    for group, val in zip( ids, values ):
+        if val is not None:
+            sums[ group ] += val
+            counts[ group ] += 1
+        #
+    #
+    return [
+        sums[ group ]/counts[ group ] if counts[ group ] > 0 else None
+        for group in range( n_groups )
+    ]
+#/def _agg_mean
+
+def _agg_min(
+    ids: Sequence[ int ],
+    values: Iterable,
+    n_groups: int
+    ) -> list:
+    result: list = [ None ]*n_groups
+    for group, val in zip( ids, values ):
+        if val is not None and ( result[ group ] is None or val < result[ group ] ):
+            result[ group ] = val
+        #
+    #
+    return result
+#/def _agg_min
+
+def _agg_max(
+    ids: Sequence[ int ],
+    values: Iterable,
+    n_groups: int
+    ) -> list:
+    result: list = [ None ]*n_groups
+    for group, val in zip( ids, values ):
+        if val is not None and ( result[ group ] is None or val > result[ group ] ):
+            result[ group ] = val
+        #
+    #
+    return result
+#/def _agg_max
+
+def _agg_var(
+    ids: Sequence[ int ],
+    values: Iterable,
+    n_groups: int
+    ) -> list[ float | None ]:
+    # Welford's method, for accuracy in one pass
+    counts: array = array( 'q', [ 0 ] )*n_groups
+    means: array = array( 'd', [ 0.0 ] )*n_groups
+    m2: array = array( 'd', [ 0.0 ] )*n_groups
+    delta: float
+    for group, val in zip( ids, values ):
+        if val is None:
+            continue
+        #
+        counts[ group ] += 1
+        delta = val - means[ group ]
+        means[ group ] += delta/counts[ group ]
+        m2[ group ] += delta*( val - means[ group ] )
+    #/for group, val in zip( ids, values )
+    return [
+        m2[ group ]/( counts[ group ] - 1 ) if counts[ group ] > 1 else None
+        for group in range( n_groups )
+    ]
+#/def _agg_var
+
+def _agg_first(
+    ids: Sequence[ int ],
+    values: Iterable,
+    n_groups: int
+    ) -> list:
+    result: list = []
+    for group, val in zip( ids, values ):
+        if group == len( result ):
+            # Groups are numbered by first appearance
+            result.append( val )
+        #
+    #
+    return result
+#/def _agg_first
+
+def _agg_last(
+    ids: Sequence[ int ],
+    values: Iterable,
+    n_groups: int
+    ) -> list:
+    result: list = [ None ]*n_groups
+    for group, val in zip( ids, values ):
+        result[ group ] = val
+    #
+    return result
+#/def _agg_last
+
+def _agg_n_unique(
+    ids: Sequence[ int ],
+    values: Iterable,
+    n_groups: int
+    ) -> list[ int ]:
+    seen: set[ tuple[ int, any ] ] = set()
+    counts: array = array( 'q', [ 0 ] )*n_groups
+    for pair in zip( ids, values ):
+        if pair[1] is not None and pair not in seen:
+            seen.add( pair )
+            counts[ pair[0] ] += 1
+        #
+    #
+    return counts.tolist()
+#/def _agg_n_unique
+
+# Functions for ``GroupBy.agg()``, from the group of each row, the values, and the number of groups to the result for each group
+_AGGREGATIONS: dict[ str, Callable[ [ Sequence[ int ], Iterable, int ], list ] ] = {
+    "count": _agg_count,
+    "sum": _agg_sum,
+    "mean": _agg_mean,
+    "min": _agg_min,
+    "max": _agg_max,
+    "var": _agg_var,
+    "first": _agg_first,
+    "last": _agg_last,
+    "n_unique": _agg_n_unique
+}
+
+def _agg_spec(
+    spec: str | tuple[ str, str ]
+    ) -> tuple[ str | None, str ]:
+    """
+        A spec for ``GroupBy.agg()`` as `( col, function )`, with `None` for the col of `"count"`
+    """
+    if spec == "count":
+        return ( None, "count" )
+    #
+    if isinstance( spec, str ) or not isinstance( spec, Sequence ) or len( spec ) != 2\
+        or not all( isinstance( part, str ) for part in spec ):
+        raise ValueError(
+            "Bad spec={!r}, expected \"count\" or a ( col, function ) pair".format( spec )
+        )
+    #
+    return tuple( spec )
+#/def _agg_spec
+
+class GroupBy():
+    """
+        The rows of a df grouped by the values of some columns. Made by ``DataFrame.group_by()``, and aggregated with ``.agg()``
+        
+        Rows are grouped once, when this is made, so it can be aggregated several times
+    """
+    def __init__(
+        self: Self,
+        df: DataFrame,
+        groups: str | Sequence[ str ]
+        ):
+        if isinstance( groups, str ):
+            groups = [ groups ]
+        #
+        self.df: DataFrame = df
+        self.groups: list[ str ] = list( groups )
+        self._ids: list[ int ]
+        self._keys: list[ tuple ]
+        self._ids, self._keys = df._group_ids( self.groups )
+    #/def __init__
+    
+    def __len__( self: Self ) -> int:
+        return len( self._keys )
+    #
+    
+    def agg(
+        self: Self,
+        *aggs: str | tuple[ str, str ],
+        **named: str | tuple[ str, str ]
+        ) -> DataFrame:
+        """
+            :param str|tuple[ str, str ] aggs: `( col, function )` pairs, giving columns named like `"col_function"`, or `"count"` for a `"count"` column of the rows in each group
+            :param str|tuple[ str, str ] named: The same, giving columns with the keyword as their name
+            :raises ValueError: For a spec that's neither `"count"` nor a `( col, function )` pair, or an unknown function
+            :returns: A df with a row for each group, in order of first appearance. The `groups` columns are in `shiftIndex`, or in `fixed` if there's one group, followed by the aggregations
+            :rtype: DataFrame
+            
+            Functions are "count", "sum", "mean", "min", "max", "var" (sample variance), "first", "last", and "n_unique". `None` values are skipped, except by "first" and "last"
+            
+            Each aggregation is one pass down its column, without building rows
+        """
+        specs: dict[ str, tuple[ str | None, str ] ] = {}
+        for spec in aggs:
+            col, function = _agg_spec( spec )
+            specs[ "count" if col is None else "{}_{}".format( col, function ) ] = ( col, function )
+        #
+        for name, spec in named.items():
+            specs[ name ] = _agg_spec( spec )
+        #
+        
+        keys: list[ str ] = self.df.keys()
+        for name, ( col, function ) in specs.items():
+            if function not in _AGGREGATIONS:
+                raise ValueError(
+                    "Unknown function={} for {}, expected one of {}".format(
+                        function, name, list( _AGGREGATIONS )
+                    )
+                )
+            #
+            if col is not None and col not in keys:
+                raise KeyError( col )
+            #
+        #/for name, ( col, function ) in specs.items()
+        
+        n_groups: int = len( self._keys )
+        columns: dict[ str, list ] = {}
+        for name, ( col, function ) in specs.items():
+            if col is None:
+                columns[ name ] = _group_counts( self._ids, n_groups ).tolist()
+            #
+            else:
+                columns[ name ] = _AGGREGATIONS[ function ](
+                    self._ids, self.df._iter_col( col ), n_groups
+                )
+            #
+        #/for name, ( col, function ) in specs.items()
+        
+        schema: dict[ str, pl.DataType ] = {
+            col: self.df._schema[ col ] for col in self.groups if col in self.df._schema
+        }
+        if n_groups == 1:
+            result: DataFrame = DataFrame(
+                fixed = dict( zip( self.groups, self._keys[0] ) ),
+                shift = columns,
+                shiftIndex = {},
+                schema = schema,
+                meta = {}
+            )
+            result._len = 1
+            result.shape = ( 1, result.shape[1] )
+            return result
+        #/if n_groups == 1
+        
+        result = fromHeaders(
+            shiftHeader = list( specs ),
+            shiftIndexHeader = self.groups,
+            schema = schema
+        )
+        result.extend_columns( {
+            self.groups[j]: [ key[j] for key in self._keys ] for j in range( len( self.groups ) )
+        } | columns )
+        return result
+    #/def agg
+#/class GroupBy
+
 def secondOrderStats(
     df: DataFrame,
     groups: list[ str ],
@@ -1944,36 +5898,197 @@ def secondOrderStats(
         
         Returning dict values are dicts with keys the columns from `numerics`, with values a three item list, of the sum of powers 0, 1, and 2 of those numeric values
     """
+    # Rows are grouped once, then each numeric column is summed by group in one pass
+    ids: list[ int ]
+    keys: list[ tuple ]
+    ids, keys = df._group_ids( groups )
+    counts: array = _group_counts( ids, len( keys ) )
+    
     summary: dict[
         tuple[any,...],
         dict[
             str,
             list[float]
         ]
-    ] = {}
-    for row in df:
-        row_key = tuple(
-            row[ col ] for col in groups
+    ] = { key: {} for key in keys }
+    for col in numerics:
+        column: Sequence | None = df._shift.get( col )
+        sums, squares = _group_sums(
+            ids,
+            df._iter_col( col ),
+            floats = col not in df._shiftIndex and isinstance(
+                column, array | memoryview
+            ) and getattr( column, "typecode", getattr( column, "format", None ) ) in ( 'f', 'd' )
         )
-        if row_key in summary:
-            for col in numerics:
-                summary[ row_key ][ col ][0] += 1 # Power 0
-                summary[ row_key ][ col ][1] += row[ col ] # Power 1
-                summary[ row_key ][ col ][2] += row[ col ]**2 # Power 2
-            #
+        for group, key in enumerate( keys ):
+            summary[ key ][ col ] = [
+                counts[ group ], # Power 0
+                sums[ group ], # Power 1
+                squares[ group ] # Power 2
+            ]
         #
-        else:
-            # New item; initialize each dict
-            summary[ row_key ] = {}
-            for col in numerics:
-                summary[ row_key ][ col ] = [
-                    1, # Power 0
-                    row[ col ], # Power 1
-                    row[ col ]**2 # Power 2
-                ]
-            #/for col in numerics
-        #/if row_key in summary/else
-    #/for row in df
+    #/for col in numerics
     
     return summary
 #/def secondOrderStats
+
+def _has_floats(
+    powers: list[float]
+    ) -> bool:
+    """
+        If the sums from ``secondOrderStats()`` are floats, so their rounding depends on the order they were added in
+    """
+    return any( isinstance( val, float ) for val in powers )
+#/def _has_floats
+
+def merge_secondOrderStats(
+    stats: Iterable[ dict[ tuple[any,...], dict[ str, list[float] ] ] ]
+    ) -> dict[ tuple[any,...], dict[ str, list[float] ] ]:
+    """
+        :param Iterable[ dict ] stats: Results of ``secondOrderStats()`` on parts of the rows, in order
+        :returns: The result for all the rows together, as if from one call to ``secondOrderStats()``
+        :rtype: dict[ tuple[any,...], dict[ str, list[float] ] ]
+        
+        Groups are in order of first appearance through `stats`, just as in one call, and the counts and sums are exactly those of one call
+        
+        :raises ValueError: If a group has float sums in more than one part. One call adds each value to a running sum, rounding as it goes, and adding up the rounded sums of parts can't give the same bits. See ``secondOrderStats_parallel()``, which works out float columns in one pass instead
+    """
+    merged: dict[ tuple[any,...], dict[ str, list[float] ] ] = {}
+    for partial in stats:
+        for key, cols in partial.items():
+            if key not in merged:
+                merged[ key ] = { col: list( powers ) for col, powers in cols.items() }
+                continue
+            #
+            for col, powers in cols.items():
+                if _has_floats( powers ) or _has_floats( merged[ key ][ col ] ):
+                    raise ValueError(
+                        "Float sums of col={} for key={} are in more than one part, so merging them can differ from one call".format(
+                            col, key
+                        )
+                    )
+                #
+                for j in range( len( powers ) ):
+                    merged[ key ][ col ][ j ] += powers[ j ]
+                #
+            #/for col, powers in cols.items()
+        #/for key, cols in partial.items()
+    #/for partial in stats
+    return merged
+#/def merge_secondOrderStats
+
+def _secondOrderStats_forPart(
+    part: DataFrame | str,
+    groups: list[ str ],
+    numerics: list[ str ]
+    ) -> dict[ tuple[any,...], dict[ str, list[float] ] ]:
+    """
+        Runs in a worker process for ``secondOrderStats_parallel()``, on a df or the path to a jable file
+    """
+    if isinstance( part, str ):
+        part = _read_part( part, list( dict.fromkeys( list( groups ) + list( numerics ) ) ) )
+    #
+    return secondOrderStats( part, groups, numerics )
+#/def _secondOrderStats_forPart
+
+def _read_part(
+    fp: str,
+    columns: list[ str ]
+    ) -> DataFrame:
+    """
+        Reads `columns` of a jable file, json or binary, for ``secondOrderStats_parallel()``
+    """
+    with open( fp, 'rb' ) as _file:
+        is_binary: bool = _file.read( len( _BINARY_MAGIC ) ) == _BINARY_MAGIC
+    #
+    if is_binary:
+        return read_binary( fp, columns = columns )
+    #
+    return read_file( fp, columns = columns )
+#/def _read_part
+
+def secondOrderStats_parallel(
+    source: DataFrame | Sequence[ str ],
+    groups: list[ str ],
+    numerics: list[ str ],
+    workers: int | None = None
+    ) -> dict[ tuple[any,...], dict[ str, list[float] ] ]:
+    """
+        :param DataFrame|Sequence[ str ] source: A df, or paths to jable files (json or binary) to treat as consecutive parts of one df
+        :param list[ str ] groups: As in ``secondOrderStats()``
+        :param list[ str ] numerics: As in ``secondOrderStats()``
+        :param int|None workers: Number of processes. Default is one per core
+        :returns: Exactly the same as ``secondOrderStats()`` on all the rows
+        :rtype: dict[ tuple[any,...], dict[ str, list[float] ] ]
+        
+        Map reduce over a `ProcessPoolExecutor`. A df is split into one consecutive block of rows per worker, with only the columns needed, and each file is read by a worker, again only the columns needed
+        
+        Counts and integer sums of the parts add up exactly. Columns with float sums are worked out again in one pass over all the rows, here, since adding up rounded sums of parts can differ in the last bits; see ``merge_secondOrderStats()``
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from os import cpu_count
+    
+    if workers is None:
+        workers = cpu_count() or 1
+    #
+    
+    parts: list[ DataFrame | str ]
+    if isinstance( source, DataFrame ):
+        columns: list[ str ] = list( dict.fromkeys( list( groups ) + list( numerics ) ) )
+        size: int = max( 1, -( -len( source )//workers ) )
+        parts = []
+        for start in range( 0, len( source ), size ):
+            part: DataFrame = source._select_rows_andColumns(
+                rows = range( start, min( start + size, len( source ) ) ),
+                columns = columns
+            )
+            # Only send the rows of the part to the worker
+            part.materialize()
+            parts.append( part )
+        #/for start in range( 0, len( source ), size )
+    #
+    else:
+        parts = list( source )
+    #/if isinstance( source, DataFrame )/else
+    
+    partials: list[ dict[ tuple[any,...], dict[ str, list[float] ] ] ]
+    if len( parts ) <= 1 or workers == 1:
+        partials = [ _secondOrderStats_forPart( part, groups, numerics ) for part in parts ]
+    #
+    else:
+        with ProcessPoolExecutor( max_workers = min( workers, len( parts ) ) ) as executor:
+            partials = list( executor.map(
+                _secondOrderStats_forPart, parts, repeat( groups ), repeat( numerics )
+            ) )
+        #
+    #/if len( parts ) <= 1 or workers == 1/else
+    if len( partials ) <= 1:
+        return partials[0] if partials else {}
+    #
+    
+    floats: list[ str ] = [
+        col for col in numerics if any(
+            _has_floats( cols[ col ] ) for partial in partials for cols in partial.values()
+        )
+    ]
+    merged: dict[ tuple[any,...], dict[ str, list[float] ] ] = merge_secondOrderStats(
+        {
+            key: { col: powers for col, powers in cols.items() if col not in floats }\
+                for key, cols in partial.items()
+        } for partial in partials
+    )
+    if floats:
+        whole: DataFrame = source if isinstance( source, DataFrame ) else concat([
+            _read_part( part, list( dict.fromkeys( list( groups ) + floats ) ) ) for part in parts
+        ])
+        exact: dict[ tuple[any,...], dict[ str, list[float] ] ] = secondOrderStats(
+            whole, groups, floats
+        )
+        for key in merged:
+            merged[ key ] = {
+                col: exact[ key ][ col ] if col in floats else merged[ key ][ col ] for col in numerics
+            }
+        #
+    #/if floats
+    return merged
+#/def secondOrderStats_parallel
@@ -248,9 +248,16 @@ def prettyprint(
     print( ' '.join( next_list ) )
     
     # data
-    for i in range( min( max_rows, len(table) ) ):
+    if hasattr( table, "iter_tuples" ):
+        # Only the printed columns, without building each row
+        rows = table.iter_tuples( columns )
+    #
+    else:
+        rows = ( [ table[i][ col ] for col in columns ] for i in range( len( table ) ) )
+    #
+    for _, row in zip( range( min( max_rows, len(table) ) ), rows ):
         next_list = _get_rowList(
-            [ table[i][ col ] for col in columns ],
+            row,
             column_width
         )
         
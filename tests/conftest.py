@@ -0,0 +1,22 @@
+"""
+    Frames shared by the test modules
+"""
+import pytest
+
+from jable.jyFrame import DataFrame
+
+@pytest.fixture
+def cities() -> DataFrame:
+    """
+        Five rows, with a fixed column, plain shift columns, and a `shiftIndex` column
+    """
+    return DataFrame(
+        fixed = { "run": 1 },
+        shift = {
+            "id": [ 10, 11, 12, 13, 14 ],
+            "city": [ 0, 1, 0, 1, 0 ],
+            "n": [ 1, 1, 2, 2, 3 ]
+        },
+        shiftIndex = { "city": [ "Paris", "Rome" ] }
+    )
+#
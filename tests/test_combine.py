@@ -0,0 +1,100 @@
+"""
+    Combining frames: joins and concat
+"""
+import pytest
+
+from jable.jyFrame import DataFrame, concat, join
+
+# -- Joins
+
+@pytest.fixture
+def left() -> DataFrame:
+    return DataFrame(
+        fixed = { "run": 1, "src": "L" },
+        shift = { "k": [ 0, 1, None, 0, 2 ], "v": [ 1, 2, 3, 4, 5 ] },
+        shiftIndex = { "k": [ "a", "b", "c" ] }
+    )
+#
+
+@pytest.fixture
+def right() -> DataFrame:
+    """
+        Keys in a different dictionary from `left`
+    """
+    return DataFrame(
+        fixed = { "run": 1, "src": "R" },
+        shift = { "k": [ 0, 1, 0 ], "v": [ 10, 20, 30 ] },
+        shiftIndex = { "k": [ "b", "a" ] }
+    )
+#
+
+def test_join_inner( left: DataFrame, right: DataFrame ):
+    joined: DataFrame = join( left, right, "k" )
+    assert joined._fixed == { "run": 1 }
+    assert [ ( row["k"], row["v"], row["v_right"] ) for row in joined ] == [
+        ( "a", 1, 20 ), ( "b", 2, 10 ), ( "b", 2, 30 ), ( "a", 4, 20 )
+    ]
+    assert list( joined["src"] ) == [ "L" ]*4
+    assert list( joined["src_right"] ) == [ "R" ]*4
+#
+
+def test_join_left_keeps_unmatched( left: DataFrame, right: DataFrame ):
+    joined: DataFrame = join( left, right, "k", how = "left" )
+    assert [ ( row["k"], row["v"], row["v_right"] ) for row in joined ] == [
+        ( "a", 1, 20 ), ( "b", 2, 10 ), ( "b", 2, 30 ), ( None, 3, None ),
+        ( "a", 4, 20 ), ( "c", 5, None )
+    ]
+    # Against plain shift keys
+    plain: DataFrame = DataFrame( fixed = {}, shift = { "k": [ "a", "zz" ], "w": [ 7, 8 ] }, shiftIndex = {} )
+    assert list( join( left, plain, "k", how = "left" )["w"] ) == [ 7, None, None, 7, None ]
+#
+
+def test_join_semi_and_anti( left: DataFrame, right: DataFrame ):
+    semi: DataFrame = join( left, right, "k", how = "semi" )
+    anti: DataFrame = join( left, right, "k", how = "anti" )
+    assert semi.keys() == anti.keys() == left.keys()
+    assert list( semi["v"] ) == [ 1, 2, 4 ]
+    # None keys never match
+    assert list( anti["v"] ) == [ 3, 5 ]
+#
+
+def test_join_several_keys_and_suffix( left: DataFrame, right: DataFrame ):
+    joined: DataFrame = join( left, right, [ "k", "run" ], suffix = "_r" )
+    assert "v_r" in joined.keys() and "src_r" in joined.keys()
+    assert list( joined["v_r"] ) == [ 20, 10, 30, 20 ]
+    with pytest.raises( ValueError ):
+        join( left, right, "k", how = "outer" )
+    #
+#
+
+# -- Concat
+
+def test_concat_rows_in_order( left: DataFrame, right: DataFrame ):
+    result: DataFrame = concat([ left, right ])
+    assert result.keys() == left.keys()
+    assert list( result ) == list( left ) + list( right )
+    # Keys missing from a frame are None for its rows
+    plain: DataFrame = DataFrame( fixed = {}, shift = { "k": [ "a" ], "w": [ 7 ] }, shiftIndex = {} )
+    assert list( concat([ left, plain ])["w"] ) == [ None ]*5 + [ 7 ]
+#
+
+def test_concat_layout( left: DataFrame, right: DataFrame ):
+    result: DataFrame = concat([ left, right ])
+    assert result._fixed == { "run": 1 }
+    # A fixed value differing between frames gets one code per frame
+    assert result._shiftIndex["src"] == [ "L", "R" ]
+    assert result._shift["src"] == [ 0 ]*5 + [ 1 ]*3
+    # One dictionary for a key in shiftIndex in any frame
+    assert result._shiftIndex["k"] == [ "a", "b", "c" ]
+    assert result._shift["k"] == [ 0, 1, None, 0, 2, 1, 0, 1 ]
+#
+
+def test_concat_meta_copied( left: DataFrame, right: DataFrame ):
+    left._meta["m"] = 1
+    result: DataFrame = concat([ left, right ])
+    result._meta["m"] = 2
+    assert left._meta == { "m": 1 }
+    with pytest.raises( ValueError ):
+        concat([])
+    #
+#
@@ -0,0 +1,102 @@
+"""
+    Choosing column encodings, ``consolidate()``
+"""
+import pytest
+
+from jable.jyFrame import DataFrame, _index, _runLength_column, consolidate
+
+@pytest.fixture
+def encodable() -> DataFrame:
+    """
+        A column for each encoding ``consolidate()`` can choose
+    """
+    n: int = 100
+    return DataFrame(
+        fixed = { "run": 1 },
+        shift = {
+            "one": [ "a" ]*n,
+            "few": [ i % 3 for i in range( n ) ],
+            "many": list( range( n ) ),
+            "c": list( range( n ) ),
+            "runs": [ i//25 for i in range( n ) ]
+        },
+        shiftIndex = { "c": list( range( n ) ) },
+        meta = { "m": [ 1 ] }
+    )
+#
+
+def test_encodings( encodable: DataFrame ):
+    new_df: DataFrame = consolidate( encodable )
+    assert new_df.encodings() == {
+        "run": "fixed", "one": "fixed", "few": "shiftIndex", "many": "shift", "c": "shift",
+        "runs": "shiftIndex"
+    }
+    assert list( new_df ) == list( encodable )
+    assert consolidate( encodable, make_fixed = False, unindex = False ).encodings() == {
+        "run": "fixed", "one": "shiftIndex", "few": "shiftIndex", "many": "shift", "c": "shiftIndex",
+        "runs": "shiftIndex"
+    }
+#
+
+@pytest.mark.parametrize( "threshold", [ 0.5, 1 ] )
+def test_fixed_under_small_threshold( threshold: float | int ):
+    df: DataFrame = DataFrame( fixed = {}, shift = { "a": [ 1, 1 ], "b": [ 1, 2 ] }, shiftIndex = {} )
+    new_df: DataFrame = consolidate( df, threshold = threshold )
+    assert new_df._fixed == { "a": 1 }
+    assert new_df.encodings() == { "a": "fixed", "b": "shift" }
+    assert list( new_df ) == list( df )
+    assert consolidate( df, threshold = threshold, make_fixed = False ).encodings() == {
+        "a": "shift", "b": "shift"
+    }
+    assert consolidate( df, threshold = 2 ).encodings() == { "a": "fixed", "b": "shift" }
+#
+
+def test_index_stops_early():
+    assert _index([ 1, 2, 3, 1 ], limit = 3 ) is None
+    assert _index([ 1, 2, 1 ]) == { "shift": [ 0, 1, 0 ], "shiftIndex": [ 1, 2 ] }
+#
+
+def test_sample():
+    # Every sampled row is distinct, though the column has few values
+    df: DataFrame = DataFrame(
+        fixed = {},
+        shift = { "x": [ i if i % 10 == 0 else 0 for i in range( 100 ) ] },
+        shiftIndex = {}
+    )
+    assert consolidate( df, threshold = 20 ).encodings() == { "x": "shiftIndex" }
+    assert consolidate( df, threshold = 20, sample = 10 ).encodings() == { "x": "shift" }
+#
+
+def test_kept_columns_shared_on_write( encodable: DataFrame ):
+    new_df: DataFrame = consolidate( encodable )
+    assert new_df._shift["many"] is encodable._shift["many"]
+    new_df[ 0, "many" ] = -1
+    new_df._meta["m"].append( 2 )
+    assert encodable[0]["many"] == 0 and encodable._meta == { "m": [ 1 ] }
+#
+
+def test_verbose( encodable: DataFrame, capsys ):
+    consolidate( encodable, verbose = 1 )
+    assert capsys.readouterr().out.splitlines() == [
+        "run: fixed", "one: fixed", "few: shiftIndex", "many: shift", "c: shift", "runs: shiftIndex"
+    ]
+#
+
+def test_run_length_opt_in( encodable: DataFrame ):
+    assert consolidate( encodable ).encodings()["runs"] == "shiftIndex"
+    assert consolidate( encodable, run_length = 25 ).encodings()["runs"] == "shiftRun"
+    # Runs too short on average
+    assert consolidate( encodable, run_length = 50 ).encodings()["runs"] == "shiftIndex"
+#
+
+def test_run_length_limit():
+    # 6 runs in 100 rows, against a limit of 100//20 + 1 = 6
+    df: DataFrame = DataFrame( fixed = {}, shift = { "r": [ i//17 for i in range( 100 ) ] }, shiftIndex = {} )
+    assert _runLength_column( df["r"], limit = 6 ) is None
+    assert len( _runLength_column( df["r"], limit = 7 ).values ) == 6
+    assert consolidate( df, run_length = 20 ).encodings() == { "r": "shiftIndex" }
+    assert consolidate( df, run_length = 16 ).encodings() == { "r": "shiftRun" }
+    # The same whether the column is a list or already run length encoded
+    runs: DataFrame = consolidate( df, run_length = 16 )
+    assert consolidate( runs, run_length = 20 ).encodings() == { "r": "shiftIndex" }
+#
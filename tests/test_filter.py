@@ -0,0 +1,287 @@
+"""
+    Finding rows: dict filters, expressions, hash indexes, and sorted ranges
+"""
+from typing import Callable
+
+import pytest
+
+from jable.jyFrame import DataFrame, Expr, col, filter, filter_expectOne, filter_returnFirst, lit
+
+def _row_by_row( df: DataFrame, test: Callable[ [ dict ], bool ] ) -> list[ int ]:
+    """
+        The rows matching `test`, checked one row dict at a time
+    """
+    return [ i for i in range( len( df ) ) if test( df[i] ) ]
+#
+
+# -- Dict filters
+
+@pytest.fixture
+def mixed() -> DataFrame:
+    """
+        `None` in a shiftIndex and a plain column, and unhashable values
+    """
+    return DataFrame(
+        fixed = { "run": 1 },
+        shift = {
+            "city": [ 0, 1, 0, None, 1, 0 ],
+            "n": [ 5, 5, 6, 5, None, 5 ],
+            "tags": [ [ "a" ], [], [ "a" ], [ "b" ], [], [ "a" ] ]
+        },
+        shiftIndex = { "city": [ "Paris", "Rome" ] }
+    )
+#
+
+@pytest.mark.parametrize( "jyFilter", [
+    { "city": "Paris" },
+    { "city": "Paris", "n": 5 },
+    { "n": 5, "city": "Rome" },
+    { "city": None },
+    { "n": None },
+    { "tags": [ "a" ] },
+    { "run": 1, "n": 6 },
+    { "run": 2 },
+    { "city": "Oslo" },
+    { "run": 1 },
+    {}
+] )
+def test_dict_matches_row_by_row( mixed: DataFrame, jyFilter: dict ):
+    assert mixed.get_matchingIndices( jyFilter ) == _row_by_row(
+        mixed, lambda row: all( row[ key ] == val for key, val in jyFilter.items() )
+    )
+#
+
+def test_dict_missing_key_raises( mixed: DataFrame ):
+    with pytest.raises( KeyError ):
+        mixed.get_matchingIndices({ "nope": 1 })
+    #
+#
+
+def test_dict_filter_functions( mixed: DataFrame ):
+    assert filter( mixed, { "city": "Paris", "n": 5 } )["tags"] == [ [ "a" ], [ "a" ] ]
+    assert filter_returnFirst( mixed, { "city": "Rome" } )["n"] == 5
+    assert filter_returnFirst( mixed, { "city": "Oslo" }, allow_zero = True ) == {}
+#
+
+# -- Expressions
+
+@pytest.fixture
+def people() -> DataFrame:
+    return DataFrame(
+        fixed = { "run": 2 },
+        shift = {
+            "age": [ 20, 35, None, 50 ],
+            "city": [ 0, 1, 0, None ]
+        },
+        shiftIndex = { "city": [ "Paris", "Rome" ] }
+    )
+#
+
+def test_expr_comparisons_and_logic( people: DataFrame ):
+    assert people.get_matchingIndices( col("age") > 30 ) == [ 1, 3 ]
+    assert people.get_matchingIndices( 30 < col("age") ) == [ 1, 3 ]
+    assert people.get_matchingIndices(
+        ( col("age") > 10 ) & ( col("city") == "Paris" )
+    ) == [ 0 ]
+    assert people.get_matchingIndices(
+        ( col("city") == "Rome" ) | ( col("age") >= 50 )
+    ) == [ 1, 3 ]
+    assert people.get_matchingIndices( ~( col("age") > 30 ) ) == [ 0, 2 ]
+    assert people.get_matchingIndices( col("city").is_in([ "Rome", "Oslo" ]) ) == [ 1 ]
+#
+
+def test_expr_nulls( people: DataFrame ):
+    assert people.evaluate( col("age") + 1 ) == [ 21, 36, None, 51 ]
+    assert people.get_matchingIndices( col("age").is_null() ) == [ 2 ]
+    assert people.get_matchingIndices( col("city").is_null() ) == [ 3 ]
+    assert people.get_matchingIndices( col("city").is_not_null() ) == [ 0, 1, 2 ]
+#
+
+def test_expr_arithmetic_and_fixed( people: DataFrame ):
+    assert people.evaluate( col("age")*col("run") - lit(1) ) == [ 39, 69, None, 99 ]
+    assert people.evaluate( col("run")**2 ) == [ 4 ]*4
+    assert people.evaluate( -col("run") ) == [ -2 ]*4
+#
+
+def test_expr_same_as_row_callable( people: DataFrame ):
+    expr = ( col("age") >= 35 ) | ( col("city") == "Paris" )
+    assert people.get_matchingIndices( expr ) == _row_by_row( people, expr )
+    assert filter( people, expr )["age"] == [ 20, 35, None, 50 ]
+#
+
+def test_add_column_keeps_layout( people: DataFrame ):
+    people.addColumn( "double", col("run")*2 )
+    people.addColumn( "loud", col("city") + "!" )
+    people.addColumn( "older", col("age") + 1 )
+    assert people._fixed["double"] == 4
+    assert "loud" in people._shiftIndex
+    assert people["loud"] == [ "Paris!", "Rome!", "Paris!", None ]
+    assert people["older"] == [ 21, 36, None, 51 ]
+#
+
+def test_expr_no_truth_value():
+    with pytest.raises( TypeError ):
+        bool( col("age") > 1 )
+    #
+    with pytest.raises( TypeError ):
+        Expr()
+    #
+#
+
+def test_expr_skips_unused_codes():
+    df: DataFrame = DataFrame( fixed = {}, shift = { "s": [ 0, 1, 0 ] }, shiftIndex = { "s": [ 1, "x" ] } )
+    df.remove([ 1 ])
+    # "x" stays in the dictionary, but no row has it
+    assert df._shiftIndex["s"] == [ 1, "x" ]
+    assert df.evaluate( col("s") + 1 ) == [ 2, 2 ]
+    assert df.get_matchingIndices( col("s")*2 == 2 ) == [ 0, 1 ]
+#
+
+# -- Hash indexes
+
+@pytest.fixture
+def indexed( cities: DataFrame ) -> DataFrame:
+    cities.create_index( "id" )
+    cities.create_index([ "city", "n" ])
+    return cities
+#
+
+def _check_indexes( df: DataFrame ) -> None:
+    """
+        Every index, as maintained, is what building it from scratch gives, and lookups through it match a search
+    """
+    for cols in df._indexes:
+        assert df._get_index( cols ) == df._build_index( cols )
+    #
+    for row in df:
+        assert df.get_matchingIndices({ "id": row["id"] }) == _row_by_row(
+            df, lambda other: other["id"] == row["id"]
+        )
+        assert df.get_matchingIndices({ "city": row["city"], "n": row["n"] }) == _row_by_row(
+            df, lambda other: ( other["city"], other["n"] ) == ( row["city"], row["n"] )
+        )
+    #
+#
+
+def test_index_lookup( indexed: DataFrame ):
+    _check_indexes( indexed )
+    assert filter_expectOne( indexed, { "id": 12 } )["n"] == 2
+    assert indexed.get_matchingIndices({ "id": 99 }) == []
+#
+
+@pytest.mark.parametrize( "change", [
+    lambda df: df.append({ "run": 1, "id": 15, "city": "Oslo", "n": 1 }),
+    lambda df: df.extend([ { "run": 1, "id": 16, "city": "Rome", "n": 2 } ]*3 ),
+    lambda df: df.insert( 1, { "run": 1, "id": 9, "city": "Paris", "n": 2 } ),
+    lambda df: df.__setitem__( 2, { "run": 1, "id": 20, "city": "Rome", "n": 1 } ),
+    lambda df: df.__setitem__( ( 3, "n" ), 3 ),
+    lambda df: df.__delitem__( 0 ),
+    lambda df: df.remove([ 1, 3 ]),
+    lambda df: df.remove([ True, False ]*2 + [ True ] ),
+    lambda df: df.remove_where({ "city": "Paris" })
+] )
+def test_index_maintained( indexed: DataFrame, change ):
+    change( indexed )
+    _check_indexes( indexed )
+#
+
+def test_drop_index( indexed: DataFrame ):
+    indexed.drop_index( "id" )
+    assert ( "id", ) not in indexed._indexes
+    assert indexed.get_matchingIndices({ "id": 13 }) == [ 3 ]
+#
+
+def test_index_unhashable_raises():
+    df: DataFrame = DataFrame( fixed = {}, shift = { "tags": [ [ 1 ] ] }, shiftIndex = {} )
+    with pytest.raises( TypeError ):
+        df.create_index( "tags" )
+    #
+#
+
+# -- Sorted ranges
+
+@pytest.fixture
+def times() -> DataFrame:
+    df: DataFrame = DataFrame(
+        fixed = {},
+        shift = { "t": [ 1, 2, 2, 4, 7 ], "v": [ "a", "b", "c", "d", "e" ] },
+        shiftIndex = {},
+        meta = { "user": True }
+    )
+    df.set_sortedBy( "t" )
+    return df
+#
+
+def test_sorted_declaration_checked( times: DataFrame ):
+    assert times.get_sortedBy() == "t"
+    with pytest.raises( ValueError ):
+        DataFrame( fixed = {}, shift = { "t": [ 2, 1 ] }, shiftIndex = {} ).set_sortedBy( "t" )
+    #
+    with pytest.raises( ValueError ):
+        DataFrame( fixed = {}, shift = { "t": [ 1, None ] }, shiftIndex = {} ).set_sortedBy( "t" )
+    #
+    with pytest.raises( ValueError ):
+        DataFrame( fixed = {}, shift = { "t": [ 1 ] }, shiftIndex = {} ).range_rows( 0, 1 )
+    #
+#
+
+def test_sorted_not_in_meta( times: DataFrame ):
+    assert times._meta == { "user": True }
+    assert times.as_dict()["_meta"] == { "user": True }
+    times.set_sortedBy( None )
+    assert times.get_sortedBy() is None and times._meta == { "user": True }
+#
+
+def test_sorted_ranges( times: DataFrame ):
+    assert times.range_rows( 2, 4 ) == slice( 1, 3 )
+    assert times.range_rows( 2, 4, include_upper = True ) == slice( 1, 4 )
+    assert times.range_rows( lower = 5 ) == slice( 4, 5 )
+    assert times.range_rows( upper = 0 ) == slice( 0, 0 )
+    assert times.range_rows( 5, 3 ) == slice( 4, 4 )
+    assert times.first_atOrAfter( 2 ) == 1
+    assert times.first_atOrAfter( 2, strict = True ) == 3
+    assert times.first_atOrAfter( 8 ) is None
+#
+
+@pytest.mark.parametrize( "expr", [
+    col("t") >= 2,
+    col("t") > 2,
+    col("t") < 4,
+    col("t") <= 4,
+    col("t") == 2,
+    ( col("t") > 1 ) & ( col("t") <= 4 ),
+    3 < col("t")
+] )
+def test_sorted_expr_uses_range( times: DataFrame, expr ):
+    assert times.get_matchingIndices( expr ) == _row_by_row( times, expr )
+#
+
+def test_sorted_other_type_same_as_unsorted( times: DataFrame ):
+    unsorted: DataFrame = times[[ "t", "v" ]]
+    unsorted.set_sortedBy( None )
+    for df in ( times, unsorted ):
+        assert df.get_matchingIndices( col("t") == "a" ) == []
+        assert filter_returnFirst( df, col("t") == "a", allow_zero = True ) == {}
+        with pytest.raises( TypeError ):
+            df.get_matchingIndices( col("t") < "a" )
+        #
+    #
+#
+
+def test_sorted_first_match( times: DataFrame ):
+    assert filter_returnFirst( times, col("t") > 2 )["v"] == "d"
+#
+
+def test_sorted_kept_or_cleared_by_changes( times: DataFrame ):
+    times.append({ "t": 9, "v": "f" })
+    assert times.get_sortedBy() == "t"
+    assert times[ 1:4 ].get_sortedBy() == "t"
+    assert times[[ 3, 1 ]].get_sortedBy() is None
+    assert times[[ "v" ]].get_sortedBy() is None
+    times[ 0, "t" ] = 3
+    assert times.get_sortedBy() is None
+    times[ 0, "t" ] = 1
+    times.set_sortedBy( "t" )
+    times.append({ "t": 0, "v": "g" })
+    assert times.get_sortedBy() is None
+#
@@ -0,0 +1,238 @@
+"""
+    Reading and writing frames: json files, the binary format, and polars
+"""
+import io
+import json
+
+import pytest
+
+import polars as pl
+
+from jable.jyFrame import (
+    DataFrame,
+    _JsonStreamReader,
+    consolidate,
+    from_polars,
+    fromFile,
+    fromFile_shift,
+    read_binary
+)
+
+# -- Streamed json
+
+@pytest.fixture
+def awkward() -> DataFrame:
+    """
+        Values with the characters an incremental json reader could trip on
+    """
+    return DataFrame(
+        fixed = { "run": "a \"quoted\" [value]" },
+        shift = {
+            "s": [ "x", "}{", "\\", "é", None ],
+            "n": [ 1, 2.5, -3, 4e10, None ],
+            "nested": [ [ 1, [ 2 ] ], { "k": "]" }, [], {}, "" ],
+            "c": [ 0, 1, 0, None, 1 ]
+        },
+        shiftIndex = { "c": [ "u", "v" ] },
+        meta = { "note": [ 1, 2 ] }
+    )
+#
+
+def test_stream_matches_whole_read( awkward: DataFrame, tmp_path ):
+    fp: str = str( tmp_path / "df.json" )
+    awkward.write_file( fp )
+    whole: DataFrame = fromFile( fp )
+    streamed: DataFrame = fromFile( fp, stream = True )
+    assert streamed.as_dict() == whole.as_dict()
+#
+
+def test_reader_across_small_chunks( awkward: DataFrame ):
+    text: str = json.dumps( awkward.as_dict() )
+    reader: _JsonStreamReader = _JsonStreamReader( io.StringIO( text ), chunk_size = 3 )
+    assert reader.read_value() == json.loads( text )
+#
+
+def test_iter_object_and_array():
+    text: str = ' { "a" : [ 1 , "]" , [ 2 ] ] , "b" : { "c" : null } } '
+    reader: _JsonStreamReader = _JsonStreamReader( io.StringIO( text ), chunk_size = 2 )
+    read: dict = {}
+    for key in reader.iter_object():
+        if key == "a":
+            read[ key ] = list( reader.iter_array() )
+        #
+        else:
+            read[ key ] = reader.read_value()
+        #
+    #
+    assert read == { "a": [ 1, "]", [ 2 ] ], "b": { "c": None } }
+#
+
+# -- Reading some columns
+
+@pytest.fixture
+def json_fp( tmp_path ) -> str:
+    fp: str = str( tmp_path / "df.json" )
+    DataFrame(
+        fixed = { "run": 1, "site": "x" },
+        shift = { "a": [ 1, 2 ], "b": [ "p", "q" ], "c": [ 0, 0 ] },
+        shiftIndex = { "c": [ "only" ] },
+        schema = { "a": pl.Int64, "b": pl.String }
+    ).write_file( fp )
+    return fp
+#
+
+def test_only_requested_columns( json_fp: str ):
+    df: DataFrame = fromFile( json_fp, columns = [ "run", "c", "a" ] )
+    assert sorted( df.keys() ) == [ "a", "c", "run" ]
+    assert df[1] == { "run": 1, "a": 2, "c": "only" }
+    assert list( df._schema ) == [ "a" ]
+#
+
+def test_missing_column_raises( json_fp: str ):
+    with pytest.raises( KeyError ):
+        fromFile( json_fp, columns = [ "a", "nope" ] )
+    #
+#
+
+def test_shift_only_file( tmp_path ):
+    fp: str = str( tmp_path / "shift.json" )
+    with open( fp, 'w' ) as _file:
+        json.dump( { "a": [ 1, 2 ], "b": [ [ 3 ], { "k": 4 } ] }, _file )
+    #
+    df: DataFrame = fromFile_shift( fp, columns = [ "b" ] )
+    assert df.keys() == [ "b" ]
+    assert df["b"] == [ [ 3 ], { "k": 4 } ]
+#
+
+# -- Binary format
+
+@pytest.fixture
+def wide() -> DataFrame:
+    return DataFrame(
+        fixed = { "run": 7 },
+        shift = {
+            "n": list( range( 1000 ) ),
+            "x": [ i/4 for i in range( 1000 ) ],
+            "s": [ "row{}".format( i ) for i in range( 1000 ) ],
+            "c": [ i % 3 for i in range( 1000 ) ]
+        },
+        shiftIndex = { "c": [ "u", "v", "w" ] },
+        schema = { "n": pl.Int64 },
+        meta = { "note": "binary" }
+    )
+#
+
+@pytest.fixture
+def binary_fp( wide: DataFrame, tmp_path ) -> str:
+    """
+        Path of `wide` written in the binary format
+    """
+    fp: str = str( tmp_path / "df.bin" )
+    wide.write_binary( fp )
+    return fp
+#
+
+def test_binary_round_trip( wide: DataFrame, binary_fp: str ):
+    read: DataFrame = read_binary( binary_fp )
+    assert list( read ) == list( wide )
+    assert read._meta == wide._meta
+    assert isinstance( read._shift["n"], memoryview )
+    assert read["n"] == list( range( 1000 ) ) and type( read["x"] ) is list
+#
+
+def test_binary_projection( binary_fp: str ):
+    read: DataFrame = read_binary( binary_fp, columns = [ "c", "run" ] )
+    assert read.keys() == [ "run", "c" ]
+    assert read[4] == { "run": 7, "c": "v" }
+    with pytest.raises( KeyError ):
+        read_binary( binary_fp, columns = [ "missing" ] )
+    #
+#
+
+def test_binary_rewrite_same_path( wide: DataFrame, binary_fp: str, tmp_path ):
+    read: DataFrame = read_binary( binary_fp )
+    read._meta["note"] = "rewritten"
+    read.write_binary( binary_fp )
+    
+    again: DataFrame = read_binary( binary_fp )
+    assert again._meta["note"] == "rewritten"
+    assert list( again ) == list( wide )
+    # The first read still sees its own data
+    assert list( read ) == list( wide )
+    assert [ path.name for path in tmp_path.iterdir() ] == [ "df.bin" ]
+#
+
+def test_binary_write_after_read_copies( binary_fp: str ):
+    read: DataFrame = read_binary( binary_fp )
+    read[ 0, "n" ] = -1
+    assert read[0]["n"] == -1
+    assert read_binary( binary_fp )[0]["n"] == 0
+#
+
+def test_binary_truncated( binary_fp: str, tmp_path ):
+    data: bytes = ( tmp_path / "df.bin" ).read_bytes()
+    for length in ( 20, len( data )//2 ):
+        ( tmp_path / "cut.bin" ).write_bytes( data[ :length ] )
+        with pytest.raises( ValueError ):
+            read_binary( str( tmp_path / "cut.bin" ) )
+        #
+    #
+    ( tmp_path / "cut.bin" ).write_bytes( b"not a jable file" )
+    with pytest.raises( ValueError ):
+        read_binary( str( tmp_path / "cut.bin" ) )
+    #
+#
+
+# -- Polars
+
+def test_to_polars( cities: DataFrame ):
+    cities.append({ "run": 1, "id": 15, "city": None, "n": None })
+    pldf: pl.DataFrame = cities.to_polars()
+    assert pldf.columns == cities.keys()
+    assert pldf["run"].to_list() == [ 1 ]*6
+    assert pldf["n"].to_list() == [ 1, 1, 2, 2, 3, None ]
+    assert pldf["city"].dtype == pl.Enum( [ "Paris", "Rome" ] )
+    assert pldf["city"].to_list() == [ "Paris", "Rome", "Paris", "Rome", "Paris", None ]
+    assert cities.to_polars( categorical = True )["city"].dtype == pl.Categorical
+#
+
+def test_polars_round_trip_keeps_layout( cities: DataFrame ):
+    cities.append({ "run": 1, "id": 15, "city": None, "n": None })
+    back: DataFrame = from_polars( cities.to_polars() )
+    assert back._fixed == { "run": 1 }
+    assert back._shiftIndex["city"] == [ "Paris", "Rome" ]
+    assert back._shift["city"] == [ 0, 1, 0, 1, 0, None ]
+    assert list( back ) == list( cities )
+#
+
+def test_from_polars_plain_columns():
+    back: DataFrame = from_polars(
+        pl.DataFrame({ "a": [ 1, 2 ], "b": [ "x", "x" ] }),
+        make_fixed = False
+    )
+    assert back._fixed == {}
+    assert back["a"] == [ 1, 2 ] and back["b"] == [ "x", "x" ]
+    assert back._schema["a"] == pl.Int64
+#
+
+# -- Run length columns
+
+def test_runLength_files( tmp_path ):
+    days: list[ int ] = [ i//16 for i in range( 64 ) ]
+    df: DataFrame = consolidate(
+        DataFrame( fixed = {}, shift = { "d": days, "v": list( range( 64 ) ) }, shiftIndex = {} ),
+        run_length = 16
+    )
+    fp: str = str( tmp_path / "df.json" )
+    df.write_file( fp )
+    for kwargs in ( {}, { "stream": True }, { "strict": True } ):
+        read: DataFrame = fromFile( fp, **kwargs )
+        assert read.encodings() == { "d": "shiftRun", "v": "shift" }
+        assert list( read ) == list( df )
+    #
+    assert list( fromFile( fp, columns = [ "d" ] )["d"] ) == days
+    # The binary format stores the rows
+    fp = str( tmp_path / "df.bin" )
+    df.write_binary( fp )
+    assert list( read_binary( fp )["d"] ) == days
+#
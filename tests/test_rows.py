@@ -0,0 +1,235 @@
+"""
+    Adding, removing, reordering and iterating over rows
+"""
+import pytest
+
+import polars as pl
+
+from jable.jyFrame import DataFrame, _COMPACT_THRESHOLD, copyDataFrame, filter, sortedBy
+
+# -- Removal
+
+@pytest.fixture( params = [ False, True ], ids = [ "list", "typed" ] )
+def numbered( request ) -> DataFrame:
+    """
+        Forty rows numbered by "i", stored as lists or typed arrays
+    """
+    n: int = 40
+    return DataFrame(
+        fixed = { "run": 1 },
+        shift = {
+            "i": list( range( n ) ),
+            "c": [ i % 3 for i in range( n ) ]
+        },
+        shiftIndex = { "c": [ "u", "v", "w" ] },
+        schema = { "i": pl.Int64 },
+        typed = request.param
+    )
+#
+
+@pytest.mark.parametrize( "rows", [
+    [ 3 ],
+    [ 5, 1, 5 ],
+    list( range( 0, 40, 3 ) ),
+    list( range( 39, -1, -2 ) ),
+    [ i % 2 == 0 for i in range( 40 ) ],
+    [ False ]*40,
+    [ True ]*40
+] )
+def test_remove( numbered: DataFrame, rows: list ):
+    if rows and isinstance( rows[0], bool ):
+        gone: set[ int ] = { i for i, drop in enumerate( rows ) if drop }
+    #
+    else:
+        gone = set( rows )
+    #
+    numbered.remove( rows )
+    kept: list[ int ] = [ i for i in range( 40 ) if i not in gone ]
+    assert len( numbered ) == len( kept )
+    assert list( numbered["i"] ) == kept
+    assert numbered["c"] == [ "uvw"[ i % 3 ] for i in kept ]
+#
+
+def test_remove_compacting_path_used():
+    assert len( range( 0, 40, 3 ) ) > _COMPACT_THRESHOLD
+#
+
+def test_remove_bad_mask_length( numbered: DataFrame ):
+    with pytest.raises( ValueError ):
+        numbered.remove([ True, False ])
+    #
+#
+
+@pytest.mark.parametrize( "many", [ False, True ], ids = [ "per_row", "compacting" ] )
+def test_remove_indices_checked( numbered: DataFrame, many: bool ):
+    rows: list[ int ] = list( range( 10 ) ) if many else [ 1 ]
+    assert ( len( rows ) > _COMPACT_THRESHOLD ) == many
+    for bad in ( 40, -41 ):
+        with pytest.raises( IndexError ):
+            numbered.remove( rows + [ bad ] )
+        #
+    #
+    assert len( numbered ) == 40
+    # Negative indices count from the end
+    numbered.remove( rows + [ -1 ] )
+    assert list( numbered["i"] ) == [ i for i in range( 39 ) if i not in rows ]
+#
+
+def test_remove_where( numbered: DataFrame ):
+    numbered.remove_where({ "c": "v" })
+    assert set( numbered["c"] ) == { "u", "w" }
+    assert len( numbered ) == 27
+#
+
+# -- Batch appends
+
+def test_extend_from_dict_of_lists( cities: DataFrame ):
+    cities.extend_columns({
+        "id": [ 15, 16 ], "n": [ 2, 3 ], "city": [ "Rome", "Oslo" ], "run": [ 1, 1 ]
+    })
+    assert cities["n"] == [ 1, 1, 2, 2, 3, 2, 3 ]
+    assert cities["city"][ 5: ] == [ "Rome", "Oslo" ]
+    assert cities._shiftIndex["city"] == [ "Paris", "Rome", "Oslo" ]
+#
+
+def test_extend_missing_columns_get_none( cities: DataFrame ):
+    cities.extend_columns({ "n": [ 4 ] })
+    assert cities[5] == { "run": 1, "id": None, "city": None, "n": 4 }
+#
+
+def test_extend_from_frames( cities: DataFrame ):
+    other: DataFrame = DataFrame(
+        fixed = { "run": 1 },
+        shift = { "id": [ 15, 16, 17 ], "n": [ 4, 5, 6 ], "city": [ 0, 1, None ] },
+        shiftIndex = { "city": [ "Oslo", "Paris" ] }
+    )
+    cities.extend_columns( other )
+    cities.extend_columns( pl.DataFrame({ "id": [ 18 ], "n": [ 7 ], "city": [ "Oslo" ] }) )
+    assert cities["city"][ 5: ] == [ "Oslo", "Paris", None, "Oslo" ]
+    assert cities._shiftIndex["city"] == [ "Paris", "Rome", "Oslo" ]
+    assert cities["n"][ 5: ] == [ 4, 5, 6, 7 ]
+#
+
+def test_extend_checked_before_changing( cities: DataFrame ):
+    before: list[ dict ] = list( cities )
+    with pytest.raises( ValueError ):
+        cities.extend_columns({ "n": [ 2, 3 ], "city": [ "Rome" ] })
+    #
+    with pytest.raises( ValueError ):
+        cities.extend_columns({ "n": [ 2 ], "run": [ 2 ] })
+    #
+    with pytest.raises( ValueError ):
+        cities.extend_columns({ "n": [ 2 ], "other": [ 2 ] }, strict = True )
+    #
+    assert list( cities ) == before
+#
+
+def test_extend_rows_same_as_append( cities: DataFrame ):
+    rows: list[ dict ] = [
+        { "run": 1, "id": 20 + i, "n": i, "city": [ "Rome", "Oslo", None ][ i % 3 ] }
+        for i in range( 10 )
+    ]
+    appended: DataFrame = copyDataFrame( cities )
+    cities.extend( rows )
+    for row in rows:
+        appended.append( row )
+    #
+    assert list( cities ) == list( appended )
+    assert cities._shiftIndex == appended._shiftIndex
+#
+
+# -- Sorting
+
+@pytest.fixture
+def unsorted() -> DataFrame:
+    return DataFrame(
+        fixed = { "f": 1 },
+        shift = {
+            "a": [ 3, None, 1, 3 ],
+            "b": [ "x", "y", "z", "w" ],
+            "c": [ 0, 1, 0, 1 ]
+        },
+        shiftIndex = { "c": [ "q", "p" ] },
+        meta = { "user": True }
+    )
+#
+
+def test_sorted_by_several_columns( unsorted: DataFrame ):
+    new_df: DataFrame = sortedBy( unsorted, [ "a", "b" ] )
+    assert list( new_df["a"] ) == [ 1, 3, 3, None ]
+    assert list( new_df["b"] ) == [ "z", "w", "x", "y" ]
+    assert new_df._fixed == { "f": 1 }
+#
+
+def test_sorted_descending_and_nulls_first( unsorted: DataFrame ):
+    new_df: DataFrame = sortedBy( unsorted, "a", descending = True, nulls_last = False )
+    assert list( new_df["a"] ) == [ None, 3, 3, 1 ]
+    # Stable, so the two 3s keep their order
+    assert list( new_df["b"] ) == [ "y", "x", "w", "z" ]
+    with pytest.raises( ValueError ):
+        sortedBy( unsorted, [ "a", "b" ], descending = [ True ] )
+    #
+    with pytest.raises( KeyError ):
+        sortedBy( unsorted, "missing" )
+    #
+#
+
+def test_sorted_shiftIndex_by_value( unsorted: DataFrame ):
+    new_df: DataFrame = sortedBy( unsorted, "c" )
+    assert list( new_df["c"] ) == [ "p", "p", "q", "q" ]
+    assert list( new_df["b"] ) == [ "y", "w", "x", "z" ]
+#
+
+def test_sorted_declared_without_meta( unsorted: DataFrame ):
+    assert sortedBy( unsorted, "b" ).get_sortedBy() == "b"
+    # Nulls or descending order are not declared
+    assert sortedBy( unsorted, "a" ).get_sortedBy() is None
+    assert sortedBy( unsorted, "b", descending = True ).get_sortedBy() is None
+    assert sortedBy( unsorted, "b" )._meta == { "user": True }
+    assert list( unsorted["b"] ) == [ "x", "y", "z", "w" ]
+#
+
+# -- Iteration
+
+def test_iter_tuples( cities: DataFrame ):
+    assert list( cities.iter_tuples([ "city", "run" ]) )[ :2 ] == [ ( "Paris", 1 ), ( "Rome", 1 ) ]
+    assert list( cities.iter_tuples() ) == [
+        tuple( row[ key ] for key in cities.keys() ) for row in cities
+    ]
+    assert list( cities.iter_tuples([]) ) == [ () ]*5
+    with pytest.raises( KeyError ):
+        list( cities.iter_tuples([ "missing" ]) )
+    #
+#
+
+def test_iter_rowProxy( cities: DataFrame ):
+    kept: list[ dict ] = []
+    for proxy in cities.iter_rowProxy():
+        assert proxy["city"] == cities[ proxy.index ]["city"]
+        kept.append( dict( proxy ) )
+    #
+    assert kept == list( cities )
+    with pytest.raises( KeyError ):
+        next( cities.iter_rowProxy() )["missing"]
+    #
+#
+
+def test_iter_batches( cities: DataFrame ):
+    batches: list[ DataFrame ] = list( cities.iter_batches( 2 ) )
+    assert [ len( batch ) for batch in batches ] == [ 2, 2, 1 ]
+    assert list( batches[2] ) == [ cities[4] ]
+    with pytest.raises( ValueError ):
+        next( cities.iter_batches( 0 ) )
+    #
+#
+
+def test_callable_filter_gets_own_dicts( cities: DataFrame ):
+    seen: list[ dict ] = []
+    def keep( row: dict ) -> bool:
+        seen.append( row )
+        return row["city"] == "Paris"
+    #
+    assert list( filter( cities, keep )["id"] ) == [ 10, 12, 14 ]
+    assert all( type( row ) is dict for row in seen )
+    assert seen == list( cities )
+#
@@ -0,0 +1,281 @@
+"""
+    Grouped statistics: secondOrderStats, group_by().agg(), merged and live stats
+"""
+import pytest
+
+import polars as pl
+
+from jable.jyFrame import (
+    DataFrame,
+    GroupBy,
+    LiveSecondOrderStats,
+    fromSecondOrderStats,
+    merge_secondOrderStats,
+    secondOrderStats,
+    secondOrderStats_parallel
+)
+
+@pytest.fixture
+def measured() -> DataFrame:
+    """
+        Groups in a fixed, a shiftIndex and a plain column, with int and float measurements
+    """
+    return DataFrame(
+        fixed = { "run": 1 },
+        shift = {
+            "g": [ 0, 1, 0, 1, 0 ],
+            "h": [ "x", "x", "y", "x", "x" ],
+            "n": [ 1, 2, 3, 4, 5 ],
+            "x": [ 0.5, 1.5, 2.5, 3.5, 4.5 ]
+        },
+        shiftIndex = { "g": [ "a", "b" ] },
+        schema = { "n": pl.Int64, "x": pl.Float64 }
+    )
+#
+
+@pytest.fixture
+def with_gaps( measured: DataFrame ) -> DataFrame:
+    """
+        `measured` with a last row of `None` measurements
+    """
+    measured.append({ "run": 1, "g": "b", "h": None, "n": None, "x": None })
+    return measured
+#
+
+def _by_rows( df: DataFrame, groups: list[ str ], numerics: list[ str ] ) -> dict:
+    """
+        secondOrderStats, summed row by row, leaving out rows with `None`
+    """
+    summary: dict = {}
+    for row in df:
+        if any( row[ col ] is None for col in numerics ):
+            continue
+        #
+        key: tuple = tuple( row[ col ] for col in groups )
+        cols: dict = summary.setdefault( key, { col: [ 0, 0, 0 ] for col in numerics } )
+        for col in numerics:
+            cols[ col ][0] += 1
+            cols[ col ][1] += row[ col ]
+            cols[ col ][2] += row[ col ]**2
+        #
+    #
+    return summary
+#
+
+# -- secondOrderStats
+
+def test_stats_groups_in_first_appearance_order( measured: DataFrame ):
+    stats: dict = secondOrderStats( measured, [ "g", "run", "h" ], [ "n", "x" ] )
+    assert stats == _by_rows( measured, [ "g", "run", "h" ], [ "n", "x" ] )
+    assert list( stats ) == [ ( "a", 1, "x" ), ( "b", 1, "x" ), ( "a", 1, "y" ) ]
+    assert stats[( "a", 1, "x" )]["n"] == [ 2, 6, 26 ]
+#
+
+def test_stats_typed_columns_same_result( measured: DataFrame ):
+    untyped: dict = secondOrderStats( measured, [ "g" ], [ "n", "x" ] )
+    measured.set_typedStorage( True )
+    stats: dict = secondOrderStats( measured, [ "g" ], [ "n", "x" ] )
+    assert stats == untyped
+    assert stats[( "b", )] == { "n": [ 2, 6, 20 ], "x": [ 2, 5.0, 14.5 ] }
+    assert type( stats[( "a", )]["n"][1] ) is int
+#
+
+def test_fromSecondOrderStats( measured: DataFrame ):
+    new_df: DataFrame = fromSecondOrderStats( secondOrderStats( measured, [ "g" ], [ "n" ] ), [ "g" ] )
+    assert list( new_df["g"] ) == [ "a", "b" ]
+    assert list( new_df["n"] ) == [ "3.000 (0.943)", "3.000 (0.707)" ]
+#
+
+# -- group_by().agg()
+
+def test_agg_functions( with_gaps: DataFrame ):
+    result: DataFrame = with_gaps.group_by( "g" ).agg(
+        "count",
+        ( "n", "sum" ), ( "n", "mean" ), ( "n", "min" ), ( "n", "max" ), ( "n", "var" ),
+        ( "h", "first" ), ( "h", "last" ), ( "h", "n_unique" )
+    )
+    assert result.keys() == [
+        "g", "count", "n_sum", "n_mean", "n_min", "n_max", "n_var",
+        "h_first", "h_last", "h_n_unique"
+    ]
+    assert result._shiftIndex == { "g": [ "a", "b" ] }
+    assert list( result ) == [
+        {
+            "g": "a", "count": 3, "n_sum": 9, "n_mean": 3.0, "n_min": 1, "n_max": 5,
+            "n_var": 4.0, "h_first": "x", "h_last": "x", "h_n_unique": 2
+        },
+        {
+            "g": "b", "count": 3, "n_sum": 6, "n_mean": 3.0, "n_min": 2, "n_max": 4,
+            "n_var": 2.0, "h_first": "x", "h_last": None, "h_n_unique": 1
+        }
+    ]
+#
+
+def test_agg_variance_needs_two_values( with_gaps: DataFrame ):
+    result: DataFrame = with_gaps.group_by( "h" ).agg(( "n", "var" ))
+    assert list( result["h"] ) == [ "x", "y", None ]
+    assert list( result["n_var"] )[ 1: ] == [ None, None ]
+#
+
+def test_agg_named_and_reused( with_gaps: DataFrame ):
+    grouped: GroupBy = with_gaps.group_by([ "g" ])
+    assert len( grouped ) == 2
+    assert list( grouped.agg( total = ( "n", "sum" ) )["total"] ) == [ 9, 6 ]
+    assert list( grouped.agg( rows = "count" )["rows"] ) == [ 3, 3 ]
+#
+
+def test_agg_one_group_is_fixed( with_gaps: DataFrame ):
+    result: DataFrame = with_gaps.group_by( "run" ).agg( "count", ( "n", "max" ) )
+    assert len( result ) == 1
+    assert result._fixed == { "run": 1 }
+    assert result[0] == { "run": 1, "count": 6, "n_max": 5 }
+#
+
+def test_agg_bad_specs( measured: DataFrame ):
+    grouped: GroupBy = measured.group_by( "g" )
+    with pytest.raises( ValueError ):
+        grouped.agg(( "n", "median" ))
+    #
+    with pytest.raises( KeyError ):
+        grouped.agg(( "missing", "sum" ))
+    #
+    for spec in [ "sum", ( "n", ), ( "n", "sum", "x" ), 3 ]:
+        with pytest.raises( ValueError, match = "Bad spec" ):
+            grouped.agg( total = spec )
+        #
+        with pytest.raises( ValueError, match = "Bad spec" ):
+            grouped.agg( spec )
+        #
+    #/for spec in [ ... ]
+#
+
+# -- Merged and parallel stats
+
+def test_merge_matches_one_call( measured: DataFrame ):
+    parts: list[ dict ] = [
+        secondOrderStats( measured[ start:start + 2 ], [ "g" ], [ "n" ] ) for start in range( 0, 5, 2 )
+    ]
+    merged: dict = merge_secondOrderStats( parts )
+    assert merged == secondOrderStats( measured, [ "g" ], [ "n" ] )
+    assert list( merged ) == [ ( "a", ), ( "b", ) ]
+    # The parts are left as they were
+    assert parts[0][( "a", )]["n"] == [ 1, 1, 1 ]
+#
+
+@pytest.mark.parametrize( "workers", [ 1, 2 ] )
+def test_parallel_frame( measured: DataFrame, workers: int ):
+    assert secondOrderStats_parallel(
+        measured, [ "g", "run" ], [ "n" ], workers = workers
+    ) == secondOrderStats( measured, [ "g", "run" ], [ "n" ] )
+#
+
+@pytest.mark.parametrize( "workers", [ 1, 2 ] )
+def test_parallel_files( measured: DataFrame, workers: int, tmp_path ):
+    paths: list[ str ] = [ str( tmp_path / "part0.bin" ), str( tmp_path / "part1.json" ) ]
+    measured[0:2].write_binary( paths[0] )
+    measured[2:5].write_file( paths[1] )
+    assert secondOrderStats_parallel(
+        paths, [ "g" ], [ "n" ], workers = workers
+    ) == secondOrderStats( measured, [ "g" ], [ "n" ] )
+#
+
+@pytest.fixture
+def cancelling() -> DataFrame:
+    """
+        Floats whose sum, added in halves, is 0.0 instead of 2.0
+    """
+    return DataFrame(
+        fixed = { "run": 1 },
+        shift = {
+            "n": [ 1, 2, 3, 4, 5, 6 ],
+            "x": [ 1e16, 1.0, 1.0, -1e16, 1.0, 1.0 ]
+        },
+        shiftIndex = {},
+        schema = { "n": pl.Int64, "x": pl.Float64 }
+    )
+#
+
+@pytest.mark.parametrize( "typed", [ False, True ] )
+@pytest.mark.parametrize( "workers", [ 1, 2 ] )
+def test_parallel_floats_exact( cancelling: DataFrame, typed: bool, workers: int ):
+    cancelling.set_typedStorage( typed )
+    serial: dict = secondOrderStats( cancelling, [ "run" ], [ "x", "n" ] )
+    assert serial[( 1, )]["x"][1] == 2.0
+    parallel: dict = secondOrderStats_parallel(
+        cancelling, [ "run" ], [ "x", "n" ], workers = workers
+    )
+    assert parallel == serial and list( parallel[( 1, )] ) == [ "x", "n" ]
+#
+
+def test_parallel_files_floats_exact( cancelling: DataFrame, tmp_path ):
+    paths: list[ str ] = [ str( tmp_path / "part0.bin" ), str( tmp_path / "part1.json" ) ]
+    cancelling[0:3].write_binary( paths[0] )
+    cancelling[3:6].write_file( paths[1] )
+    assert secondOrderStats_parallel(
+        paths, [ "run" ], [ "n", "x" ], workers = 2
+    ) == secondOrderStats( cancelling, [ "run" ], [ "n", "x" ] )
+#
+
+def test_merge_floats_in_parts( cancelling: DataFrame ):
+    parts: list[ dict ] = [
+        secondOrderStats( cancelling[ start:start + 3 ], [ "run" ], [ "x" ] ) for start in [ 0, 3 ]
+    ]
+    with pytest.raises( ValueError, match = "Float sums" ):
+        merge_secondOrderStats( parts )
+    #
+    # Groups with floats in only one part merge as they are
+    by_n: list[ dict ] = [
+        secondOrderStats( cancelling[ start:start + 3 ], [ "n" ], [ "x" ] ) for start in [ 0, 3 ]
+    ]
+    assert merge_secondOrderStats( by_n ) == secondOrderStats( cancelling, [ "n" ], [ "x" ] )
+#
+
+# -- Live stats
+
+def _check_live( df: DataFrame, live: LiveSecondOrderStats ) -> None:
+    assert live.value() == _by_rows( df, [ "g", "run" ], [ "n" ] )
+#
+
+def test_live_append_and_set( measured: DataFrame ):
+    live: LiveSecondOrderStats = measured.track_secondOrderStats([ "g", "run" ], [ "n" ])
+    measured.append({ "run": 1, "g": "c", "h": "x", "n": 4, "x": 0.0 })
+    _check_live( measured, live )
+    measured[ 0, "n" ] = 10
+    _check_live( measured, live )
+    measured[ 1, "g" ] = "a"
+    _check_live( measured, live )
+    # The last row of "b" moves to "a", so "b" is dropped
+    measured[ 3, "g" ] = "a"
+    _check_live( measured, live )
+    assert ( "b", 1 ) not in live.value()
+#
+
+def test_live_insert_and_remove( measured: DataFrame ):
+    live: LiveSecondOrderStats = measured.track_secondOrderStats([ "g", "run" ], [ "n" ])
+    measured.insert( 0, { "run": 1, "g": "b", "h": "x", "n": None, "x": None })
+    _check_live( measured, live )
+    del measured[2]
+    _check_live( measured, live )
+    measured.remove([ 0 ])
+    _check_live( measured, live )
+    measured.remove_where({ "g": "a" })
+    _check_live( measured, live )
+    assert list( live.value() ) == [ ( "b", 1 ) ]
+#
+
+def test_live_fixed_change_rebuilds( measured: DataFrame ):
+    live: LiveSecondOrderStats = measured.track_secondOrderStats([ "g", "run" ], [ "n" ])
+    measured[ 0, "run" ] = 2
+    assert list( live.value() ) == [ ( "a", 2 ), ( "b", 2 ) ]
+    _check_live( measured, live )
+#
+
+def test_live_untrack( measured: DataFrame ):
+    live: LiveSecondOrderStats = measured.track_secondOrderStats([ "g", "run" ], [ "n" ])
+    measured.untrack_secondOrderStats( live )
+    measured.append({ "run": 1, "g": "a", "h": "x", "n": 5, "x": 0.0 })
+    assert live.value()[( "a", 1 )]["n"] == [ 3, 9, 35 ]
+    with pytest.raises( KeyError ):
+        measured.track_secondOrderStats([ "missing" ], [ "n" ])
+    #
+#
@@ -0,0 +1,276 @@
+"""
+    How columns are held: `shiftIndex` codes, typed arrays, views and copies
+"""
+from array import array
+
+import pytest
+
+import polars as pl
+
+from jable.jyFrame import (
+    DataFrame,
+    RunLengthColumn,
+    _ColumnView,
+    _runLength_column,
+    consolidate,
+    copyDataFrame,
+    filter,
+    fromFile,
+    likeDataFrame
+)
+
+# -- shiftIndex codes
+
+def test_append_reuses_codes( cities: DataFrame ):
+    cities.append({ "run": 1, "id": 15, "city": "Rome", "n": 4 })
+    cities.append({ "run": 1, "id": 16, "city": "Oslo", "n": 5 })
+    assert cities._shift["city"] == [ 0, 1, 0, 1, 0, 1, 2 ]
+    assert cities._shiftIndex["city"] == [ "Paris", "Rome", "Oslo" ]
+    assert cities._shiftIndexMap["city"] == { "Paris": 0, "Rome": 1, "Oslo": 2 }
+    assert cities["city"] == [ "Paris", "Rome", "Paris", "Rome", "Paris", "Rome", "Oslo" ]
+#
+
+def test_set_keeps_map_in_step( cities: DataFrame ):
+    cities[ 1, "city" ] = "Oslo"
+    assert cities[1]["city"] == "Oslo"
+    assert cities._shiftIndexMap["city"]["Oslo"] == cities._shiftIndex["city"].index( "Oslo" )
+    assert cities.get_matchingIndices({ "city": "Oslo" }) == [ 1 ]
+#
+
+def test_unhashable_values():
+    df: DataFrame = DataFrame(
+        fixed = {},
+        shift = { "tags": [ 0 ] },
+        shiftIndex = { "tags": [ [ "a" ] ] }
+    )
+    df.append({ "tags": [ "a" ] })
+    df.append({ "tags": [ "b" ] })
+    assert df._shift["tags"] == [ 0, 0, 1 ]
+    assert df["tags"] == [ [ "a" ], [ "a" ], [ "b" ] ]
+#
+
+def test_none_is_not_coded( cities: DataFrame ):
+    cities.append({ "run": 1, "id": 15, "city": None, "n": 4 })
+    assert cities[5]["city"] is None
+    assert None not in cities._shiftIndex["city"]
+#
+
+# -- Typed storage
+
+@pytest.fixture
+def typed() -> DataFrame:
+    return DataFrame(
+        fixed = {},
+        shift = {
+            "x": [ 1.5, 2.5 ],
+            "n": [ 1, 2 ],
+            "s": [ "a", "b" ],
+            "c": [ 0, 1 ]
+        },
+        shiftIndex = { "c": [ "u", "v" ] },
+        schema = { "x": pl.Float64, "n": pl.Int64, "s": pl.String },
+        typed = True
+    )
+#
+
+def test_numeric_columns_are_arrays( typed: DataFrame ):
+    assert isinstance( typed._shift["x"], array )
+    assert isinstance( typed._shift["n"], array )
+    assert isinstance( typed._shift["c"], array )
+    assert isinstance( typed._shift["s"], list )
+    assert typed[1] == { "x": 2.5, "n": 2, "s": "b", "c": "v" }
+#
+
+def test_value_that_does_not_fit_falls_back_to_list( typed: DataFrame ):
+    typed.append({ "x": None, "n": 3, "s": "c", "c": "u" })
+    assert isinstance( typed._shift["x"], list )
+    assert isinstance( typed._shift["n"], array )
+    assert typed["x"] == [ 1.5, 2.5, None ]
+#
+
+def test_untyped_round_trip( typed: DataFrame, tmp_path ):
+    typed.set_typedStorage( False )
+    assert all( isinstance( column, list ) for column in typed._shift.values() )
+    
+    typed.write_file( str( tmp_path / "df.json" ) )
+    read: DataFrame = fromFile( str( tmp_path / "df.json" ), typed = True )
+    assert isinstance( read._shift["x"], array )
+    assert list( read ) == list( typed )
+#
+
+def test_column_is_a_list( typed: DataFrame ):
+    assert typed["x"] == [ 1.5, 2.5 ] and typed["n"] == [ 1, 2 ]
+    assert all( type( typed[ col ] ) is list for col in typed.keys() )
+    # A new list, so the typed storage is left alone
+    typed["n"][0] = 9
+    assert typed[0]["n"] == 1 and isinstance( typed._shift["n"], array )
+#
+
+def test_list_column_given_as_is( cities: DataFrame ):
+    cities["n"][0] = 9
+    assert cities[0]["n"] == 9
+#
+
+# -- Views
+
+def test_view_rows_not_copied( cities: DataFrame ):
+    v: DataFrame = cities[1:3]
+    assert isinstance( v._shift["id"], _ColumnView )
+    assert len( v ) == 2 and v[0] == cities[1]
+    # Reading a column leaves the view as it is
+    assert v["id"] == [ 11, 12 ]
+    assert isinstance( v._shift["id"], _ColumnView )
+    # Views of views collapse onto the base column
+    vv: DataFrame = cities[1:5][1:]
+    assert vv._shift["id"].base is cities._shift["id"]
+    assert list( vv["n"] ) == [ 2, 2, 3 ]
+#
+
+def test_view_writes_stay_in_view( cities: DataFrame ):
+    v: DataFrame = cities[1:3]
+    v[ 0, "id" ] = 99
+    v[ 1, "n" ] = 9
+    assert list( v["id"] ) == [ 99, 12 ]
+    assert list( v["n"] ) == [ 1, 9 ]
+    assert list( cities["id"] ) == [ 10, 11, 12, 13, 14 ]
+    assert list( cities["n"] ) == [ 1, 1, 2, 2, 3 ]
+#
+
+def test_view_parent_writes_stay_in_parent( cities: DataFrame ):
+    v: DataFrame = cities[[ 0, 3 ], [ "n" ]]
+    c: DataFrame = cities[[ "id" ]]
+    cities[ 0, "id" ] = -1
+    cities[ 0, "n" ] = 9
+    assert list( v["n"] ) == [ 1, 2 ]
+    assert list( c["id"] ) == [ 10, 11, 12, 13, 14 ]
+    c["id"].append( 15 )
+    assert list( cities["id"] ) == [ -1, 11, 12, 13, 14 ]
+#
+
+def test_view_parent_writes_in_place( cities: DataFrame ):
+    column: list = cities._shift["id"]
+    cities[1:3]
+    cities[[ "id" ]]
+    assert not cities._shared
+    # No live views, so nothing is copied
+    cities[ 0, "id" ] = -1
+    assert cities._shift["id"] is column
+    # A live view copies only its own rows
+    v: DataFrame = cities[1:3]
+    vv: DataFrame = v[1:]
+    cities[ 1, "id" ] = -2
+    assert cities._shift["id"] is column
+    assert v._shift["id"].base == [ 11, 12 ] and list( vv["id"] ) == [ 12 ]
+#
+
+def test_view_parent_column_changed( cities: DataFrame ):
+    v: DataFrame = cities[0:2]
+    cities["n"][0] = 9
+    del cities[1]
+    assert list( v["n"] ) == [ 1, 1 ] and list( v["id"] ) == [ 10, 11 ]
+#
+
+def test_view_materialize( cities: DataFrame ):
+    v: DataFrame = cities[0:2]
+    v.materialize()
+    assert v._shift == { "id": [ 10, 11 ], "city": [ 0, 1 ], "n": [ 1, 1 ] }
+    assert not v._shared
+    cities[[ "id" ]].materialize()
+    cities[ 0, "id" ] = 0
+    assert cities._shift["id"] == [ 0, 11, 12, 13, 14 ]
+#
+
+# -- Copies
+
+def test_copy_independent_both_ways( cities: DataFrame ):
+    cities._meta["m"] = [ 1 ]
+    c: DataFrame = copyDataFrame( cities )
+    assert c.as_dict() == cities.as_dict()
+    cities[ 0, "n" ] = 9
+    c["n"][1] = 7
+    assert list( cities["n"] ) == [ 9, 1, 2, 2, 3 ]
+    assert list( c["n"] ) == [ 1, 7, 2, 2, 3 ]
+    c._meta["m"].append( 2 )
+    c._fixed["run"] = 2
+    assert cities._meta == { "m": [ 1 ] } and cities._fixed == { "run": 1 }
+#
+
+def test_copy_shares_shiftIndex_until_append( cities: DataFrame ):
+    c: DataFrame = copyDataFrame( cities )
+    c.append({ "run": 1, "id": 15, "city": "Oslo", "n": 4 })
+    assert c["city"][ -1 ] == "Oslo"
+    assert len( cities ) == 5
+    assert cities._shiftIndex == { "city": [ "Paris", "Rome" ] }
+    assert cities._shiftIndexMap == { "city": { "Paris": 0, "Rome": 1 } }
+#
+
+def test_copy_keeps_indexes( cities: DataFrame ):
+    cities.create_index( "n" )
+    c: DataFrame = copyDataFrame( cities )
+    c.append({ "run": 1, "id": 15, "city": "Paris", "n": 3 })
+    assert c.get_matchingIndices({ "n": 3 }) == [ 4, 5 ]
+    assert cities.get_matchingIndices({ "n": 3 }) == [ 4 ]
+#
+
+def test_like_is_empty_and_separate( cities: DataFrame ):
+    like: DataFrame = likeDataFrame( cities )
+    assert len( like ) == 0
+    assert set( like._shift ) == { "id", "city", "n" } and like._shiftIndex == { "city": [] }
+    assert like._meta == cities._meta and like._meta is not cities._meta
+    like.append({ "run": 1, "id": 15, "city": "Oslo", "n": 4 })
+    assert list( like["city"] ) == [ "Oslo" ]
+    assert cities._shiftIndex == { "city": [ "Paris", "Rome" ] }
+#
+
+# -- Run length columns
+
+DAYS: list[ int ] = [ i//16 for i in range( 64 ) ]
+
+@pytest.fixture
+def daily() -> DataFrame:
+    """
+        Runs of 16 rows for each day, run length encoded
+    """
+    return consolidate(
+        DataFrame( fixed = {}, shift = { "d": list( DAYS ), "v": list( range( 64 ) ) }, shiftIndex = {} ),
+        run_length = 16
+    )
+#
+
+def test_runLength_column():
+    column: RunLengthColumn = _runLength_column([ "a", "a", "b", "a" ])
+    assert column.values == [ "a", "b", "a" ] and column.ends == [ 2, 3, 4 ]
+    assert column.lengths() == [ 2, 1, 1 ]
+    assert list( column ) == [ "a", "a", "b", "a" ] and len( column ) == 4
+    assert column[-1] == "a" and column.index( "a", 2 ) == 3
+    assert list( column[1:3] ) == [ "a", "b" ] and column[::2] == [ "a", "b" ]
+    assert _runLength_column([ 1, 2, 3 ], limit = 2 ) is None
+    with pytest.raises( IndexError ):
+        column[4]
+    #
+    with pytest.raises( ValueError ):
+        column.index( "c" )
+    #
+#
+
+def test_runLength_reads( daily: DataFrame ):
+    assert isinstance( daily._shift["d"], RunLengthColumn )
+    assert daily[17] == { "d": 1, "v": 17 }
+    assert list( daily["d"] ) == DAYS
+    assert list( filter( daily, { "d": 2 } )["v"] ) == list( range( 32, 48 ) )
+    assert daily.get_matchingIndices({ "d": 3 }) == list( range( 48, 64 ) )
+    # Contiguous rows stay run length encoded
+    assert isinstance( daily[2:20]._shift["d"], RunLengthColumn )
+    assert daily.series_for_col( "d" ).to_list() == DAYS
+#
+
+def test_runLength_writes_expand( daily: DataFrame ):
+    # What df[ col ] gives is a copy
+    daily["d"][0] = 9
+    assert daily[0]["d"] == 0
+    daily[ 0, "d" ] = 9
+    assert type( daily._shift["d"] ) is list and daily.encodings()["d"] == "shift"
+    assert list( daily["d"] ) == [ 9 ] + DAYS[1:]
+    daily.append({ "d": 3, "v": 64 })
+    assert list( daily["d"] ) == [ 9 ] + DAYS[1:] + [ 3 ]
+#